@@ -0,0 +1,107 @@
+"""Compare load time, RSS and lookup speed of the compiled catalog against a dict-based provider.
+
+Run with ``python benchmarks/catalog.py [--keys N] [--locales N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from fixtures import LOCALES
+
+from kumo.i18n.catalog import CatalogLocalizationProvider, compile_catalog
+from kumo.i18n.types import Localized
+
+
+class DictLocalizationProvider:
+    def __init__(self, source: Path) -> None:
+        self.catalogs: dict[str, dict[str, str]] = {
+            path.stem: json.loads(path.read_text(encoding="utf-8")) for path in source.glob("*.json")
+        }
+
+    def localize(self, value: Localized) -> tuple[Mapping[str, str], str]:
+        return {
+            locale: catalog[value.key] for locale, catalog in self.catalogs.items() if value.key in catalog
+        }, value.fallback
+
+
+def rss_kib() -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    return 0
+
+
+def measure(kind: str, source: Path, compiled: Path, keys: int) -> dict[str, float]:
+    before = rss_kib()
+    started = time.perf_counter()
+    provider = DictLocalizationProvider(source) if kind == "dict" else CatalogLocalizationProvider(compiled)
+    loaded = time.perf_counter()
+    lookups = [Localized(f"section{index % 50}.key{index}", fallback="-") for index in range(0, keys, 7)]
+    for value in lookups:
+        provider.localize(value)
+    finished = time.perf_counter()
+    return {
+        "load_ms": (loaded - started) * 1e3,
+        "rss_kib": rss_kib() - before,
+        "lookup_us": (finished - loaded) / len(lookups) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--locales", type=int, default=len(LOCALES))
+    parser.add_argument("--measure", choices=("dict", "catalog"))
+    parser.add_argument("--source", type=Path)
+    parser.add_argument("--compiled", type=Path)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.source, args.compiled, args.keys)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory, "source")
+        source.mkdir()
+        for locale in LOCALES[: args.locales]:
+            catalog: dict[str, dict[str, str]] = {}
+            for index in range(args.keys):
+                catalog.setdefault(f"section{index % 50}", {})[f"key{index}"] = f"{locale} translation {index}"
+            (source / f"{locale}.json").write_text(json.dumps(catalog), encoding="utf-8")
+        flat = Path(directory, "flat")
+        flat.mkdir()
+        for path in source.iterdir():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            flattened = {f"{section}.{key}": value for section, items in data.items() for key, value in items.items()}
+            (flat / path.name).write_text(json.dumps(flattened), encoding="utf-8")
+
+        compiled = Path(directory, "catalog.bin")
+        started = time.perf_counter()
+        compile_catalog(source, compiled)
+        print(f"compiled {args.keys} keys x {args.locales} locales in {time.perf_counter() - started:.2f}s")
+
+        for kind in ("dict", "catalog"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--measure", kind, "--source", str(flat), "--compiled", str(compiled),
+                 "--keys", str(args.keys)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{kind:>8}: load {result['load_ms']:8.1f} ms, rss +{result['rss_kib'] / 1024:7.1f} MiB, "
+                f"lookup {result['lookup_us']:6.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
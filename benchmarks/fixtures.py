@@ -0,0 +1,242 @@
+"""Synthetic bots, command trees and interactions shared by the benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from hikari.commands import CommandType, OptionType
+from hikari.events import InteractionCreateEvent
+from hikari.interactions import CommandInteraction
+from hikari.snowflakes import Snowflake
+
+from kumo.commands.base import CommandGroup, SubCommand, SubCommandGroup
+from kumo.commands.decorators import message_command, slash_command, user_command
+from kumo.commands.metadata import SlashCommandMetadata, SubCommandMetadata
+from kumo.commands.options import Choice, Option
+from kumo.components.base import Component
+from kumo.i18n.types import Localized
+from kumo.impl.gateway_bot import GatewayBot
+from kumo.testing import build_command_payload, build_component_payload
+
+if TYPE_CHECKING:
+    from kumo.commands.types import CommandT
+
+LOCALES: tuple[str, ...] = (
+    "bg", "cs", "da", "de", "el", "en-GB", "en-US", "es-ES", "es-419", "fi", "fr", "hi", "hr", "hu", "id", "it",
+    "ja", "ko", "lt", "nl", "no", "pl", "pt-BR", "ro", "ru", "sv-SE", "th", "tr", "uk", "vi", "zh-CN", "zh-TW",
+)
+SHAPES: tuple[str, ...] = ("slash", "user", "message", "sub", "group")
+FIRST_ID: int = 1000
+GUILD_ID: int = 42
+USER_ID: int = 7
+MESSAGE_ID: int = 8
+
+
+class DictLocalizationProvider:
+    """Translates every key into every locale, like a fully translated bot would."""
+
+    def __init__(self, locales: tuple[str, ...] = LOCALES) -> None:
+        self.locales: tuple[str, ...] = locales
+
+    def localize(self, value: Localized) -> tuple[Mapping[str, str], str]:
+        return {locale: f"{value.key}-{locale}"[:32] for locale in self.locales}, value.fallback
+
+
+async def noop(self: object, context: object, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    pass
+
+
+class NullSpan:
+    """Span which records nothing, for measuring the overhead of the tracing hooks alone."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: object) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self, end_time: int | None = None) -> None:
+        pass
+
+
+class NullTracer:
+    def start_span(self, name: str, **kwargs: Any) -> NullSpan:  # noqa: ANN401
+        return NullSpan()
+
+
+def localized(key: str) -> Localized:
+    return Localized(key, fallback=key[:32])
+
+
+def make_options(prefix: str) -> list[Option]:
+    return [
+        Option(type=OptionType.STRING, name="text", description=localized(f"{prefix}.text"), is_required=True),
+        Option(
+            type=OptionType.INTEGER,
+            name="count",
+            description=localized(f"{prefix}.count"),
+            choices=[Choice(name=str(value), value=value, display_name=localized(f"choice.{value}")) for value in range(3)],
+            is_required=False,
+        ),
+        Option(type=OptionType.USER, name="user", description=localized(f"{prefix}.user"), is_required=False),
+    ]
+
+
+def make_command(index: int) -> CommandT:
+    """Build the command of the given index, the shape cycles through slash, user, message, sub and group."""
+    name = f"command{index}"
+    shape = SHAPES[index % len(SHAPES)]
+    obj = type(name, (), {"callback": noop})
+    if shape == "slash":
+        return slash_command(name, description=localized(f"{name}.description"), options=make_options(name))(obj)
+    if shape == "user":
+        return user_command(name, display_name=localized(f"{name}.name"))(obj)
+    if shape == "message":
+        return message_command(name, display_name=localized(f"{name}.name"))(obj)
+
+    group = CommandGroup(obj, SlashCommandMetadata(name=name, description=localized(f"{name}.description")))
+    for sub_index in range(3):
+        group.add_command(
+            SubCommand(
+                noop,
+                SubCommandMetadata(
+                    name=f"sub{sub_index}", description=localized(f"{name}.sub{sub_index}"), options=make_options(name)
+                ),
+            )
+        )
+    if shape == "group":
+        sub_group = SubCommandGroup(SubCommandMetadata(name="group", description=localized(f"{name}.group")))
+        for sub_index in range(3):
+            sub_group.add_command(
+                SubCommand(
+                    noop,
+                    SubCommandMetadata(
+                        name=f"sub{sub_index}",
+                        description=localized(f"{name}.group.sub{sub_index}"),
+                        options=make_options(name),
+                    ),
+                )
+            )
+        group.add_command(sub_group)
+    return group
+
+
+def make_tree(size: int) -> list[CommandT]:
+    return [make_command(index) for index in range(size)]
+
+
+def make_bot(size: int = 100, *, locales: tuple[str, ...] = LOCALES, **kwargs: Any) -> GatewayBot:  # noqa: ANN401
+    """Build a bot with a tree of ``size`` commands mapped by IDs, as if they were synced."""
+    bot = GatewayBot(
+        "benchmark",
+        i18n=DictLocalizationProvider(locales),
+        banner=None,
+        logs=None,
+        suppress_optimization_warning=True,
+        **kwargs,
+    )
+    for command in make_tree(size):
+        bot.add_command(command)
+    bot.commands.commands = {
+        Snowflake(FIRST_ID + index): command for index, command in enumerate(bot.commands._commands.values())
+    }
+    return bot
+
+
+def make_payload(shape: str, size: int = 100) -> dict[str, Any]:
+    """Build the payload of an interaction with the command of the given shape."""
+    index = SHAPES.index(shape) + len(SHAPES) * ((size - 1) // len(SHAPES))
+    name, command_id = f"command{index}", FIRST_ID + index
+    user = {"id": str(USER_ID), "username": "target", "discriminator": "0", "avatar": None}
+    options = [
+        {"name": "text", "type": int(OptionType.STRING), "value": "hello"},
+        {"name": "user", "type": int(OptionType.USER), "value": str(USER_ID)},
+    ]
+    match shape:
+        case "slash":
+            return build_command_payload(
+                name, command_id=command_id, options=options, resolved={"users": {str(USER_ID): user}}, guild_id=GUILD_ID
+            )
+        case "user":
+            return build_command_payload(
+                name,
+                command_id=command_id,
+                command_type=CommandType.USER,
+                target_id=USER_ID,
+                resolved={"users": {str(USER_ID): user}},
+                guild_id=GUILD_ID,
+            )
+        case "message":
+            message = {
+                "id": str(MESSAGE_ID),
+                "channel_id": "1",
+                "author": user,
+                "content": "message",
+                "timestamp": "2024-01-01T00:00:00+00:00",
+                "edited_timestamp": None,
+                "tts": False,
+                "mention_everyone": False,
+                "mentions": [],
+                "mention_roles": [],
+                "attachments": [],
+                "embeds": [],
+                "pinned": False,
+                "type": 0,
+                "flags": 0,
+            }
+            return build_command_payload(
+                name,
+                command_id=command_id,
+                command_type=CommandType.MESSAGE,
+                target_id=MESSAGE_ID,
+                resolved={"messages": {str(MESSAGE_ID): message}},
+                guild_id=GUILD_ID,
+            )
+        case "sub":
+            return build_command_payload(
+                name,
+                command_id=command_id,
+                options=[{"name": "sub1", "type": int(OptionType.SUB_COMMAND), "options": options}],
+                resolved={"users": {str(USER_ID): user}},
+                guild_id=GUILD_ID,
+            )
+        case _:
+            return build_command_payload(
+                name,
+                command_id=command_id,
+                options=[
+                    {
+                        "name": "group",
+                        "type": int(OptionType.SUB_COMMAND_GROUP),
+                        "options": [{"name": "sub2", "type": int(OptionType.SUB_COMMAND), "options": options}],
+                    }
+                ],
+                resolved={"users": {str(USER_ID): user}},
+                guild_id=GUILD_ID,
+            )
+
+
+def make_event(bot: GatewayBot, shape: str, size: int = 100) -> InteractionCreateEvent:
+    interaction = bot.entity_factory.deserialize_command_interaction(make_payload(shape, size))
+    assert isinstance(interaction, CommandInteraction)
+    return InteractionCreateEvent(shard=None, interaction=interaction)  # type: ignore
+
+
+async def noop_component(context: object, **kwargs: Any) -> None:  # noqa: ANN401
+    pass
+
+
+def make_components(count: int) -> list[Component]:
+    """Build ``count`` components, half with static custom IDs and half with typed arguments."""
+    return [
+        Component(noop_component, f"shop{index}:open" if index % 2 else f"shop{index}:buy:{{item:int}}:{{gift:bool}}")
+        for index in range(count)
+    ]
+
+
+def make_component_event(bot: GatewayBot, custom_id: str) -> InteractionCreateEvent:
+    interaction = bot.entity_factory.deserialize_interaction(build_component_payload(custom_id, guild_id=GUILD_ID))
+    return InteractionCreateEvent(shard=None, interaction=interaction)  # type: ignore
@@ -0,0 +1,152 @@
+"""Timing, allocation and baseline helpers of the benchmark suite."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import attrs
+
+
+@attrs.define(kw_only=True, frozen=True)
+class Result:
+    name: str = attrs.field()
+    ops: float = attrs.field()
+    """Operations per second."""
+    p50_us: float = attrs.field()
+    p99_us: float = attrs.field()
+    alloc_bytes: float = attrs.field()
+    """Bytes allocated per operation, including the transient ones."""
+    blocks: float = attrs.field()
+    """Memory blocks still allocated per operation once it is done."""
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<28} {self.ops:>12,.0f} ops/s  p50 {self.p50_us:>9.2f} us  p99 {self.p99_us:>9.2f} us  "
+            f"{self.alloc_bytes:>9.0f} B/op  {self.blocks:>6.2f} blocks/op"
+        )
+
+
+def _summarize(name: str, samples: list[float], operations: int, elapsed: float, alloc: float, blocks: float) -> Result:
+    samples.sort()
+    return Result(
+        name=name,
+        ops=operations / elapsed,
+        p50_us=statistics.median(samples) * 1e6,
+        p99_us=samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+        alloc_bytes=alloc,
+        blocks=blocks,
+    )
+
+
+def bench(name: str, function: Callable[[], Any], *, duration: float = 1.0, batch: int = 10) -> Result:
+    """Measure a synchronous operation, latency samples are averaged over ``batch`` calls."""
+    for _ in range(batch * 10):
+        function()
+    samples: list[float] = []
+    operations = 0
+    gc.collect()
+    started = time.perf_counter()
+    while (now := time.perf_counter()) - started < duration:
+        for _ in range(batch):
+            function()
+        samples.append((time.perf_counter() - now) / batch)
+        operations += batch
+    elapsed = time.perf_counter() - started
+
+    allocations = max(batch * 10, 100)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    transient = 0
+    for _ in range(allocations):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        transient += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    gc.collect()
+    return _summarize(
+        name, samples, operations, elapsed, transient / allocations, (sys.getallocatedblocks() - blocks) / allocations
+    )
+
+
+async def abench(
+    name: str, function: Callable[[], Awaitable[Any]], *, duration: float = 1.0, batch: int = 10
+) -> Result:
+    """Measure an asynchronous operation, latency samples are averaged over ``batch`` calls."""
+    for _ in range(batch * 10):
+        await function()
+    samples: list[float] = []
+    operations = 0
+    gc.collect()
+    started = time.perf_counter()
+    while (now := time.perf_counter()) - started < duration:
+        for _ in range(batch):
+            await function()
+        samples.append((time.perf_counter() - now) / batch)
+        operations += batch
+    elapsed = time.perf_counter() - started
+
+    allocations = max(batch * 10, 100)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    transient = 0
+    for _ in range(allocations):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await function()
+        transient += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    await asyncio.sleep(0)
+    gc.collect()
+    return _summarize(
+        name, samples, operations, elapsed, transient / allocations, (sys.getallocatedblocks() - blocks) / allocations
+    )
+
+
+def save_baseline(path: Path, results: list[Result]) -> None:
+    path.write_text(
+        json.dumps({result.name: attrs.asdict(result, filter=lambda a, _: a.name != "name") for result in results},
+                   indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def compare(
+    results: list[Result],
+    baseline: Mapping[str, Mapping[str, float]],
+    threshold: float,
+    time_threshold: float | None = None,
+) -> list[str]:
+    """Return regressions of the results against the baseline.
+
+    A benchmark regresses when its allocations per operation grew by more than ``threshold``, e.g.
+    ``0.1`` for 10%, or its median latency grew by more than ``time_threshold``, which defaults to
+    ``threshold``. Allocations are deterministic, timings are not and may need more room.
+    """
+    time_threshold = threshold if time_threshold is None else time_threshold
+    regressions: list[str] = []
+    for result in results:
+        if (previous := baseline.get(result.name)) is None:
+            continue
+        if result.p50_us > previous["p50_us"] * (1 + time_threshold):
+            regressions.append(
+                f"{result.name}: p50 {previous['p50_us']:.2f} us -> {result.p50_us:.2f} us "
+                f"(+{(result.p50_us / previous['p50_us'] - 1) * 100:.0f}%)"
+            )
+        # A few bytes of noise matter little, so small allocations get some slack.
+        if result.alloc_bytes > max(previous["alloc_bytes"] * (1 + threshold), previous["alloc_bytes"] + 64):
+            regressions.append(
+                f"{result.name}: allocations {previous['alloc_bytes']:.0f} B -> {result.alloc_bytes:.0f} B per op"
+            )
+    return regressions
@@ -0,0 +1,129 @@
+"""Import time budgets of kumo modules, measured with ``python -X importtime``.
+
+Run with ``python benchmarks/importtime.py``, it exits with code 1 when a module imports any of its
+forbidden modules. That check does not depend on the machine, so it can gate CI. Timings are only
+reported against their budgets, as wall-clock time of fresh interpreters varies between runs;
+``--strict`` fails on exceeded budgets too, for local comparisons on a quiet machine. Only the self
+time of kumo modules counts against a budget, hikari dominates the total and is out of our hands.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+import attrs
+
+SRC: Path = Path(__file__).resolve().parent.parent / "src"
+
+BUDGETS: Mapping[str, float] = {
+    "kumo": 5.0,
+    "kumo.commands.decorators": 30.0,
+    "kumo.impl.gateway_bot": 60.0,
+    "kumo.impl.rest_bot": 60.0,
+}
+"""Milliseconds of self time of kumo modules imported by each module, about twice the usual time."""
+
+_OPTIONAL_SUBSYSTEMS: tuple[str, ...] = (
+    "kumo.commands.caching",
+    "kumo.commands.cooldowns",
+    "kumo.i18n.templates",
+    "kumo.impl.command_loader",
+    "kumo.impl.command_manifest",
+    "kumo.impl.component_handler",
+    "kumo.progress",
+    "kumo.tracing",
+    "opentelemetry",
+)
+"""Modules bots import on first use only, so bots not using them do not pay for them at startup."""
+
+FORBIDDEN: Mapping[str, tuple[str, ...]] = {
+    "kumo": ("hikari", "attrs", "aiohttp", "kumo.impl", "kumo.commands"),
+    "kumo.impl.gateway_bot": _OPTIONAL_SUBSYSTEMS,
+    "kumo.impl.rest_bot": _OPTIONAL_SUBSYSTEMS,
+}
+"""Modules which must not get imported by importing each module."""
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class Measurement:
+    module: str
+    own: float
+    """Milliseconds of self time of kumo modules."""
+    total: float
+    """Milliseconds of the whole import."""
+    imported: frozenset[str] = attrs.field(repr=False)
+
+    def __str__(self) -> str:
+        return f"{self.module:<32} kumo {self.own:8.2f} ms  total {self.total:9.2f} ms"
+
+
+def measure_once(module: str) -> Measurement:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (str(SRC), os.environ.get("PYTHONPATH"))))}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    own, total, imported = 0, 0, set()
+    # Lines look like "import time:  self [us] | cumulative | imported package", the target comes last.
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        imported.add(name)
+        if name == "kumo" or name.startswith("kumo."):
+            own += int(self_time)
+        if name == module:
+            total = int(cumulative)
+    return Measurement(module=module, own=own / 1000, total=total / 1000, imported=frozenset(imported))
+
+
+def measure(module: str, runs: int) -> Measurement:
+    """Take the median of fresh interpreters, the first run also warms up bytecode caches."""
+    measure_once(module)
+    measurements = [measure_once(module) for _ in range(runs)]
+    return Measurement(
+        module=module,
+        own=statistics.median(measurement.own for measurement in measurements),
+        total=statistics.median(measurement.total for measurement in measurements),
+        imported=measurements[0].imported,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="interpreters to take the median of")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier of budgets, for slower machines")
+    parser.add_argument("--strict", action="store_true", help="fail when a module exceeds its time budget")
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    for module in dict.fromkeys((*BUDGETS, *FORBIDDEN)):
+        measurement = measure(module, args.runs)
+        budget = BUDGETS.get(module)
+        over = budget is not None and measurement.own > budget * args.scale
+        print(f"{measurement}  {'over budget' if over else ''}".rstrip())
+        if over and args.strict:
+            failures.append(f"{module} takes {measurement.own:.2f} ms, budget is {budget * args.scale:.2f} ms")
+        for forbidden in FORBIDDEN.get(module, ()):
+            if any(name == forbidden or name.startswith(f"{forbidden}.") for name in measurement.imported):
+                failures.append(f"{module} imports {forbidden}")
+
+    for failure in failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    print("no module imports a forbidden module" + (" or exceeds its time budget" if args.strict else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Microbenchmarks of the interaction hot path and of command building.
+
+Run with ``python benchmarks/run.py``. ``--save PATH`` stores the results as a baseline, and
+``--compare PATH`` fails with exit code 1 when a benchmark regressed by more than ``--threshold``
+against it. Baselines are only comparable on the same machine and Python version, and on a noisy
+machine ``--repeat`` keeps the fastest of several runs of the suite and ``--time-threshold`` gives
+latencies more room than the deterministic allocations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import fnmatch
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+
+from hikari.embeds import Embed
+
+from fixtures import (
+    SHAPES,
+    DictLocalizationProvider,
+    NullTracer,
+    make_bot,
+    make_component_event,
+    make_components,
+    make_event,
+    make_tree,
+)
+from harness import Result, abench, bench, compare, save_baseline
+
+from kumo.commands.autocomplete import Autocomplete, match_prefix
+from kumo.commands.caching import ResponseCacheStore
+from kumo.commands.cooldowns import Cooldown, MemoryCooldownStore
+from kumo.events.commands_events import CommandTimeoutEvent
+from kumo.impl.command_builder import CommandBuilder
+from kumo.impl.command_router import CommandRouter
+from kumo.impl.component_router import ComponentRouter
+from kumo.metrics.registry import MetricsRegistry
+from kumo.progress import batch_embeds
+
+TREE_SIZES: tuple[int, ...] = (10, 100, 1000)
+
+
+async def run_hot_path(duration: float, size: int) -> list[Result]:
+    bot = make_bot(size)
+    handler = bot.commands
+    results: list[Result] = []
+    for shape in SHAPES:
+        event = make_event(bot, shape, size)
+        interaction = event.interaction
+        route, options = handler.router.get_route(interaction)  # type: ignore
+        assert route is not None, shape
+
+        results.append(bench(f"route/{shape}", lambda i=interaction: handler.router.get_route(i), duration=duration))
+        results.append(
+            bench(f"bind/{shape}", lambda r=route, i=interaction, o=options: r.binder(i, o), duration=duration)
+        )
+
+        async def dispatch(event: object = event) -> None:
+            await handler.dispatch(event)  # type: ignore
+            # Let the scheduled callback run to completion.
+            await asyncio.sleep(0)
+
+        results.append(await abench(f"dispatch/{shape}", dispatch, duration=duration))
+    interaction = make_event(bot, "slash", size).interaction
+    results.append(bench("context", lambda: handler.create_context(interaction), duration=duration))  # type: ignore
+    return results
+
+
+async def run_metrics(duration: float, size: int) -> list[Result]:
+    """Measure the overhead of metrics, compare ``dispatch/slash+metrics`` with ``dispatch/slash``."""
+    registry = MetricsRegistry()
+    bot = make_bot(size, metrics=registry)
+    event = make_event(bot, "slash", size)
+
+    async def dispatch() -> None:
+        await bot.commands.dispatch(event)
+        await asyncio.sleep(0)
+
+    metrics = registry.get("benchmark")
+    return [
+        await abench("dispatch/slash+metrics", dispatch, duration=duration),
+        bench("metrics/record", lambda: registry.record(metrics, 0.042, 0.001), duration=duration),
+    ]
+
+
+async def run_tracing(duration: float, size: int) -> list[Result]:
+    """Measure the overhead of the tracing hooks, compare ``dispatch/slash+tracing`` with ``dispatch/slash``."""
+    bot = make_bot(size, tracer=NullTracer())
+    event = make_event(bot, "slash", size)
+
+    async def dispatch() -> None:
+        await bot.commands.dispatch(event)
+        await asyncio.sleep(0)
+
+    return [await abench("dispatch/slash+tracing", dispatch, duration=duration)]
+
+
+async def run_autocomplete(duration: float) -> list[Result]:
+    """Measure an answer from the cache, and the lookup of the longest cached prefix of a longer value."""
+    names = [f"name{index}" for index in range(20)]
+
+    async def callback(context: object, value: str) -> list[str]:
+        return [name for name in names if name.startswith(value)]
+
+    autocomplete = Autocomplete(callback, match=match_prefix)
+    await autocomplete.complete(None, "name1")  # type: ignore
+    return [
+        await abench("autocomplete/hit", lambda: autocomplete.complete(None, "name1"), duration=duration),  # type: ignore
+        bench("autocomplete/prefix", lambda: autocomplete.cache.get_prefix(None, "name1abcd"), duration=duration),
+    ]
+
+
+async def run_cooldowns(duration: float, size: int, users: int = 1_000_000) -> list[Result]:
+    """Measure taking tokens of a million users from a bounded store, and the overhead of a cooldown on dispatch."""
+    store = MemoryCooldownStore()
+    keys = itertools.cycle([f"command:{user}" for user in range(users)])
+    clock = itertools.count()
+
+    bot = make_bot(size)
+    event = make_event(bot, "slash", size)
+    route, _ = bot.commands.router.get_route(event.interaction)  # type: ignore
+    route.cooldown = Cooldown(rate=1_000_000_000, per=1.0)  # type: ignore
+
+    def acquire() -> float:
+        # A microsecond passes between calls, so a million users cycle through a minute long cooldown.
+        return store.acquire_now(next(keys), 1, 60.0, next(clock) / 1e6)
+
+    async def dispatch() -> None:
+        await bot.commands.dispatch(event)  # type: ignore
+        await asyncio.sleep(0)
+
+    results = [
+        bench("cooldown/acquire", acquire, duration=duration),
+        await abench("dispatch/slash+cooldown", dispatch, duration=duration),
+    ]
+    assert len(store) <= store.max_size
+    return results
+
+
+async def run_response_cache(duration: float, size: int) -> list[Result]:
+    """Measure replaying a cached response in place of running the callback, answered over HTTP to skip REST."""
+    bot = make_bot(size)
+    handler = bot.commands
+    interaction = make_event(bot, "slash", size).interaction
+    route, options = handler.router.get_route(interaction)  # type: ignore
+    route.responses = store = ResponseCacheStore()  # type: ignore
+    store.set(store.get_key(interaction, options), {"content": "cached"})  # type: ignore
+    loop = asyncio.get_running_loop()
+
+    async def dispatch() -> None:
+        context = handler.create_context(interaction, response_future=loop.create_future())  # type: ignore
+        task = await handler.dispatch_context(context)
+        await task  # type: ignore
+        context.response_future.result()  # type: ignore
+
+    return [
+        bench("cache/key", lambda: store.get_key(interaction, options), duration=duration),  # type: ignore
+        await abench("dispatch/slash+cache-hit", dispatch, duration=duration),
+    ]
+
+
+async def run_progress(duration: float, size: int) -> list[Result]:
+    """Measure coalescing a progress update while an edit is pending, and batching embeds into messages."""
+    bot = make_bot(size)
+    context = bot.commands.create_context(make_event(bot, "slash", size).interaction)  # type: ignore
+    editor = context.progress(interval=3600.0)
+    editor._sent_at = time.monotonic()  # Hold edits back, so updates only replace the pending state.
+    embeds = [Embed(title=f"page {index}", description="x" * 500) for index in range(100)]
+    results = [
+        bench("progress/update", lambda: editor.update("50%"), duration=duration),
+        bench("embeds/batch-100", lambda: batch_embeds(embeds), duration=duration),
+    ]
+    assert editor._task is not None
+    editor._task.cancel()
+    return results
+
+
+async def run_timeouts(duration: float, size: int) -> list[Result]:
+    """Measure cancelling a hung callback at its deadline and dispatching its timeout event."""
+    bot = make_bot(size)
+    handler = bot.commands
+    interaction = make_event(bot, "slash", size).interaction
+    route, _ = handler.router.get_route(interaction)  # type: ignore
+    route.timeout = 0.0  # type: ignore
+    timeouts = 0
+
+    async def hang(context: object, *args: object, **kwargs: object) -> None:
+        await asyncio.Event().wait()
+
+    async def on_timeout(event: CommandTimeoutEvent) -> None:
+        nonlocal timeouts
+        timeouts += 1
+
+    route.callback = hang  # type: ignore
+    bot.event_manager.subscribe(CommandTimeoutEvent, on_timeout)
+
+    async def dispatch() -> None:
+        task = await handler.dispatch_context(handler.create_context(interaction))  # type: ignore
+        await task  # type: ignore
+
+    results = [await abench("dispatch/slash+timeout", dispatch, duration=duration)]
+    await asyncio.sleep(0)
+    assert timeouts > 0
+    return results
+
+
+async def run_components(duration: float, count: int = 10000) -> list[Result]:
+    """Measure routing custom IDs among ``count`` component patterns, which should not depend on the count."""
+    router = ComponentRouter()
+    for component in make_components(count):
+        router.add_component(component)
+    # Odd indices are static and even ones take arguments, take the last of each.
+    last = (count - 1) // 2 * 2
+    static, arguments, miss = f"shop{last - 1}:open", f"shop{last}:buy:42:1", f"shop{last}:buy:x:1"
+    assert router.get_route(static)[0] is not None and router.get_route(arguments)[0] is not None
+    assert router.get_route(miss)[0] is None
+
+    bot = make_bot(1)
+    for component in make_components(count):
+        bot.add_component(component)
+    event = make_component_event(bot, arguments)
+
+    async def dispatch() -> None:
+        await bot.components.dispatch(event)  # type: ignore
+        await asyncio.sleep(0)
+
+    return [
+        bench(f"component/static-{count}", lambda: router.get_route(static), duration=duration),
+        bench(f"component/arguments-{count}", lambda: router.get_route(arguments), duration=duration),
+        bench(f"component/miss-{count}", lambda: router.get_route(miss), duration=duration),
+        await abench("dispatch/component", dispatch, duration=duration),
+    ]
+
+
+async def run_async(duration: float, size: int) -> list[Result]:
+    return (
+        await run_hot_path(duration, size)
+        + await run_metrics(duration, size)
+        + await run_tracing(duration, size)
+        + await run_autocomplete(duration)
+        + await run_components(duration)
+        + await run_cooldowns(duration, size)
+        + await run_response_cache(duration, size)
+        + await run_progress(duration, size)
+        + await run_timeouts(duration, size)
+    )
+
+
+def run_build(duration: float) -> list[Result]:
+    bot = make_bot(1)
+    results: list[Result] = []
+    for size in TREE_SIZES:
+        tree = make_tree(size)
+
+        def build(tree: list = tree) -> None:  # type: ignore
+            # A fresh builder every time, so the localization cache does not carry over between runs.
+            builder = CommandBuilder(bot, i18n=DictLocalizationProvider())
+            list(builder.build_commands(tree))
+
+        def compile_routes(tree: list = tree) -> None:  # type: ignore
+            router = CommandRouter()
+            for command in tree:
+                router.add_command(command)
+
+        results.append(bench(f"build/tree-{size}", build, duration=duration, batch=1))
+        results.append(bench(f"compile/tree-{size}", compile_routes, duration=duration, batch=1))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds per benchmark")
+    parser.add_argument("--size", type=int, default=1000, help="commands in the tree of the hot path benchmarks")
+    parser.add_argument("--filter", default="*", help="glob of benchmark names to keep")
+    parser.add_argument("--save", type=Path, help="store the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="compare the results with a baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed regression, 0.1 is 10%%")
+    parser.add_argument("--time-threshold", type=float, help="allowed latency regression, --threshold by default")
+    parser.add_argument("--repeat", type=int, default=1, help="runs of the suite, the fastest is kept")
+    args = parser.parse_args()
+
+    fastest: dict[str, Result] = {}
+    for _ in range(args.repeat):
+        for result in asyncio.run(run_async(args.duration, args.size)) + run_build(args.duration):
+            if (previous := fastest.get(result.name)) is None or result.p50_us < previous.p50_us:
+                fastest[result.name] = result
+    results = [result for name, result in fastest.items() if fnmatch.fnmatch(name, args.filter)]
+    for result in results:
+        print(result)
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"saved baseline to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold, args.time_threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        time_threshold = args.threshold if args.time_threshold is None else args.time_threshold
+        print(f"no regressions against {args.compare} above {args.threshold:.0%} (latency {time_threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
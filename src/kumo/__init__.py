@@ -1,5 +1,103 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
-__all__: Sequence[str] = ()
+from kumo.internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kumo.commands.decorators import (
+        autocomplete,
+        command_group,
+        message_command,
+        slash_command,
+        sub_command,
+        sub_command_group,
+        user_command,
+    )
+    from kumo.commands.caching import CacheScope, ResponseCache
+    from kumo.commands.cooldowns import Cooldown, CooldownBucket
+    from kumo.commands.options import Choice, Option
+    from kumo.components.decorators import component, modal
+    from kumo.context import (
+        AutocompleteInteractionContext,
+        CommandInteractionContext,
+        ComponentInteractionContext,
+        InteractionContext,
+        ModalInteractionContext,
+    )
+    from kumo.events.commands_events import CommandCallbackErrorEvent, CommandTimeoutEvent
+    from kumo.events.components_events import ComponentCallbackErrorEvent
+    from kumo.i18n.types import Localized
+    from kumo.impl.gateway_bot import GatewayBot
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.impl.sharded_runner import ShardedRunner
+    from kumo.metrics.registry import MetricsRegistry
+    from kumo.progress import ProgressEditor
+
+__all__: Sequence[str] = (
+    "GatewayBot",
+    "RESTBot",
+    "ShardedRunner",
+    "InteractionContext",
+    "CommandInteractionContext",
+    "AutocompleteInteractionContext",
+    "ComponentInteractionContext",
+    "ModalInteractionContext",
+    "CommandCallbackErrorEvent",
+    "CommandTimeoutEvent",
+    "ComponentCallbackErrorEvent",
+    "user_command",
+    "message_command",
+    "slash_command",
+    "command_group",
+    "sub_command",
+    "sub_command_group",
+    "autocomplete",
+    "component",
+    "modal",
+    "Cooldown",
+    "CooldownBucket",
+    "ResponseCache",
+    "CacheScope",
+    "Choice",
+    "Option",
+    "Localized",
+    "MetricsRegistry",
+    "ProgressEditor",
+)
+
+# Names are resolved on first access, so importing kumo does not import hikari and the command stack.
+_EXPORTS: Mapping[str, str] = {
+    "GatewayBot": "kumo.impl.gateway_bot",
+    "RESTBot": "kumo.impl.rest_bot",
+    "ShardedRunner": "kumo.impl.sharded_runner",
+    "InteractionContext": "kumo.context",
+    "CommandInteractionContext": "kumo.context",
+    "AutocompleteInteractionContext": "kumo.context",
+    "ComponentInteractionContext": "kumo.context",
+    "ModalInteractionContext": "kumo.context",
+    "CommandCallbackErrorEvent": "kumo.events.commands_events",
+    "CommandTimeoutEvent": "kumo.events.commands_events",
+    "ComponentCallbackErrorEvent": "kumo.events.components_events",
+    "user_command": "kumo.commands.decorators",
+    "message_command": "kumo.commands.decorators",
+    "slash_command": "kumo.commands.decorators",
+    "command_group": "kumo.commands.decorators",
+    "sub_command": "kumo.commands.decorators",
+    "sub_command_group": "kumo.commands.decorators",
+    "autocomplete": "kumo.commands.decorators",
+    "component": "kumo.components.decorators",
+    "modal": "kumo.components.decorators",
+    "Cooldown": "kumo.commands.cooldowns",
+    "CooldownBucket": "kumo.commands.cooldowns",
+    "ResponseCache": "kumo.commands.caching",
+    "CacheScope": "kumo.commands.caching",
+    "Choice": "kumo.commands.options",
+    "Option": "kumo.commands.options",
+    "Localized": "kumo.i18n.types",
+    "MetricsRegistry": "kumo.metrics.registry",
+    "ProgressEditor": "kumo.progress",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
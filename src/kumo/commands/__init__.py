@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
-from kumo.commands.base import Command, CommandGroup, SubCommand
-from kumo.commands.exceptions import CommandNotFoundException
-from kumo.commands.metadata import MessageCommandMetadata, SlashCommandMetadata, SubCommandMetadata, UserCommandMetadata
-from kumo.commands.options import Choice, Option
+from kumo.internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kumo.commands.autocomplete import Autocomplete
+    from kumo.commands.base import Command, CommandGroup, SubCommand
+    from kumo.commands.caching import CacheScope, ResponseCache
+    from kumo.commands.cooldowns import Cooldown, CooldownBucket, MemoryCooldownStore
+    from kumo.commands.exceptions import CommandNotFoundException
+    from kumo.commands.metadata import (
+        MessageCommandMetadata,
+        SlashCommandMetadata,
+        SubCommandMetadata,
+        UserCommandMetadata,
+    )
+    from kumo.commands.options import Choice, Option
 
 __all__: Sequence[str] = (
     "Command",
@@ -18,4 +30,31 @@ __all__: Sequence[str] = (
     "CommandNotFoundException",
     "Choice",
     "Option",
+    "Autocomplete",
+    "Cooldown",
+    "CooldownBucket",
+    "MemoryCooldownStore",
+    "CacheScope",
+    "ResponseCache",
 )
+
+_EXPORTS: Mapping[str, str] = {
+    "Command": "kumo.commands.base",
+    "CommandGroup": "kumo.commands.base",
+    "SubCommand": "kumo.commands.base",
+    "MessageCommandMetadata": "kumo.commands.metadata",
+    "SlashCommandMetadata": "kumo.commands.metadata",
+    "SubCommandMetadata": "kumo.commands.metadata",
+    "UserCommandMetadata": "kumo.commands.metadata",
+    "CommandNotFoundException": "kumo.commands.exceptions",
+    "Choice": "kumo.commands.options",
+    "Option": "kumo.commands.options",
+    "Autocomplete": "kumo.commands.autocomplete",
+    "Cooldown": "kumo.commands.cooldowns",
+    "CooldownBucket": "kumo.commands.cooldowns",
+    "MemoryCooldownStore": "kumo.commands.cooldowns",
+    "CacheScope": "kumo.commands.caching",
+    "ResponseCache": "kumo.commands.caching",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from kumo.commands.abc.icooldown_store import ICooldownStore
+
+__all__: Sequence[str] = ("ICooldownStore",)
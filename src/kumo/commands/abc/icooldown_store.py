@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+__all__: Sequence[str] = ("ICooldownStore",)
+
+
+class ICooldownStore(Protocol):
+    """Token buckets of cooldowns, a store shared by several processes makes them share the cooldowns."""
+
+    __slots__: Sequence[str] = ()
+
+    async def acquire(self, key: str, rate: int, per: float) -> float:
+        """Take a token from the bucket holding up to ``rate`` tokens, refilled over ``per`` seconds.
+
+        Returns ``0.0`` if a token was taken, otherwise the seconds until one is available.
+        """
+        ...
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from kumo.commands.options import Choice
+
+if TYPE_CHECKING:
+    from kumo.commands.types import AutocompleteCallbackT
+    from kumo.context import AutocompleteInteractionContext
+
+__all__: Sequence[str] = ("MAX_CHOICES", "AutocompleteCache", "Autocomplete", "match_prefix", "match_contains")
+
+_LOGGER = getLogger("kumo.commands.autocomplete")
+
+MAX_CHOICES: int = 25
+"""Discord shows at most this many autocomplete choices."""
+
+CacheKeyT = tuple[Hashable, str]
+MatchT = Callable[[Choice, str], bool]
+
+
+def match_prefix(choice: Choice, value: str) -> bool:
+    return choice.name.casefold().startswith(value.casefold())
+
+
+def match_contains(choice: Choice, value: str) -> bool:
+    return value.casefold() in choice.name.casefold()
+
+
+class _Entry:
+    __slots__: Sequence[str] = ("expires_at", "choices", "complete")
+
+    def __init__(self, expires_at: float, choices: tuple[Choice, ...], complete: bool) -> None:
+        self.expires_at: float = expires_at
+        self.choices: tuple[Choice, ...] = choices
+        self.complete: bool = complete
+        """Whether the choices are every match of the value, there were fewer than Discord can show."""
+
+
+class AutocompleteCache:
+    """Choices keyed by the scope and the focused value, entries expire after ``ttl`` seconds.
+
+    At most ``max_size`` entries are kept, the least recently used one is evicted first.
+    """
+
+    __slots__: Sequence[str] = ("_entries", "ttl", "max_size")
+
+    def __init__(self, *, ttl: float = 30.0, max_size: int = 1024) -> None:
+        self._entries: OrderedDict[CacheKeyT, _Entry] = OrderedDict()
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKeyT) -> _Entry | None:
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_prefix(self, scope: Hashable, value: str) -> _Entry | None:
+        """Return the entry of the longest cached prefix of the value, shorter than the value itself."""
+        for end in range(len(value) - 1, -1, -1):
+            if (entry := self.get((scope, value[:end]))) is not None:
+                return entry
+        return None
+
+    def set(self, key: CacheKeyT, choices: tuple[Choice, ...], *, complete: bool) -> None:
+        self._entries[key] = _Entry(time.monotonic() + self.ttl, choices, complete)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class Autocomplete:
+    """Autocomplete handler of an option, caching the choices its callback returns.
+
+    The callback takes the context and the focused value and returns choices, or plain values
+    which become choices named after them. Results are cached per value and per ``key`` of the
+    context, e.g. the guild, if the choices depend on more than the value.
+
+    With ``match`` set, complete results of a prefix are filtered for longer values instead of
+    calling the callback on every keystroke. If the callback does not return within ``deadline``
+    seconds, the best cached answer is returned and the callback keeps running to fill the cache.
+    Concurrent requests for the same value share one call of the callback.
+    """
+
+    __slots__: Sequence[str] = ("_pending", "callback", "cache", "deadline", "key", "match")
+
+    def __init__(
+        self,
+        callback: AutocompleteCallbackT,
+        *,
+        ttl: float = 30.0,
+        max_size: int = 1024,
+        deadline: float | None = 2.0,
+        key: Callable[[AutocompleteInteractionContext], Hashable] | None = None,
+        match: MatchT | None = None,
+    ) -> None:
+        self._pending: dict[CacheKeyT, asyncio.Task[tuple[Choice, ...]]] = {}
+        self.callback: AutocompleteCallbackT = callback
+        self.cache: AutocompleteCache = AutocompleteCache(ttl=ttl, max_size=max_size)
+        self.deadline: float | None = deadline
+        self.key: Callable[[AutocompleteInteractionContext], Hashable] | None = key
+        self.match: MatchT | None = match
+
+    async def complete(self, context: AutocompleteInteractionContext, value: str) -> Sequence[Choice]:
+        scope = self.key(context) if self.key is not None else None
+        key = (scope, value)
+        if (entry := self.cache.get(key)) is not None:
+            return entry.choices
+        if self.match is not None and (entry := self.cache.get_prefix(scope, value)) is not None and entry.complete:
+            # Every match of the prefix is known, so the ones of the longer value are among them.
+            choices = tuple(choice for choice in entry.choices if self.match(choice, value))
+            self.cache.set(key, choices, complete=True)
+            return choices
+
+        if (task := self._pending.get(key)) is None:
+            task = self._pending[key] = asyncio.get_running_loop().create_task(
+                self._fetch(context, key), name=f"autocomplete {value!r}"
+            )
+        done, _ = await asyncio.wait((task,), timeout=self.deadline)
+        if done:
+            return task.result()
+        _LOGGER.debug("autocomplete of %r is past the deadline, answering from the cache", value)
+        if (entry := self.cache.get_prefix(scope, value)) is None:
+            return ()
+        if self.match is not None:
+            return tuple(choice for choice in entry.choices if self.match(choice, value))
+        return entry.choices
+
+    async def _fetch(self, context: AutocompleteInteractionContext, key: CacheKeyT) -> tuple[Choice, ...]:
+        try:
+            results = await self.callback(context, key[1])
+        except Exception as error:
+            _LOGGER.error("exception occurred in autocomplete of %r: %s", key[1], error, exc_info=error)
+            return ()
+        finally:
+            self._pending.pop(key, None)
+        choices = tuple(
+            result if isinstance(result, Choice) else Choice(name=str(result), value=result)
+            for result in results[:MAX_CHOICES]
+        )
+        self.cache.set(key, choices, complete=len(results) < MAX_CHOICES)
+        return choices
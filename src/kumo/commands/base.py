@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from types import MethodType
@@ -27,7 +26,7 @@ class Command:
         self.metadata: CommandMetadata = metadata
 
     def get_callback(self) -> CommandCallbackT:
-        return MethodType(self.obj, self.callback) if inspect.isclass(self.obj) else self.callback  # TODO: something smarter
+        return self.callback if self.obj is self.callback else MethodType(self.callback, self.obj)
 
 
 class SubCommand:  # noqa: B903
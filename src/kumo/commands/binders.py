@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from hikari.commands import OptionType
+
+if TYPE_CHECKING:
+    from hikari.guilds import Role
+    from hikari.interactions import (
+        CommandInteraction,
+        CommandInteractionOption,
+        InteractionChannel,
+        InteractionMember,
+        ResolvedOptionData,
+    )
+    from hikari.messages import Attachment, Message
+    from hikari.snowflakes import Snowflake
+    from hikari.users import User
+
+    from kumo.commands.options import Option
+
+    ArgumentT = (
+        InteractionMember | User | InteractionChannel | Role | Attachment | Snowflake | str | int | float | bool | None
+    )
+
+__all__: Sequence[str] = ("OptionsBinder", "bind_user_target", "bind_message_target")
+
+ResolverT = Callable[["ResolvedOptionData", Any], "ArgumentT"]
+BinderT = Callable[["CommandInteraction", "Sequence[CommandInteractionOption]"], tuple[Sequence[Any], Mapping[str, Any]]]
+
+_NO_ARGS: tuple[()] = ()
+_UNDECLARED: Any = object()
+
+
+def resolve_user(resolved: ResolvedOptionData, value: Snowflake) -> InteractionMember | User | None:
+    return resolved.members.get(value) or resolved.users.get(value)
+
+
+def resolve_channel(resolved: ResolvedOptionData, value: Snowflake) -> InteractionChannel | None:
+    return resolved.channels.get(value)
+
+
+def resolve_role(resolved: ResolvedOptionData, value: Snowflake) -> Role | None:
+    return resolved.roles.get(value)
+
+
+def resolve_mentionable(resolved: ResolvedOptionData, value: Snowflake) -> InteractionMember | User | Role | None:
+    return resolved.members.get(value) or resolved.users.get(value) or resolved.roles.get(value)
+
+
+def resolve_attachment(resolved: ResolvedOptionData, value: Snowflake) -> Attachment | None:
+    return resolved.attachments.get(value)
+
+
+RESOLVERS: Mapping[OptionType, ResolverT] = {
+    OptionType.USER: resolve_user,
+    OptionType.CHANNEL: resolve_channel,
+    OptionType.ROLE: resolve_role,
+    OptionType.MENTIONABLE: resolve_mentionable,
+    OptionType.ATTACHMENT: resolve_attachment,
+}
+
+
+class OptionsBinder:
+    """Binds interaction options to callback keyword arguments in a single pass.
+
+    Resolvers of the declared options are chosen when the binder is compiled, and optional options
+    missing from the interaction are filled with their defaults.
+    """
+
+    __slots__: Sequence[str] = ("resolvers", "defaults")
+
+    def __init__(self, options: Sequence[Option] | None = None) -> None:
+        self.resolvers: dict[str, ResolverT | None] = {}
+        self.defaults: dict[str, Any] = {}
+        for option in options or ():
+            self.resolvers[option.name] = RESOLVERS.get(option.type)
+            if not option.is_required:
+                self.defaults[option.name] = option.default
+
+    def __call__(
+        self, interaction: CommandInteraction, options: Sequence[CommandInteractionOption]
+    ) -> tuple[Sequence[Any], Mapping[str, Any]]:
+        kwargs = self.defaults.copy()
+        resolvers = self.resolvers
+        resolved = interaction.resolved
+        for option in options:
+            if (resolver := resolvers.get(option.name, _UNDECLARED)) is _UNDECLARED:
+                resolver = RESOLVERS.get(option.type)
+            kwargs[option.name] = resolver(resolved, option.value) if resolver and resolved else option.value
+        return _NO_ARGS, kwargs
+
+
+def bind_user_target(
+    interaction: CommandInteraction, _: Sequence[CommandInteractionOption]
+) -> tuple[Sequence[Any], Mapping[str, Any]]:
+    if not interaction.resolved or interaction.target_id is None:
+        return _NO_ARGS, {}
+    return (resolve_user(interaction.resolved, interaction.target_id),), {}
+
+
+def bind_message_target(
+    interaction: CommandInteraction, _: Sequence[CommandInteractionOption]
+) -> tuple[Sequence[Any], Mapping[str, Any]]:
+    if not interaction.resolved or interaction.target_id is None:
+        return _NO_ARGS, {}
+    message: Message | None = interaction.resolved.messages.get(interaction.target_id)
+    return (message,), {}
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import enum
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import attrs
+from hikari.undefined import UNDEFINED
+
+if TYPE_CHECKING:
+    from hikari.interactions import CommandInteraction, CommandInteractionOption
+
+    from kumo.context import CommandInteractionContext
+
+__all__: Sequence[str] = ("CacheScope", "ResponseCache", "ResponseCacheStore")
+
+ResponseT = Mapping[str, Any]
+"""Arguments of ``create_response`` of a cached response."""
+
+
+class CacheScope(enum.Flag):
+    """What else than the options a cached response depends on."""
+
+    NONE = 0
+    GUILD = enum.auto()
+    LOCALE = enum.auto()
+    USER = enum.auto()
+
+
+@attrs.define(kw_only=True, weakref_slot=False, frozen=True)
+class ResponseCache:
+    """Caches the final response of a command for ``ttl`` seconds by its option values, within the ``scope``.
+
+    Only use it for commands whose response is a function of their options and the scope.
+    """
+
+    ttl: float = attrs.field(default=60.0, validator=attrs.validators.gt(0))
+    max_size: int = attrs.field(default=1024, validator=attrs.validators.gt(0))
+    scope: CacheScope = attrs.field(default=CacheScope.NONE)
+
+
+class _Entry:
+    __slots__: Sequence[str] = ("expires_at", "response")
+
+    def __init__(self, expires_at: float, response: ResponseT) -> None:
+        self.expires_at: float = expires_at
+        self.response: ResponseT = response
+
+
+class ResponseCacheStore:
+    """Cached responses of a command, at most ``max_size`` of them, the least recently used one is evicted first.
+
+    Concurrent interactions with the same key share one call of the callback, they replay its response.
+    """
+
+    __slots__: Sequence[str] = ("_entries", "_pending", "ttl", "max_size", "scope")
+
+    def __init__(self, *, ttl: float = 60.0, max_size: int = 1024, scope: CacheScope = CacheScope.NONE) -> None:
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Future[ResponseT | None]] = {}
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.scope: CacheScope = scope
+
+    @classmethod
+    def from_cache(cls, cache: ResponseCache) -> ResponseCacheStore:
+        return cls(ttl=cache.ttl, max_size=cache.max_size, scope=cache.scope)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_key(self, interaction: CommandInteraction, options: Sequence[CommandInteractionOption]) -> Hashable:
+        scope = self.scope
+        return (
+            tuple((option.name, option.value) for option in options),
+            interaction.guild_id if CacheScope.GUILD in scope else None,
+            str(interaction.locale) if CacheScope.LOCALE in scope else None,
+            interaction.user.id if CacheScope.USER in scope else None,
+        )
+
+    def get(self, key: Hashable) -> ResponseT | None:
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.response
+
+    def set(self, key: Hashable, response: ResponseT) -> None:
+        self._entries[key] = _Entry(time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def respond(
+        self, context: CommandInteractionContext, key: Hashable, callback: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Replay the cached response of the key, or run the callback and cache its final response.
+
+        The final response merges the flags of a deferral with the fields of every response and edit, in order.
+        """
+        if (response := self.get(key)) is not None:
+            await context.create_response(**response)
+            return
+        if (pending := self._pending.get(key)) is not None:
+            if (response := await asyncio.shield(pending)) is not None:
+                await context.create_response(**response)
+                return
+            # The shared call failed or did not respond, so this interaction runs its own.
+            await callback()
+            return
+
+        future: asyncio.Future[ResponseT | None] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        captured: dict[str, Any] = {}
+
+        def capture(response: ResponseT) -> None:
+            # Edits leave undefined fields as they were, and flags of the deferral still apply to the edits.
+            for name, value in response.items():
+                if value is UNDEFINED:
+                    continue
+                captured[name] = value | captured["flags"] if name == "flags" and "flags" in captured else value
+
+        context.on_response = capture
+        try:
+            await callback()
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            # A deferral alone carries only flags, it is no response to replay.
+            response = captured if captured.keys() - {"flags"} else None
+            if response is not None:
+                self.set(key, response)
+            future.set_result(response)
+        finally:
+            del self._pending[key]
+            context.on_response = None
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import enum
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import attrs
+
+from kumo.i18n.types import Localized
+
+if TYPE_CHECKING:
+    from hikari.interactions import CommandInteraction
+
+__all__: Sequence[str] = ("CooldownBucket", "Cooldown", "MemoryCooldownStore")
+
+DEFAULT_MESSAGE: str = "This command is on cooldown, try again in {retry_after} seconds."
+
+
+class CooldownBucket(enum.Enum):
+    """Who shares a cooldown."""
+
+    USER = enum.auto()
+    """Each user, across guilds."""
+    MEMBER = enum.auto()
+    """Each user in each guild."""
+    CHANNEL = enum.auto()
+    """Everyone in a channel."""
+    GUILD = enum.auto()
+    """Everyone in a guild, each user in direct messages."""
+    GLOBAL = enum.auto()
+    """Everyone."""
+
+
+@attrs.define(kw_only=True, weakref_slot=False, frozen=True)
+class Cooldown:
+    """Allows ``rate`` invocations per ``per`` seconds to each bucket, extra ones are refused with ``message``.
+
+    The message is translated and may use ``{retry_after}``, the seconds until the command can be used again.
+    """
+
+    rate: int = attrs.field(validator=attrs.validators.gt(0))
+    per: float = attrs.field(validator=attrs.validators.gt(0))
+    bucket: CooldownBucket = attrs.field(default=CooldownBucket.USER)
+    message: Localized | str = attrs.field(default=DEFAULT_MESSAGE, repr=False)
+
+    def get_key(self, interaction: CommandInteraction) -> str:
+        match self.bucket:
+            case CooldownBucket.USER:
+                return str(interaction.user.id)
+            case CooldownBucket.MEMBER:
+                return f"{interaction.guild_id}:{interaction.user.id}"
+            case CooldownBucket.CHANNEL:
+                return str(interaction.channel_id)
+            case CooldownBucket.GUILD:
+                return str(interaction.guild_id) if interaction.guild_id is not None else f"@{interaction.user.id}"
+            case _:
+                return ""
+
+
+class MemoryCooldownStore:
+    """Token buckets of a single process, at most ``max_size`` of them are kept.
+
+    A bucket is stored as one float, the time it is refilled at (the generic cell rate algorithm),
+    which is a token bucket refilled lazily on access. Refilled buckets are the same as missing
+    ones, so they are evicted as they are reached from the least recently used end, and beyond
+    ``max_size`` the least recently used bucket is evicted even if it is not refilled yet.
+    """
+
+    __slots__: Sequence[str] = ("_buckets", "max_size")
+
+    def __init__(self, *, max_size: int = 100_000) -> None:
+        self._buckets: OrderedDict[str, float] = OrderedDict()
+        self.max_size: int = max_size
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(self, key: str, rate: int, per: float) -> float:
+        return self.acquire_now(key, rate, per, time.monotonic())
+
+    def acquire_now(self, key: str, rate: int, per: float, now: float) -> float:
+        buckets = self._buckets
+        refilled_at = max(buckets.get(key, now), now) + per / rate
+        if refilled_at - now > per:
+            return refilled_at - per - now
+        buckets[key] = refilled_at
+        buckets.move_to_end(key)
+        while buckets:
+            oldest = next(iter(buckets))
+            if buckets[oldest] > now and len(buckets) <= self.max_size:
+                break
+            del buckets[oldest]
+        return 0.0
+
+    def clear(self) -> None:
+        self._buckets.clear()
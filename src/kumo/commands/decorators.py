@@ -6,20 +6,37 @@ from typing import TYPE_CHECKING
 
 from hikari import UNDEFINED
 
+from kumo.commands.autocomplete import Autocomplete
 from kumo.commands.base import Command, CommandGroup, SubCommand, SubCommandGroup
 from kumo.commands.metadata import MessageCommandMetadata, SlashCommandMetadata, SubCommandMetadata, UserCommandMetadata
-from kumo.commands.options import Option
 from kumo.commands.utils import get_callback
-from kumo.i18n.types import Localized, LocalizedOr
 from kumo.internal.consts import DEFAULT_DESCRIPTION, GROUP_DESCRIPTION
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from hikari.guilds import PartialGuild
     from hikari.permissions import Permissions
+    from hikari.snowflakes import SnowflakeishSequence
     from hikari.undefined import UndefinedOr
 
-    from kumo.commands.types import CommandCallbackT
-
-__all__: Sequence[str] = ("user_command", "message_command", "slash_command", "command_group", "sub_command", "sub_command_group")
+    from kumo.commands.autocomplete import MatchT
+    from kumo.commands.caching import ResponseCache
+    from kumo.commands.cooldowns import Cooldown
+    from kumo.commands.options import Option
+    from kumo.commands.types import AutocompleteCallbackT, CommandCallbackT
+    from kumo.context import AutocompleteInteractionContext
+    from kumo.i18n.types import Localized, LocalizedOr
+
+__all__: Sequence[str] = (
+    "user_command",
+    "message_command",
+    "slash_command",
+    "command_group",
+    "sub_command",
+    "sub_command_group",
+    "autocomplete",
+)
 
 
 def get_sub_commands(obj: object) -> Generator[SubCommandGroup | SubCommand]:
@@ -35,6 +52,9 @@ def user_command(
     default_member_permissions: UndefinedOr[Permissions] = UNDEFINED,
     is_dm_enabled: UndefinedOr[bool] = UNDEFINED,
     is_nsfw: UndefinedOr[bool] = UNDEFINED,
+    guilds: SnowflakeishSequence[PartialGuild] | None = None,
+    cooldown: Cooldown | None = None,
+    timeout: float | None = None,
 ) -> Callable[[type], Command]:
     def inner(obj: type) -> Command:
         return Command(
@@ -45,6 +65,9 @@ def user_command(
                 default_member_permissions=default_member_permissions,
                 is_dm_enabled=is_dm_enabled,
                 is_nsfw=is_nsfw,
+                guilds=guilds,
+                cooldown=cooldown,
+                timeout=timeout,
             )
         )
 
@@ -58,6 +81,9 @@ def message_command(
     default_member_permissions: UndefinedOr[Permissions] = UNDEFINED,
     is_dm_enabled: UndefinedOr[bool] = UNDEFINED,
     is_nsfw: UndefinedOr[bool] = UNDEFINED,
+    guilds: SnowflakeishSequence[PartialGuild] | None = None,
+    cooldown: Cooldown | None = None,
+    timeout: float | None = None,
 ) -> Callable[[type], Command]:
     def inner(obj: type) -> Command:
         return Command(
@@ -68,6 +94,9 @@ def message_command(
                 default_member_permissions=default_member_permissions,
                 is_dm_enabled=is_dm_enabled,
                 is_nsfw=is_nsfw,
+                guilds=guilds,
+                cooldown=cooldown,
+                timeout=timeout,
             )
         )
 
@@ -83,6 +112,10 @@ def slash_command(
     default_member_permissions: UndefinedOr[Permissions] = UNDEFINED,
     is_dm_enabled: UndefinedOr[bool] = UNDEFINED,
     is_nsfw: UndefinedOr[bool] = UNDEFINED,
+    guilds: SnowflakeishSequence[PartialGuild] | None = None,
+    cooldown: Cooldown | None = None,
+    timeout: float | None = None,
+    cache: ResponseCache | None = None,
 ) -> Callable[[type], Command]:
     def inner(obj: type) -> Command:
         callback: CommandCallbackT = get_callback(obj)
@@ -98,6 +131,10 @@ def slash_command(
                 default_member_permissions=default_member_permissions,
                 is_dm_enabled=is_dm_enabled,
                 is_nsfw=is_nsfw,
+                guilds=guilds,
+                cooldown=cooldown,
+                timeout=timeout,
+                cache=cache,
             )
         )
 
@@ -110,6 +147,9 @@ def sub_command(
     display_name: Localized | None = None,
     description: LocalizedOr[str] = DEFAULT_DESCRIPTION,
     options: Sequence[Option] | None = None,
+    cooldown: Cooldown | None = None,
+    timeout: float | None = None,
+    cache: ResponseCache | None = None,
 ) -> Callable[[CommandCallbackT], SubCommand]:
     def inner(callback: CommandCallbackT) -> SubCommand:
         # TODO: get options from callback signature
@@ -120,6 +160,9 @@ def sub_command(
                 display_name=display_name,
                 description=description,
                 options=options,
+                cooldown=cooldown,
+                timeout=timeout,
+                cache=cache,
             )
         )
 
@@ -133,6 +176,7 @@ def command_group(
     default_member_permissions: UndefinedOr[Permissions] = UNDEFINED,
     is_dm_enabled: UndefinedOr[bool] = UNDEFINED,
     is_nsfw: UndefinedOr[bool] = UNDEFINED,
+    guilds: SnowflakeishSequence[PartialGuild] | None = None,
 ) -> Callable[[type], CommandGroup]:
     def inner(obj: type) -> CommandGroup:
         group: CommandGroup = CommandGroup(
@@ -144,6 +188,7 @@ def command_group(
                 default_member_permissions=default_member_permissions,
                 is_dm_enabled=is_dm_enabled,
                 is_nsfw=is_nsfw,
+                guilds=guilds,
             )
         )
         if inspect.isclass(obj):
@@ -169,3 +214,17 @@ def sub_command_group(
         )
 
     return inner
+
+
+def autocomplete(
+    *,
+    ttl: float = 30.0,
+    max_size: int = 1024,
+    deadline: float | None = 2.0,
+    key: Callable[[AutocompleteInteractionContext], Hashable] | None = None,
+    match: MatchT | None = None,
+) -> Callable[[AutocompleteCallbackT], Autocomplete]:
+    def inner(callback: AutocompleteCallbackT) -> Autocomplete:
+        return Autocomplete(callback, ttl=ttl, max_size=max_size, deadline=deadline, key=key, match=match)
+
+    return inner
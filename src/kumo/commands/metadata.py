@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import TYPE_CHECKING, ClassVar
 
 import attrs
-from hikari.permissions import Permissions
-from hikari.undefined import UNDEFINED, UndefinedOr
+from hikari.commands import CommandType
+from hikari.snowflakes import Snowflake
+from hikari.undefined import UNDEFINED
 
-from kumo.commands.options import Option
-from kumo.i18n.types import Localized, LocalizedOr
 from kumo.metadata import Metadata
 
+if TYPE_CHECKING:
+    from hikari.permissions import Permissions
+    from hikari.snowflakes import SnowflakeishSequence
+    from hikari.undefined import UndefinedOr
+
+    from kumo.commands.caching import ResponseCache
+    from kumo.commands.cooldowns import Cooldown
+    from kumo.commands.options import Option
+    from kumo.i18n.types import Localized, LocalizedOr
+
 __all__: Sequence[str] = (
     "CommandMetadata",
     "ApplicationMetadata",
@@ -20,17 +30,29 @@ __all__: Sequence[str] = (
 )
 
 
+def _to_guilds(guilds: SnowflakeishSequence[object] | None) -> tuple[Snowflake, ...] | None:
+    return tuple(Snowflake(guild) for guild in guilds) if guilds is not None else None
+
+
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
 class CommandMetadata(Metadata):
     display_name: Localized | None = attrs.field(default=None, repr=False, eq=False)
+    cooldown: Cooldown | None = attrs.field(default=None, repr=False, eq=False)
+    cache: ResponseCache | None = attrs.field(default=None, repr=False, eq=False)
+    timeout: float | None = attrs.field(default=None, repr=False, eq=False)
+    """Seconds the callback may run before it is cancelled, capped by the timeout of the handler."""
 
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
 class ApplicationMetadata(CommandMetadata):
+    command_type: ClassVar[CommandType]
+
     default_member_permissions: UndefinedOr[Permissions] = attrs.field(default=UNDEFINED, repr=False, eq=False)
     is_dm_enabled: UndefinedOr[bool] = attrs.field(default=UNDEFINED, repr=False, eq=False)
     is_nsfw: UndefinedOr[bool] = attrs.field(default=UNDEFINED, repr=False, eq=False)
 
+    guilds: Sequence[Snowflake] | None = attrs.field(default=None, converter=_to_guilds, repr=False, eq=False)
+
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
 class SubCommandMetadata(CommandMetadata):
@@ -40,12 +62,15 @@ class SubCommandMetadata(CommandMetadata):
 
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
-class UserCommandMetadata(ApplicationMetadata): ...
+class UserCommandMetadata(ApplicationMetadata):
+    command_type: ClassVar[CommandType] = CommandType.USER
 
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
-class MessageCommandMetadata(ApplicationMetadata): ...
+class MessageCommandMetadata(ApplicationMetadata):
+    command_type: ClassVar[CommandType] = CommandType.MESSAGE
 
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
-class SlashCommandMetadata(ApplicationMetadata, SubCommandMetadata): ...
+class SlashCommandMetadata(ApplicationMetadata, SubCommandMetadata):
+    command_type: ClassVar[CommandType] = CommandType.SLASH
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import attrs
-from hikari.channels import ChannelType
-from hikari.commands import OptionType
 
-from kumo.i18n.types import Localized, LocalizedOr
+if TYPE_CHECKING:
+    from hikari.channels import ChannelType
+    from hikari.commands import OptionType
+
+    from kumo.commands.autocomplete import Autocomplete
+
+    from kumo.i18n.types import Localized, LocalizedOr
 
 __all__: Sequence[str] = ("Choice", "Option")
 
@@ -36,3 +40,7 @@ class Option:
     min_length: int | None = attrs.field(default=None, repr=False, eq=False)
     max_length: int | None = attrs.field(default=None, repr=False, eq=False)
     channel_types: Sequence[ChannelType] | None = attrs.field(default=None, repr=False, eq=False)
+
+    default: Any = attrs.field(default=None, repr=False, eq=False)
+    autocomplete: Autocomplete | None = attrs.field(default=None, repr=False, eq=False)
+    """Handler suggesting values while the option is typed, Discord then accepts any value, not only choices."""
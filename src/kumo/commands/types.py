@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine, Sequence
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from kumo.commands.base import Command, CommandGroup
+    from kumo.commands.options import Choice
+    from kumo.context import AutocompleteInteractionContext, CommandInteractionContext
 
     CommandT = Command | CommandGroup
 
-__all__: Sequence[str] = ("CommandCallbackT", "CommandT")
+__all__: Sequence[str] = ("CommandCallbackT", "CommandT", "AutocompleteCallbackT", "TimeoutHookT")
 
 CommandCallbackT = Callable[..., Coroutine[Any, Any, None]]
+AutocompleteCallbackT = Callable[
+    ["AutocompleteInteractionContext", str], Coroutine[Any, Any, "Sequence[Choice | str | int | float]"]
+]
+TimeoutHookT = Callable[["CommandInteractionContext"], Awaitable[None]]
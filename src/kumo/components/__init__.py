@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+from kumo.internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kumo.components.base import Component, Placeholder
+    from kumo.components.decorators import component, modal
+
+__all__: Sequence[str] = ("Component", "Placeholder", "component", "modal")
+
+_EXPORTS: Mapping[str, str] = {
+    "Component": "kumo.components.base",
+    "Placeholder": "kumo.components.base",
+    "component": "kumo.components.decorators",
+    "modal": "kumo.components.decorators",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from types import MethodType
+from typing import TYPE_CHECKING, Any
+
+from kumo.commands.utils import get_callback
+
+if TYPE_CHECKING:
+    from kumo.components.types import ComponentCallbackT
+
+__all__: Sequence[str] = ("SEPARATOR", "MAX_CUSTOM_ID_LENGTH", "Placeholder", "Component", "parse_pattern")
+
+SEPARATOR: str = ":"
+"""Separates segments of custom IDs."""
+MAX_CUSTOM_ID_LENGTH: int = 100
+"""Discord accepts custom IDs of at most this many characters."""
+
+_PLACEHOLDER = re.compile(r"\{(?P<name>[A-Za-z_]\w*)(?::(?P<type>\w+))?\}")
+
+
+def _to_bool(value: str) -> bool:
+    if value == "1":
+        return True
+    if value == "0":
+        return False
+    raise ValueError(f"invalid boolean {value!r}")
+
+
+def _from_value(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+_CONVERTERS: Mapping[str, Callable[[str], Any]] = {"str": str, "int": int, "float": float, "bool": _to_bool}
+
+
+class Placeholder:
+    """Segment of a custom ID pattern holding an argument of the callback."""
+
+    __slots__: Sequence[str] = ("name", "type", "convert")
+
+    def __init__(self, name: str, type_: str = "str") -> None:
+        if type_ not in _CONVERTERS:
+            raise ValueError(f"unsupported type {type_!r} of placeholder {name!r}")
+        self.name: str = name
+        self.type: str = type_
+        self.convert: Callable[[str], Any] = _CONVERTERS[type_]
+
+    def __repr__(self) -> str:
+        return f"{{{self.name}:{self.type}}}"
+
+
+def parse_pattern(pattern: str) -> tuple[str | Placeholder, ...]:
+    """Split the pattern into literal segments and placeholders, e.g. ``"ticket:close:{id:int}"``.
+
+    A placeholder takes a whole segment, typed ``str``, ``int``, ``float`` or ``bool``, ``str`` by default.
+    """
+    # Placeholders are cut out before splitting, as their types are separated by the separator too.
+    placeholders = iter(_PLACEHOLDER.finditer(pattern))
+    template = _PLACEHOLDER.sub("\0", pattern)
+    segments: list[str | Placeholder] = []
+    names: set[str] = set()
+    for segment in template.split(SEPARATOR):
+        if segment != "\0":
+            if "\0" in segment or "{" in segment or "}" in segment:
+                raise ValueError(f"invalid segment {segment!r} of pattern {pattern!r}")
+            segments.append(segment)
+            continue
+        match = next(placeholders)
+        if (name := match["name"]) in names:
+            raise ValueError(f"placeholder {name!r} is repeated in pattern {pattern!r}")
+        names.add(name)
+        segments.append(Placeholder(name, match["type"] or "str"))
+    return tuple(segments)
+
+
+class Component:
+    """Handler of message components or modals whose custom IDs match the pattern.
+
+    Placeholders of the pattern are passed to the callback as keyword arguments.
+    """
+
+    __slots__: Sequence[str] = ("obj", "callback", "pattern", "segments", "is_modal")
+
+    def __init__(
+        self, obj: type, pattern: str, *, callback: ComponentCallbackT | None = None, is_modal: bool = False
+    ) -> None:
+        self.obj: type = obj
+        self.callback: ComponentCallbackT = callback or get_callback(obj)
+        self.pattern: str = pattern
+        self.segments: tuple[str | Placeholder, ...] = parse_pattern(pattern)
+        self.is_modal: bool = is_modal
+
+    @property
+    def placeholders(self) -> Sequence[Placeholder]:
+        return tuple(segment for segment in self.segments if isinstance(segment, Placeholder))
+
+    def get_callback(self) -> ComponentCallbackT:
+        return self.callback if self.obj is self.callback else MethodType(self.callback, self.obj)
+
+    def custom_id(self, **values: Any) -> str:  # noqa: ANN401
+        """Build a custom ID matching the pattern with ``values`` of the placeholders."""
+        parts: list[str] = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            try:
+                value = _from_value(values[segment.name])
+            except KeyError:
+                raise ValueError(f"missing value of placeholder {segment.name!r}") from None
+            if SEPARATOR in value:
+                raise ValueError(f"value of placeholder {segment.name!r} contains {SEPARATOR!r}")
+            parts.append(value)
+        custom_id = SEPARATOR.join(parts)
+        if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+            raise ValueError(f"custom ID {custom_id!r} is longer than {MAX_CUSTOM_ID_LENGTH} characters")
+        return custom_id
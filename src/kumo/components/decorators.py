@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+from kumo.components.base import Component
+
+__all__: Sequence[str] = ("component", "modal")
+
+
+def component(pattern: str) -> Callable[[type], Component]:
+    """Handle message components with custom IDs matching the pattern, e.g. ``"ticket:close:{id:int}"``."""
+
+    def inner(obj: type) -> Component:
+        return Component(obj, pattern)
+
+    return inner
+
+
+def modal(pattern: str) -> Callable[[type], Component]:
+    """Handle submitted modals with custom IDs matching the pattern."""
+
+    def inner(obj: type) -> Component:
+        return Component(obj, pattern, is_modal=True)
+
+    return inner
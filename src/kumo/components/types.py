@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
+
+__all__: Sequence[str] = ("ComponentCallbackT",)
+
+ComponentCallbackT = Callable[..., Coroutine[Any, Any, None]]
@@ -1,47 +1,145 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import time
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import attrs
-from hikari.interactions import ResponseType
-from hikari.messages import Message, MessageFlag
+from hikari.impl.special_endpoints import (
+    AutocompleteChoiceBuilder,
+    InteractionDeferredBuilder,
+    InteractionMessageBuilder,
+)
+from hikari.interactions import (
+    AutocompleteInteraction,
+    CommandInteraction,
+    ComponentInteraction,
+    ModalInteraction,
+    PartialInteraction,
+    ResponseType,
+)
+from hikari.messages import MessageFlag
+from hikari.undefined import UNDEFINED
+
+from kumo.internal.phases import phase
 
 if TYPE_CHECKING:
-    from hikari.api import ComponentBuilder
+    from hikari.api import ComponentBuilder, InteractionResponseBuilder
     from hikari.channels import TextableGuildChannel
     from hikari.embeds import Embed
     from hikari.files import Resourceish
     from hikari.guilds import GatewayGuild, PartialRole
-    from hikari.interactions import CommandInteraction, InteractionMember, PartialInteraction
+    from hikari.interactions import InteractionMember
+    from hikari.messages import Message
     from hikari.snowflakes import SnowflakeishSequence
-    from hikari.traits import GatewayBotAware
-    from hikari.undefined import UNDEFINED, UndefinedOr
+    from hikari.traits import GatewayBotAware, RESTBotAware
+    from hikari.undefined import UndefinedOr
     from hikari.users import PartialUser, User
 
+    from kumo.commands.options import Choice
     from kumo.i18n.abc.ilocalization_provider import ILocalizationProvider
+    from kumo.i18n.templates import Translator
+    from kumo.i18n.types import Localized
+    from kumo.progress import ProgressEditor
+    from kumo.tracing.abc import ISpan, ITracer
 
-__all__: Sequence[str] = ("CommandInteractionContext",)
+__all__: Sequence[str] = (
+    "CommandInteractionContext",
+    "AutocompleteInteractionContext",
+    "ComponentInteractionContext",
+    "ModalInteractionContext",
+)
 
 T = TypeVar("T", bound=PartialInteraction)
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class InteractionContext(Generic[T]):
-    bot: GatewayBotAware = attrs.field(repr=False, eq=False)
+    bot: GatewayBotAware | RESTBotAware = attrs.field(repr=False, eq=False)
     interaction: T = attrs.field(repr=True, eq=True)
 
     i18n: ILocalizationProvider | None = attrs.field(default=None, repr=False, eq=False)
+    translator: Translator | None = attrs.field(default=None, repr=False, eq=False)
+    response_future: asyncio.Future[InteractionResponseBuilder] | None = attrs.field(
+        default=None, repr=False, eq=False
+    )
+    """Future of the initial response of an interaction received over HTTP, it is sent in the HTTP reply."""
+    tracer: ITracer | None = attrs.field(default=None, repr=False, eq=False)
+    span: ISpan | None = attrs.field(default=None, repr=False, eq=False)
+    """Span of the interaction, responses are traced as its children.
+
+    Handlers set it with the tracer after creating the context of a traced interaction, so the
+    contexts of untraced ones are created with fewer arguments.
+    """
+    on_response: Callable[[Mapping[str, Any]], None] | None = attrs.field(default=None, repr=False, eq=False)
+    """Called with the arguments of every ``defer``, ``create_response`` and ``edit_response``, e.g. for caching."""
+
+    created_at: float = attrs.field(factory=time.monotonic, init=False, repr=False, eq=False)
+    responded_at: float | None = attrs.field(default=None, init=False, repr=False, eq=False)
+    """Monotonic time of the first response, if there was one."""
+    responded: bool = attrs.field(default=False, init=False, repr=False, eq=False)
+    deferred: bool = attrs.field(default=False, init=False, repr=False, eq=False)
+    edited: bool = attrs.field(default=False, init=False, repr=False, eq=False)
+    """Whether the response was edited, a deferred one is no longer pending then."""
+    _response_lock: asyncio.Lock | None = attrs.field(default=None, init=False, repr=False, eq=False)
+    _locales: tuple[str, ...] | None = attrs.field(default=None, init=False, repr=False, eq=False)
+
+    @property
+    def response_lock(self) -> asyncio.Lock:
+        """Lock serializing the responses, made on first use as most interactions respond only once."""
+        if self._response_lock is None:
+            self._response_lock = asyncio.Lock()
+        return self._response_lock
+
+    @property
+    def locales(self) -> tuple[str, ...]:
+        """Locales to translate responses into, resolved from the interaction once."""
+        if self._locales is None:
+            from kumo.i18n.templates import get_locale_chain
+
+            self._locales = get_locale_chain(
+                getattr(self.interaction, "locale", None), getattr(self.interaction, "guild_locale", None)
+            )
+        return self._locales
+
+    def translate(self, value: Localized | str, /, **values: Any) -> str:
+        """Translate the key into the locale of the interaction and fill the placeholders with ``values``.
+
+        Without a translator the fallback of a :class:`~kumo.i18n.types.Localized` value is used as the
+        template. Plain strings are not translated, and without ``values`` they are returned as is.
+        """
+        if self.translator is not None:
+            return self.translator.translate(value, self.locales, values)
+        from kumo.i18n.templates import parse_template, render_string
+
+        if isinstance(value, str):
+            return render_string(value, values)
+        return parse_template(value.fallback).render(values)
 
     async def defer(self, flags: MessageFlag = MessageFlag.NONE, *, ephemeral: bool = False) -> None:
         if ephemeral:
             flags |= MessageFlag.EPHEMERAL
-        return await self.bot.rest.create_interaction_response(
-            interaction=self.interaction.id,
-            token=self.interaction.token,
-            flags=flags,
-            response_type=ResponseType.DEFERRED_MESSAGE_CREATE,
-        )
+        if self.on_response is not None:
+            self.on_response({"flags": flags})
+        with phase(self.tracer, self.span, "defer"):
+            await self._defer(ResponseType.DEFERRED_MESSAGE_CREATE, flags)
+
+    async def _defer(self, response_type: ResponseType, flags: MessageFlag) -> None:
+        async with self.response_lock:
+            if self.responded:
+                return
+            if self.response_future is not None:
+                self.response_future.set_result(InteractionDeferredBuilder(response_type, flags=flags))
+            else:
+                await self.bot.rest.create_interaction_response(
+                    interaction=self.interaction.id,
+                    token=self.interaction.token,
+                    flags=flags,
+                    response_type=response_type,
+                )
+            self.responded = self.deferred = True
+            self.responded_at = time.monotonic()
 
     async def create_response(
         self,
@@ -59,20 +157,134 @@ class InteractionContext(Generic[T]):
         user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
         role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
     ) -> None:
-        if ephemeral:
-            flags |= MessageFlag.EPHEMERAL
-        return await self.bot.rest.create_interaction_response(
-            interaction=self.interaction.id,
-            response_type=ResponseType.MESSAGE_CREATE,
-            token=self.interaction.token,
-            content=content,
+        if self.on_response is not None:
+            self.on_response(
+                {
+                    "content": content,
+                    "flags": flags,
+                    "ephemeral": ephemeral,
+                    "attachment": attachment,
+                    "attachments": attachments,
+                    "component": component,
+                    "components": components,
+                    "embed": embed,
+                    "embeds": embeds,
+                    "mentions_everyone": mentions_everyone,
+                    "user_mentions": user_mentions,
+                    "role_mentions": role_mentions,
+                }
+            )
+        with phase(self.tracer, self.span, "create_response"):
+            await self._create_response(
+                ResponseType.MESSAGE_CREATE,
+                content,
+                flags=flags,
+                ephemeral=ephemeral,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+
+    async def _create_response(
+        self,
+        response_type: ResponseType,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        flags: MessageFlag = MessageFlag.NONE,
+        ephemeral: bool = False,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        mentions_everyone: UndefinedOr[bool] = UNDEFINED,
+        user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
+        role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
+    ) -> None:
+        async with self.response_lock:
+            if self.deferred:
+                # The interaction was already acknowledged, so the response can only be edited now.
+                await self.bot.rest.edit_interaction_response(
+                    application=self.interaction.application_id,
+                    token=self.interaction.token,
+                    content=content,
+                    attachment=attachment,
+                    attachments=attachments,
+                    component=component,
+                    components=components,
+                    embed=embed,
+                    embeds=embeds,
+                    mentions_everyone=mentions_everyone,
+                    user_mentions=user_mentions,
+                    role_mentions=role_mentions,
+                )
+                self.edited = True
+                return
+            if ephemeral:
+                flags |= MessageFlag.EPHEMERAL
+            if self.response_future is not None:
+                self.response_future.set_result(
+                    self._build_response(
+                        response_type,
+                        content,
+                        flags=flags,
+                        attachments=[attachment] if attachment else attachments,
+                        components=[component] if component else components,
+                        embeds=[embed] if embed else embeds,
+                        mentions_everyone=mentions_everyone,
+                        user_mentions=user_mentions,
+                        role_mentions=role_mentions,
+                    )
+                )
+                self.responded = True
+                self.responded_at = time.monotonic()
+                return
+            await self.bot.rest.create_interaction_response(
+                interaction=self.interaction.id,
+                response_type=response_type,
+                token=self.interaction.token,
+                content=content,
+                flags=flags,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+            self.responded = True
+            self.responded_at = time.monotonic()
+
+    @staticmethod
+    def _build_response(
+        response_type: ResponseType,
+        content: UndefinedOr[Any],
+        *,
+        flags: MessageFlag,
+        attachments: UndefinedOr[Sequence[Resourceish]],
+        components: UndefinedOr[Sequence[ComponentBuilder]],
+        embeds: UndefinedOr[Sequence[Embed]],
+        mentions_everyone: UndefinedOr[bool],
+        user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool],
+        role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool],
+    ) -> InteractionMessageBuilder:
+        return InteractionMessageBuilder(
+            response_type,  # type: ignore
+            content=str(content) if content is not UNDEFINED else UNDEFINED,
             flags=flags,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
+            attachments=list(attachments) if attachments else UNDEFINED,
+            components=list(components) if components else UNDEFINED,
+            embeds=list(embeds) if embeds else UNDEFINED,
             mentions_everyone=mentions_everyone,
             user_mentions=user_mentions,
             role_mentions=role_mentions,
@@ -89,22 +301,66 @@ class InteractionContext(Generic[T]):
         embed: UndefinedOr[Embed] = UNDEFINED,
         embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
     ) -> Message | None:
-        return await self.bot.rest.edit_interaction_response(
-            application=self.interaction.application_id,
-            token=self.interaction.token,
-            content=content,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
-        )
+        if self.on_response is not None:
+            self.on_response(
+                {
+                    "content": content,
+                    "attachment": attachment,
+                    "attachments": attachments,
+                    "component": component,
+                    "components": components,
+                    "embed": embed,
+                    "embeds": embeds,
+                }
+            )
+        with phase(self.tracer, self.span, "edit_response"):
+            message = await self.bot.rest.edit_interaction_response(
+                application=self.interaction.application_id,
+                token=self.interaction.token,
+                content=content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+            )
+        self.edited = True
+        return message
+
+    def progress(self, *, interval: float = 1.0) -> ProgressEditor:
+        """Make an editor streaming progress into the response, with at most one edit per ``interval`` seconds."""
+        from kumo.progress import ProgressEditor
+
+        return ProgressEditor(self, interval=interval)
+
+    async def send_embeds(
+        self, embeds: Sequence[Embed], *, flags: MessageFlag = MessageFlag.NONE, ephemeral: bool = False
+    ) -> None:
+        """Send the embeds in as few messages as possible, the first one is the response if there is none yet.
+
+        A deferred response which was not edited yet is edited into the first message.
+        """
+        from kumo.progress import batch_embeds
+
+        batches = batch_embeds(embeds)
+        if batches and self.deferred and not self.edited:
+            await self.edit_response(embeds=batches.pop(0))
+        elif batches and not self.responded:
+            await self.create_response(embeds=batches.pop(0), flags=flags, ephemeral=ephemeral)
+        if ephemeral:
+            flags |= MessageFlag.EPHEMERAL
+        with phase(self.tracer, self.span, "send_embeds"):
+            for batch in batches:
+                await self.bot.rest.execute_webhook(
+                    self.interaction.application_id, self.interaction.token, embeds=batch, flags=flags
+                )
 
     async def delete_response(self) -> None:
-        await self.bot.rest.delete_interaction_response(
-            application=self.interaction.application_id, token=self.interaction.token
-        )
+        with phase(self.tracer, self.span, "delete_response"):
+            await self.bot.rest.delete_interaction_response(
+                application=self.interaction.application_id, token=self.interaction.token
+            )
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -124,3 +380,135 @@ class CommandInteractionContext(InteractionContext[CommandInteraction]):
     @property
     def channel(self) -> TextableGuildChannel | None:
         return self.interaction.get_channel()
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class AutocompleteInteractionContext(InteractionContext[AutocompleteInteraction]):
+    focused: str = attrs.field(default="", repr=True, eq=False)
+    """Name of the option being typed."""
+    options: dict[str, Any] = attrs.field(factory=dict, repr=False, eq=False)
+    """Values of the options of the invoked command, sub command or sub command of a group by their names."""
+
+    @property
+    def user(self) -> User:
+        return self.interaction.user
+
+    @property
+    def member(self) -> InteractionMember | None:
+        return self.interaction.member
+
+    @property
+    def guild(self) -> GatewayGuild | None:
+        return self.interaction.get_guild()
+
+    def build_choices(self, choices: Sequence[Choice]) -> list[AutocompleteChoiceBuilder]:
+        """Build choices named in the locale of the interaction."""
+        return [
+            AutocompleteChoiceBuilder(
+                name=self.translate(choice.display_name) if choice.display_name else choice.name, value=choice.value
+            )
+            for choice in choices
+        ]
+
+    async def respond(self, choices: Sequence[Choice]) -> None:
+        with phase(self.tracer, self.span, "respond"):
+            async with self.response_lock:
+                if self.responded:
+                    return
+                builders = self.build_choices(choices)
+                if self.response_future is not None:
+                    self.response_future.set_result(self.interaction.build_response(builders))
+                else:
+                    await self.interaction.create_response(builders)
+                self.responded = True
+                self.responded_at = time.monotonic()
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class ComponentInteractionContext(InteractionContext[ComponentInteraction]):
+    @property
+    def user(self) -> User:
+        return self.interaction.user
+
+    @property
+    def member(self) -> InteractionMember | None:
+        return self.interaction.member
+
+    @property
+    def guild(self) -> GatewayGuild | None:
+        return self.interaction.get_guild()
+
+    @property
+    def channel(self) -> TextableGuildChannel | None:
+        return self.interaction.get_channel()
+
+    @property
+    def message(self) -> Message:
+        """Message the component is attached to."""
+        return self.interaction.message
+
+    @property
+    def values(self) -> Sequence[str]:
+        """Selected values of a select menu."""
+        return self.interaction.values
+
+    async def defer_update(self) -> None:
+        """Acknowledge the interaction without a new message, the message of the component is edited later."""
+        with phase(self.tracer, self.span, "defer"):
+            await self._defer(ResponseType.DEFERRED_MESSAGE_UPDATE, MessageFlag.NONE)
+
+    async def update_message(
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+    ) -> None:
+        """Edit the message of the component as the response."""
+        with phase(self.tracer, self.span, "update_message"):
+            await self._create_response(
+                ResponseType.MESSAGE_UPDATE,
+                content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+            )
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class ModalInteractionContext(InteractionContext[ModalInteraction]):
+    _values: dict[str, str] | None = attrs.field(default=None, init=False, repr=False, eq=False)
+
+    @property
+    def user(self) -> User:
+        return self.interaction.user
+
+    @property
+    def member(self) -> InteractionMember | None:
+        return self.interaction.member
+
+    @property
+    def guild(self) -> GatewayGuild | None:
+        return self.interaction.get_guild()
+
+    @property
+    def channel(self) -> TextableGuildChannel | None:
+        return self.interaction.get_channel()
+
+    @property
+    def values(self) -> dict[str, str]:
+        """Submitted values of the text inputs by their custom IDs."""
+        if self._values is None:
+            self._values = {
+                component.custom_id: component.value
+                for row in self.interaction.components
+                for component in row.components
+            }
+        return self._values
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
-from .commands_events import CommandCallbackErrorEvent
+from kumo.internal.lazy import lazy_exports
 
-__all__: Sequence[str] = ("CommandCallbackErrorEvent",)
+if TYPE_CHECKING:
+    from kumo.events.commands_events import CommandCallbackErrorEvent, CommandTimeoutEvent
+    from kumo.events.components_events import ComponentCallbackErrorEvent
+
+__all__: Sequence[str] = ("CommandCallbackErrorEvent", "CommandTimeoutEvent", "ComponentCallbackErrorEvent")
+
+_EXPORTS: Mapping[str, str] = {
+    "CommandCallbackErrorEvent": "kumo.events.commands_events",
+    "CommandTimeoutEvent": "kumo.events.commands_events",
+    "ComponentCallbackErrorEvent": "kumo.events.components_events",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
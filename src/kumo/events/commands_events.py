@@ -7,8 +7,15 @@ import attrs
 from kumo.context import CommandInteractionContext
 from kumo.events.interaction_events import InteractionExceptionEvent
 
-__all__: Sequence[str] = ("CommandCallbackErrorEvent",)
+__all__: Sequence[str] = ("CommandCallbackErrorEvent", "CommandTimeoutEvent")
 
 
 @attrs.define(kw_only=True, weakref_slot=False, slots=False)
 class CommandCallbackErrorEvent(InteractionExceptionEvent[CommandInteractionContext]): ...
+
+
+@attrs.define(kw_only=True, weakref_slot=False, slots=False)
+class CommandTimeoutEvent(InteractionExceptionEvent[CommandInteractionContext]):
+    """The callback of a command was cancelled after running for ``timeout`` seconds."""
+
+    timeout: float = attrs.field()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import attrs
+
+from kumo.context import ComponentInteractionContext, ModalInteractionContext
+from kumo.events.interaction_events import InteractionExceptionEvent
+
+__all__: Sequence[str] = ("ComponentCallbackErrorEvent",)
+
+
+@attrs.define(kw_only=True, weakref_slot=False, slots=False)
+class ComponentCallbackErrorEvent(
+    InteractionExceptionEvent[ComponentInteractionContext | ModalInteractionContext]  # type: ignore
+): ...
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 import attrs
 from hikari.events import Event
 from hikari.interactions import PartialInteraction
-from hikari.traits import RESTAware
 
 from kumo.context import InteractionContext
 from kumo.events.base_events import ExceptionEvent
 
+if TYPE_CHECKING:
+    from hikari.traits import RESTAware
+
 __all__: Sequence[str] = ("InteractionEvent", "InteractionExceptionEvent")
 
 T = TypeVar("T", bound=InteractionContext[PartialInteraction])
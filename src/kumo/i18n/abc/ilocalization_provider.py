@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from hikari.locales import Locale
+if TYPE_CHECKING:
+    from hikari.locales import Locale
 
-from kumo.i18n.types import Localized
+    from kumo.i18n.types import Localized
 
 __all__: Sequence[str] = ("ILocalizationProvider",)
 
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hikari.locales import Locale
+
+    from kumo.i18n.abc import ILocalizationProvider
+    from kumo.i18n.types import Localized
+
+__all__: Sequence[str] = ("CachedLocalizationProvider",)
+
+_LOGGER = getLogger("kumo.i18n.cache")
+
+
+class CachedLocalizationProvider:
+    """Localization provider which memoizes results of another provider by the localized key.
+
+    The cache is invalidated by :meth:`reload`, or whenever the wrapped provider exposes a ``revision``
+    attribute and its value changes, so providers reloading their catalogs on their own can bump it.
+    """
+
+    __slots__: Sequence[str] = ("_cache", "_revision", "provider", "hits", "misses")
+
+    def __init__(self, provider: ILocalizationProvider) -> None:
+        self._cache: dict[str, tuple[Mapping[Locale | str, str], str]] = {}
+        self._revision: Any = getattr(provider, "revision", None)
+
+        self.provider: ILocalizationProvider = provider
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def localize(self, value: Localized) -> tuple[Mapping[Locale | str, str], str]:
+        if (revision := getattr(self.provider, "revision", None)) != self._revision:
+            _LOGGER.debug("provider revision changed, invalidating cache")
+            self._revision = revision
+            self._cache.clear()
+        if (result := self._cache.get(value.key)) is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self._cache[value.key] = self.provider.localize(value)
+        return result
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def reload(self) -> None:
+        """Reload the wrapped provider, if it supports it, and invalidate the cache."""
+        if reload := getattr(self.provider, "reload", None):
+            reload()
+        self._revision = getattr(self.provider, "revision", None)
+        self.invalidate()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tomllib
+from collections.abc import Iterator, Mapping, Sequence
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from kumo.i18n.types import Localized
+
+__all__: Sequence[str] = ("compile_catalog", "CatalogLocalizationProvider")
+
+_LOGGER = getLogger("kumo.i18n.catalog")
+
+# Layout: header, locale entries, key entries sorted by key, key_count * locale_count value entries, strings.
+# Every entry is an (offset, length) pair into the strings block, a missing value has the length of _MISSING.
+_MAGIC: bytes = b"KUMOCAT1"
+_HEADER = struct.Struct("<8sIII")
+_ENTRY = struct.Struct("<II")
+_MISSING: int = 0xFFFFFFFF
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> Iterator[tuple[str, str]]:
+    for key, value in data.items():
+        if isinstance(value, Mapping):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", str(value)
+
+
+def _load_source(path: Path) -> Mapping[str, Any]:
+    if path.suffix == ".toml":
+        return tomllib.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compile_catalog(source: str | PathLike[str], output: str | PathLike[str]) -> None:
+    """Compile a directory of source catalogs into a binary catalog file.
+
+    Every ``<locale>.json`` or ``<locale>.toml`` file in ``source`` holds translations of one locale,
+    nested tables are flattened into dotted keys.
+    """
+    catalogs: dict[str, dict[str, str]] = {}
+    for path in sorted(Path(source).iterdir()):
+        if path.suffix in (".json", ".toml"):
+            catalogs[path.stem] = dict(_flatten(_load_source(path)))
+    locales = sorted(catalogs)
+    keys = sorted({key.encode() for catalog in catalogs.values() for key in catalog})
+
+    strings = bytearray()
+    interned: dict[bytes, tuple[int, int]] = {}
+
+    def add_string(value: bytes) -> tuple[int, int]:
+        if (entry := interned.get(value)) is None:
+            entry = interned[value] = (len(strings), len(value))
+            strings.extend(value)
+        return entry
+
+    locale_entries = [add_string(locale.encode()) for locale in locales]
+    key_entries = [add_string(key) for key in keys]
+    value_entries: list[tuple[int, int]] = []
+    for key in keys:
+        for locale in locales:
+            value = catalogs[locale].get(key.decode())
+            value_entries.append(add_string(value.encode()) if value is not None else (0, _MISSING))
+
+    strings_offset = _HEADER.size + _ENTRY.size * (len(locale_entries) + len(key_entries) + len(value_entries))
+    data = bytearray(_HEADER.pack(_MAGIC, len(locales), len(keys), strings_offset))
+    for offset, length in (*locale_entries, *key_entries, *value_entries):
+        data.extend(_ENTRY.pack(offset, length))
+    data.extend(strings)
+
+    output = Path(output)
+    temp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    temp.write_bytes(data)
+    os.replace(temp, output)
+    _LOGGER.debug("compiled %s keys in %s locales into %s", len(keys), len(locales), output)
+
+
+class CatalogLocalizationProvider:
+    """Localization provider reading a compiled catalog through a read-only memory map.
+
+    Nothing is copied into dictionaries on load, keys are found by binary search over the sorted
+    index, so forked workers share the catalog pages. The fallback is the value of
+    ``default_locale`` if it is set and translated, otherwise the fallback of the localized value.
+    """
+
+    __slots__: Sequence[str] = (
+        "_mmap",
+        "_locales",
+        "_row",
+        "_key_count",
+        "_keys_offset",
+        "_values_offset",
+        "_strings_offset",
+        "path",
+        "default_locale",
+        "revision",
+    )
+
+    def __init__(self, path: str | PathLike[str], *, default_locale: str | None = None) -> None:
+        self._mmap: mmap.mmap | None = None
+        self._locales: tuple[str, ...] = ()
+        self._row: struct.Struct = struct.Struct("<")
+        self._key_count: int = 0
+        self._keys_offset: int = 0
+        self._values_offset: int = 0
+        self._strings_offset: int = 0
+
+        self.path: Path = Path(path)
+        self.default_locale: str | None = default_locale
+        self.revision: int = 0
+        self.reload()
+
+    @property
+    def locales(self) -> Sequence[str]:
+        return self._locales
+
+    def reload(self) -> None:
+        """Map the catalog file again, e.g. after it was recompiled."""
+        with self.path.open("rb") as file:
+            # Empty files cannot be mapped, and a short one would fail on its first lookup instead.
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size or not header.startswith(_MAGIC):
+                raise ValueError(f"{self.path} is not a compiled catalog")
+            _, locale_count, key_count, strings_offset = _HEADER.unpack(header)
+            index_size = _ENTRY.size * (locale_count + key_count + key_count * locale_count)
+            if strings_offset != _HEADER.size + index_size or os.fstat(file.fileno()).st_size < strings_offset:
+                raise ValueError(f"{self.path} is a truncated or corrupted catalog, compile it again")
+            view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = view
+        self._key_count = key_count
+        self._strings_offset = strings_offset
+        self._keys_offset = _HEADER.size + _ENTRY.size * locale_count
+        self._values_offset = self._keys_offset + _ENTRY.size * key_count
+        self._locales = tuple(
+            self._read_string(*_ENTRY.unpack_from(view, _HEADER.size + _ENTRY.size * index)).decode()
+            for index in range(locale_count)
+        )
+        # Value entries of a key are adjacent, so they are read with a single unpack.
+        self._row = struct.Struct("<" + "II" * locale_count)
+        self.revision += 1
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _read_string(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        return self._mmap[start : start + length]  # type: ignore
+
+    def _find(self, key: bytes) -> int:
+        view, keys_offset = self._mmap, self._keys_offset
+        low, high = 0, self._key_count
+        while low < high:
+            middle = (low + high) // 2
+            current = self._read_string(*_ENTRY.unpack_from(view, keys_offset + _ENTRY.size * middle))  # type: ignore
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def get(self, key: str) -> Mapping[str, str]:
+        """Return translations of the key by locale."""
+        if (index := self._find(key.encode())) < 0:
+            return {}
+        row = self._row.unpack_from(self._mmap, self._values_offset + self._row.size * index)  # type: ignore
+        return {
+            locale: self._read_string(row[position], row[position + 1]).decode()
+            for position, locale in zip(range(0, len(row), 2), self._locales, strict=True)
+            if row[position + 1] != _MISSING
+        }
+
+    def localize(self, value: Localized) -> tuple[Mapping[str, str], str]:
+        translations = self.get(value.key)
+        if self.default_locale is not None and (fallback := translations.get(self.default_locale)) is not None:
+            return translations, fallback
+        return translations, value.fallback
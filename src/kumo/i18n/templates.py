@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Mapping, Sequence
+from logging import getLogger
+from string import Formatter
+from typing import TYPE_CHECKING, Any
+
+from kumo.i18n.types import Localized
+
+if TYPE_CHECKING:
+    from hikari.locales import Locale
+
+    from kumo.i18n.abc import ILocalizationProvider
+
+__all__: Sequence[str] = ("Template", "Translator", "get_locale_chain", "parse_template", "render_string")
+
+_LOGGER = getLogger("kumo.i18n.templates")
+_FORMATTER = Formatter()
+
+
+class Template:
+    """Message template with named ``str.format`` placeholders, parsed once on creation.
+
+    Templates without placeholders are unescaped up front and render to the same string.
+    """
+
+    __slots__: Sequence[str] = ("source", "fields", "_format", "_literal")
+
+    def __init__(self, source: str) -> None:
+        fields: list[str] = []
+        for _, name, _, _ in _FORMATTER.parse(source):
+            if name is None:
+                continue
+            if not name or name[0].isdigit():
+                raise ValueError(f"template {source!r} uses a positional placeholder, name it instead")
+            fields.append(name)
+
+        self.source: str = source
+        self.fields: tuple[str, ...] = tuple(fields)
+        self._format = source.format_map
+        self._literal: str | None = None if fields else source.format()
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        if self._literal is not None:
+            return self._literal
+        return self._format(values)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_template(source: str) -> Template:
+    """Return the template of ``source``, parsed templates are shared and the least recently used are dropped."""
+    return Template(source)
+
+
+def render_string(source: str, values: Mapping[str, Any]) -> str:
+    """Render a plain string, which is not a translation key.
+
+    Without values it is returned as is, so strings with braces, such as user input, are safe to pass.
+    """
+    if not values:
+        return source
+    return parse_template(source).render(values)
+
+
+def get_locale_chain(locale: Locale | str | None, guild_locale: Locale | str | None = None) -> tuple[str, ...]:
+    """Return locales to look a translation up in, from the most to the least specific.
+
+    ``pt-BR`` in a ``de`` guild becomes ``("pt-BR", "pt", "de")``.
+    """
+    chain: list[str] = []
+    for item in (locale, guild_locale):
+        if not item:
+            continue
+        for candidate in (str(item), str(item).partition("-")[0]):
+            if candidate not in chain:
+                chain.append(candidate)
+    return tuple(chain)
+
+
+class Translator:
+    """Translates keys into compiled templates of the first available locale of a locale chain.
+
+    A locale falls back to its language, then to any regional variant of that language, and
+    finally to the fallback of the provider. Templates are cached by the key and the chain, so
+    repeated translations cost one lookup and one render. The cache follows the ``revision`` of
+    the provider, like :class:`~kumo.i18n.cache.CachedLocalizationProvider` does.
+
+    Only :class:`~kumo.i18n.types.Localized` values are keys, plain strings are rendered by
+    :func:`render_string` and never reach the provider or the cache.
+    """
+
+    __slots__: Sequence[str] = ("_templates", "_revision", "provider")
+
+    def __init__(self, provider: ILocalizationProvider) -> None:
+        self._templates: dict[tuple[str, tuple[str, ...]], Template] = {}
+        self._revision: Any = getattr(provider, "revision", None)
+
+        self.provider: ILocalizationProvider = provider
+
+    def get_template(self, value: Localized, locales: tuple[str, ...]) -> Template:
+        if (revision := getattr(self.provider, "revision", None)) != self._revision:
+            _LOGGER.debug("provider revision changed, invalidating templates")
+            self._revision = revision
+            self._templates.clear()
+        if (template := self._templates.get((value.key, locales))) is not None:
+            return template
+        translations, fallback = self.provider.localize(value)
+        template = self._templates[value.key, locales] = parse_template(self._select(translations, locales, fallback))
+        return template
+
+    def translate(self, value: Localized | str, locales: tuple[str, ...], values: Mapping[str, Any]) -> str:
+        if not isinstance(value, Localized):
+            return render_string(value, values)
+        return self.get_template(value, locales).render(values)
+
+    def invalidate(self) -> None:
+        self._templates.clear()
+
+    @staticmethod
+    def _select(translations: Mapping[Locale | str, str], locales: tuple[str, ...], fallback: str) -> str:
+        for locale in locales:
+            if (translation := translations.get(locale)) is not None:
+                return translation
+            for available, translation in translations.items():
+                if str(available).partition("-")[0] == locale:
+                    return translation
+        return fallback
@@ -1,5 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
-__all__: Sequence[str] = ()
+from kumo.internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kumo.impl.command_handler import CommandHandler
+    from kumo.impl.gateway_bot import GatewayBot
+    from kumo.impl.interaction_scheduler import InteractionScheduler
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.impl.sharded_runner import ShardedRunner
+
+__all__: Sequence[str] = ("GatewayBot", "RESTBot", "ShardedRunner", "CommandHandler", "InteractionScheduler")
+
+_EXPORTS: Mapping[str, str] = {
+    "GatewayBot": "kumo.impl.gateway_bot",
+    "RESTBot": "kumo.impl.rest_bot",
+    "ShardedRunner": "kumo.impl.sharded_runner",
+    "CommandHandler": "kumo.impl.command_handler",
+    "InteractionScheduler": "kumo.impl.interaction_scheduler",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -4,19 +4,22 @@ from collections.abc import Generator, Mapping, Sequence
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from hikari import api
 from hikari.commands import CommandChoice, CommandOption, CommandType, OptionType
 
-from kumo.commands.metadata import MessageCommandMetadata, SlashCommandMetadata, SubCommandMetadata, UserCommandMetadata
-from kumo.commands.options import Choice, Option
+from kumo.commands.base import Command, SubCommand
+from kumo.commands.metadata import MessageCommandMetadata, SlashCommandMetadata, UserCommandMetadata
+from kumo.i18n.cache import CachedLocalizationProvider
 from kumo.i18n.types import Localized
 from kumo.internal.consts import DEFAULT_DESCRIPTION, GROUP_DESCRIPTION
 
 if TYPE_CHECKING:
+    from hikari import api
     from hikari.locales import Locale
     from hikari.traits import RESTAware
 
-    from kumo.commands.base import Command, CommandGroup, SubCommand, SubCommandGroup
+    from kumo.commands.base import CommandGroup, SubCommandGroup
+    from kumo.commands.metadata import SubCommandMetadata
+    from kumo.commands.options import Choice, Option
     from kumo.commands.types import CommandT
     from kumo.i18n.abc import ILocalizationProvider
 
@@ -30,7 +33,10 @@ class CommandBuilder:
 
     def __init__(self, bot: RESTAware, *, i18n: ILocalizationProvider | None = None) -> None:
         self.bot = bot
-        self.i18n: ILocalizationProvider | None = i18n
+        # Shared keys (common option names, choices) are met over and over while building, so resolve each once.
+        if i18n is not None and not isinstance(i18n, CachedLocalizationProvider):
+            i18n = CachedLocalizationProvider(i18n)
+        self.i18n: CachedLocalizationProvider | None = i18n
 
     def build_localized(self, localized: Localized) -> tuple[Mapping[Locale | str, str], str]:
         if not self.i18n:
@@ -61,6 +67,7 @@ class CommandBuilder:
             min_length=option.min_length,
             max_length=option.max_length,
             channel_types=option.channel_types,
+            autocomplete=option.autocomplete is not None,
             name_localizations=self.build_localized(option.display_name)[0] if option.display_name else {},
             description_localizations=description_localizations,  # type: ignore
         )
@@ -99,12 +106,14 @@ class CommandBuilder:
 
         return builder
 
+    def build_command_or_group(self, command: CommandT) -> api.CommandBuilder:
+        if isinstance(command, Command):
+            return self.build_command(command)
+        return self.build_command_group(command)
+
     def build_commands(self, commands: Sequence[CommandT]) -> Generator[api.CommandBuilder]:
         for command in commands:
-            if isinstance(command, Command):
-                yield self.build_command(command)
-            else:
-                yield self.build_command_group(command)
+            yield self.build_command_or_group(command)
 
     def build_sub_command(self, metadata: SubCommandMetadata) -> CommandOption:
         if isinstance(metadata.description, Localized):
@@ -125,7 +134,7 @@ class CommandBuilder:
             type=OptionType.SUB_COMMAND_GROUP,
             name=group.metadata.name,
             description=GROUP_DESCRIPTION,
-            options=[self.build_sub_command(sub_command.metadata) for sub_command in group.commands],
+            options=[self.build_sub_command(sub_command.metadata) for sub_command in group.commands.values()],
             name_localizations=self.build_localized(group.metadata.display_name)[0] if group.metadata.display_name else {},
         )
 
@@ -1,49 +1,159 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Sequence
+import hashlib
+import math
+import time
+from collections.abc import Mapping, Sequence
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
-from hikari.commands import CommandType, OptionType
-from hikari.events import InteractionCreateEvent
-from hikari.interactions import CommandInteraction
+from hikari.commands import CommandType
+from hikari.interactions import AutocompleteInteraction, CommandInteraction
+from hikari.snowflakes import Snowflake
 
-from kumo.commands.base import Command
 from kumo.commands.exceptions import CommandNotFoundException
-from kumo.commands.utils import resolve_argument, unpack_resolved_data
-from kumo.context import CommandInteractionContext
-from kumo.events import CommandCallbackErrorEvent
+from kumo.commands.metadata import ApplicationMetadata
+from kumo.context import AutocompleteInteractionContext, CommandInteractionContext
+from kumo.events.commands_events import CommandCallbackErrorEvent, CommandTimeoutEvent
 from kumo.impl.command_builder import CommandBuilder
+from kumo.impl.command_router import CommandRouter, get_route_key
+from kumo.impl.command_snapshot import CommandSnapshot
+from kumo.impl.command_syncer import CommandSyncer
+from kumo.impl.interaction_scheduler import InteractionScheduler
+from kumo.internal.phases import phase
 
 if TYPE_CHECKING:
     from asyncio.events import AbstractEventLoop
+    from os import PathLike
 
-    from hikari.snowflakes import Snowflake
-    from hikari.traits import GatewayBotAware
+    from hikari.api import InteractionResponseBuilder
+    from hikari.events import InteractionCreateEvent
+    from hikari.guilds import PartialGuild
+    from hikari.interactions import CommandInteractionOption
+    from hikari.snowflakes import SnowflakeishOr, SnowflakeishSequence
+    from hikari.traits import GatewayBotAware, RESTBotAware
 
-    from kumo.commands.types import CommandCallbackT, CommandT
+    from kumo.commands.abc import ICooldownStore
+    from kumo.commands.cooldowns import Cooldown
+    from kumo.commands.options import Choice
+    from kumo.commands.types import CommandT, TimeoutHookT
     from kumo.i18n.abc import ILocalizationProvider
+    from kumo.i18n.types import Localized
+    from kumo.i18n.templates import Translator
+    from kumo.impl.command_loader import CommandLoader
+    from kumo.impl.command_router import Route
+    from kumo.impl.command_syncer import SyncResult
+    from kumo.impl.interaction_scheduler import DrainResult
+    from kumo.metrics.registry import MetricsRegistry
+    from kumo.tracing.abc import ISpan, ITracer
 
 __all__: Sequence[str] = ()
 
 _LOGGER = getLogger("kumo.commands")
 
+_TIMEOUT_HOOK_DEADLINE: float = 5.0
+"""Seconds the timeout hook may take to reply, it must not hang like the callback did."""
+
 
 class CommandHandler:
-    __slots__: Sequence[str] = ("_commands", "_loop", "bot", "i18n", "builder", "commands")
+    __slots__: Sequence[str] = (
+        "_commands",
+        "_index",
+        "_loop",
+        "_sync_task",
+        "bot",
+        "i18n",
+        "translator",
+        "builder",
+        "syncer",
+        "incremental_sync",
+        "snapshot_path",
+        "default_guild",
+        "guild_sync_concurrency",
+        "router",
+        "scheduler",
+        "drain_timeout",
+        "auto_defer",
+        "metrics",
+        "tracer",
+        "manifest_path",
+        "warm_up_delay",
+        "_loader",
+        "_cooldown_store",
+        "callback_timeout",
+        "on_timeout",
+        "error_message",
+        "_ids",
+    )
 
     def __init__(
-        self, bot: GatewayBotAware, *, i18n: ILocalizationProvider | None = None, loop: AbstractEventLoop | None = None
+        self,
+        bot: GatewayBotAware | RESTBotAware,
+        *,
+        i18n: ILocalizationProvider | None = None,
+        loop: AbstractEventLoop | None = None,
+        incremental_sync: bool = False,
+        snapshot_path: str | PathLike[str] | None = None,
+        default_guild: SnowflakeishOr[PartialGuild] | None = None,
+        guild_sync_concurrency: int = 10,
+        scheduler: InteractionScheduler | None = None,
+        drain_timeout: float | None = 10.0,
+        auto_defer: float | None = None,
+        metrics: MetricsRegistry | None = None,
+        tracer: ITracer | None = None,
+        manifest_path: str | PathLike[str] | None = None,
+        warm_up_delay: float | None = None,
+        cooldown_store: ICooldownStore | None = None,
+        callback_timeout: float | None = None,
+        on_timeout: TimeoutHookT | None = None,
+        error_message: Localized | str | None = "Something went wrong, please try again later.",
     ) -> None:
         self._commands: dict[str, CommandT] = {}
+        self._index: dict[tuple[str, CommandType], CommandT] = {}
         self._loop: AbstractEventLoop | None = loop
+        self._sync_task: asyncio.Task[None] | None = None
 
         self.bot = bot
         self.i18n: ILocalizationProvider | None = i18n
+        self.translator: Translator | None = None
+        if i18n is not None:
+            from kumo.i18n.templates import Translator
+
+            self.translator = Translator(i18n)
         self.builder = CommandBuilder(bot, i18n=i18n)
+        self.syncer = CommandSyncer(bot, self.builder)
+        self.incremental_sync: bool = incremental_sync
+        self.snapshot_path: str | PathLike[str] | None = snapshot_path
+        self.default_guild: Snowflake | None = Snowflake(default_guild) if default_guild is not None else None
+        self.guild_sync_concurrency: int = guild_sync_concurrency
+        self.router = CommandRouter()
+        self.scheduler: InteractionScheduler = scheduler or InteractionScheduler(loop=loop)
+        self.drain_timeout: float | None = drain_timeout
+        self.auto_defer: float | None = auto_defer
+        self.metrics: MetricsRegistry | None = metrics
+        self.tracer: ITracer | None = tracer
+        self.manifest_path: str | PathLike[str] | None = manifest_path
+        self.warm_up_delay: float | None = warm_up_delay
+        self._loader: CommandLoader | None = None
+        self._cooldown_store: ICooldownStore | None = cooldown_store
+        self.callback_timeout: float | None = callback_timeout
+        """Seconds any callback may run, unlimited unless set, interaction tokens expire after 15 minutes."""
+        self.on_timeout: TimeoutHookT | None = on_timeout
+        """Called with the context of a cancelled callback, e.g. to reply that it timed out."""
+        self.error_message: Localized | str | None = error_message
+        """Ephemeral reply to interactions received over HTTP whose callback failed without answering them."""
+
+        self._ids: dict[Snowflake, CommandT] = {}
+
+    @property
+    def commands(self) -> dict[Snowflake, CommandT]:
+        return self._ids
 
-        self.commands: dict[Snowflake, CommandT] = {}
+    @commands.setter
+    def commands(self, commands: dict[Snowflake, CommandT]) -> None:
+        self.router.set_commands(commands)
+        self._ids = commands
 
     @property
     def loop(self) -> AbstractEventLoop:
@@ -51,102 +161,516 @@ class CommandHandler:
             self._loop = asyncio.get_running_loop()
         return self._loop
 
-    def create_context(self, interaction: CommandInteraction) -> CommandInteractionContext:
-        return CommandInteractionContext(bot=self.bot, interaction=interaction, i18n=self.i18n)
+    @property
+    def loader(self) -> CommandLoader:
+        """Registry of command modules, made on first use so bots without modules do not import it."""
+        if self._loader is None:
+            from kumo.impl.command_loader import CommandLoader
+
+            self._loader = CommandLoader(self, manifest_path=self.manifest_path, warm_up_delay=self.warm_up_delay)
+        return self._loader
+
+    @property
+    def cooldown_store(self) -> ICooldownStore:
+        """Store of cooldowns, an in-memory one is made on first use unless another was given."""
+        if self._cooldown_store is None:
+            from kumo.commands.cooldowns import MemoryCooldownStore
+
+            self._cooldown_store = MemoryCooldownStore()
+        return self._cooldown_store
 
-    def add_command(self, command: CommandT) -> None:
+    def create_context(
+        self,
+        interaction: CommandInteraction,
+        *,
+        response_future: asyncio.Future[InteractionResponseBuilder] | None = None,
+        span: ISpan | None = None,
+    ) -> CommandInteractionContext:
+        context = CommandInteractionContext(
+            bot=self.bot,
+            interaction=interaction,
+            i18n=self.i18n,
+            translator=self.translator,
+            response_future=response_future,
+        )
+        if span is not None:
+            context.tracer, context.span = self.tracer, span
+        return context
+
+    def create_autocomplete_context(
+        self,
+        interaction: AutocompleteInteraction,
+        *,
+        response_future: asyncio.Future[InteractionResponseBuilder] | None = None,
+    ) -> AutocompleteInteractionContext:
+        return AutocompleteInteractionContext(
+            bot=self.bot,
+            interaction=interaction,
+            i18n=self.i18n,
+            translator=self.translator,
+            response_future=response_future,
+        )
+
+    def open_context(
+        self,
+        interaction: CommandInteraction,
+        *,
+        response_future: asyncio.Future[InteractionResponseBuilder] | None = None,
+    ) -> CommandInteractionContext:
+        """Create the context of a received interaction, starting its trace if tracing is enabled."""
+        if self.tracer is None:
+            return self.create_context(interaction, response_future=response_future)
+        span = self.start_trace(interaction)
+        with phase(self.tracer, span, "create_context"):
+            return self.create_context(interaction, response_future=response_future, span=span)
+
+    def start_trace(self, interaction: CommandInteraction) -> ISpan:
+        assert self.tracer is not None
+        # This is kept inline, so bots without a tracer do not import the tracing package.
+        from kumo.tracing.spans import start_interaction_span
+
+        return start_interaction_span(self.tracer, interaction, {"command.name": interaction.command_name})
+
+    def add_command(self, command: CommandT, *, guilds: SnowflakeishSequence[PartialGuild] | None = None) -> None:
+        assert isinstance(command.metadata, ApplicationMetadata)
+        if guilds is not None:
+            command.metadata.guilds = guilds  # type: ignore
         self._commands[command.metadata.name] = command
+        self._index[command.metadata.name, command.metadata.command_type] = command
+        self.router.add_command(command)
         _LOGGER.debug("add command %s", command.metadata.name)
 
-    def get_command(self, command_id: Snowflake, *, command_name: str | None = None) -> CommandT:
+    def get_command(
+        self,
+        command_id: Snowflake,
+        *,
+        command_name: str | None = None,
+        command_type: CommandType = CommandType.SLASH,
+    ) -> CommandT:
         if command := self.commands.get(command_id):
             return command
+        # The ID may be unknown while commands are syncing or after it was remapped,
+        # so fall back to the name and remember the ID for the next time.
+        if command_name and (command := self._index.get((command_name, command_type))):
+            _LOGGER.debug("learned ID %s of command %s", command_id, command_name)
+            self.commands[command_id] = command
+            self.router.add_route(command_id, command)
+            return command
         raise CommandNotFoundException(
             f"command with ID {command_id} is not found"
             if not command_name
-            else f"command {command_name} (ID: {command_name}) is not found"
+            else f"command {command_name} (ID: {command_id}) is not found"
         )
 
+    def get_command_guilds(self, command: CommandT) -> Sequence[Snowflake]:
+        """Return guilds the command is registered in, or nothing if it is a global command."""
+        assert isinstance(command.metadata, ApplicationMetadata)
+        if command.metadata.guilds is not None:
+            return command.metadata.guilds
+        return (self.default_guild,) if self.default_guild is not None else ()
+
+    @property
+    def global_commands(self) -> Sequence[CommandT]:
+        return tuple(command for command in self._commands.values() if not self.get_command_guilds(command))
+
+    @property
+    def guild_commands(self) -> Mapping[Snowflake, Sequence[CommandT]]:
+        commands: dict[Snowflake, list[CommandT]] = {}
+        for command in self._commands.values():
+            for guild in self.get_command_guilds(command):
+                commands.setdefault(guild, []).append(command)
+        return commands
+
+    def hash_tree(self) -> str:
+        """Return the hash of the global commands and of the commands of every guild."""
+        hashes = [self.syncer.hash_commands(self.global_commands)]
+        for guild, commands in sorted(self.guild_commands.items()):
+            hashes.append(f"{guild}:{self.syncer.hash_commands(commands)}")
+        return hashlib.sha256("\n".join(hashes).encode()).hexdigest()
+
+    def load_snapshot(self) -> bool:
+        """Map global and guild commands by the IDs from the snapshot file, if it was made from the same tree."""
+        if not self.snapshot_path or not (snapshot := CommandSnapshot.load(self.snapshot_path)):
+            return False
+        if snapshot.tree_hash != self.hash_tree():
+            _LOGGER.debug("command snapshot is outdated")
+            return False
+        global_commands = {command.metadata.name: command for command in self.global_commands}
+        self.commands = {
+            Snowflake(command_id): global_commands[name]
+            for name, command_id in snapshot.commands.items()
+            if name in global_commands
+        }
+        for guild, guild_commands in self.guild_commands.items():
+            commands = {command.metadata.name: command for command in guild_commands}
+            for name, command_id in snapshot.guilds.get(guild, {}).items():
+                if command := commands.get(name):
+                    self.commands[Snowflake(command_id)] = command
+        _LOGGER.info("loaded %s commands from snapshot", len(self.commands))
+        return True
+
+    def save_snapshot(
+        self, result: SyncResult | None = None, guild_results: Mapping[Snowflake, SyncResult] | None = None
+    ) -> None:
+        """Store the IDs of synced global commands, of synced guild commands, or of both in the snapshot file.
+
+        IDs the results do not cover are kept from the snapshot file if it was made from the same tree.
+        """
+        if not self.snapshot_path:
+            return
+        tree_hash = self.hash_tree()
+        snapshot = CommandSnapshot.load(self.snapshot_path)
+        if snapshot is None or snapshot.tree_hash != tree_hash:
+            snapshot = CommandSnapshot(tree_hash=tree_hash)
+        if result is not None:
+            snapshot.commands = self._get_synced_ids(result)
+        for guild, guild_result in (guild_results or {}).items():
+            if guild_result.exception is None:
+                snapshot.guilds[int(guild)] = self._get_synced_ids(guild_result)
+        snapshot.save(self.snapshot_path)
+
+    def _get_synced_ids(self, result: SyncResult) -> dict[str, int]:
+        return {name: int(remote.id) for name, remote in result.commands.items() if name in self._commands}
+
     async def start(self, sync_commands: bool = True) -> None:
         _LOGGER.debug("starting, available commands: %s", len(self._commands))
-        if sync_commands:
-            await self.sync_commands()
+        if self._loader is not None:
+            self._loader.start()
+        if not sync_commands:
+            # Commands are synced elsewhere, e.g. by the coordinator of a sharded runner.
+            self.load_snapshot()
+            return
+        if self.load_snapshot():
+            # Serve from the snapshot right away and verify it against the API in the background.
+            self._sync_task = self.loop.create_task(self._sync_all(incremental=True), name="verify commands")
+            self._sync_task.add_done_callback(self._on_verified)
+        else:
+            await self._sync_all()
 
-    async def stop(self) -> None: ...  # TODO: clear commands
+    async def _sync_all(self, *, incremental: bool | None = None) -> None:
+        await asyncio.gather(self.sync_commands(incremental=incremental), self.sync_guild_commands())
+
+    @staticmethod
+    def _on_verified(task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and (error := task.exception()) is not None:
+            # The IDs of the snapshot stay in use, commands with other IDs are still found by their names.
+            _LOGGER.error("failed to verify commands of the snapshot: %s", error, exc_info=error)
+
+    async def stop(self, *, timeout: float | None = None) -> DrainResult:
+        """Stop accepting interactions and wait for in-flight ones up to the drain timeout."""
+        if self._sync_task and not self._sync_task.done():
+            self._sync_task.cancel()
+            # Errors are logged by its done callback, so waiting is enough.
+            await asyncio.wait((self._sync_task,))
+        if self._loader is not None:
+            self._loader.stop()
+        result = await self.scheduler.drain(self.drain_timeout if timeout is None else timeout)
+        _LOGGER.info("stopped, %s interactions completed, %s cancelled", result.completed, result.cancelled)
+        return result
 
     async def dispatch(self, event: InteractionCreateEvent) -> None:
         assert isinstance(event.interaction, CommandInteraction)
-        context = self.create_context(event.interaction)
-        command = self.get_command(event.interaction.command_id)
-        if isinstance(command, Command):
-            if event.interaction.command_type in (CommandType.USER, CommandType.MESSAGE) and event.interaction.resolved:
-                task = self._handle_callback(
-                    command.get_callback(),
-                    context,
-                    *unpack_resolved_data(event.interaction.resolved),
-                )
-            else:
-                task = self._handle_callback(
-                    command.get_callback(),
-                    context,
-                    **{option.name: resolve_argument(event.interaction, option) for option in event.interaction.options},
+        await self.dispatch_context(self.open_context(event.interaction))
+
+    async def dispatch_context(self, context: CommandInteractionContext) -> asyncio.Task[None] | None:
+        """Route the interaction of the context and schedule its callback, returns ``None`` if it was rejected."""
+        interaction, span = context.interaction, context.span
+        try:
+            with phase(self.tracer, span, "route"):
+                route, options = self.resolve_route(interaction)
+            with phase(self.tracer, span, "bind"):
+                args, kwargs = route.binder(interaction, options)
+        except BaseException as error:
+            if span is not None:
+                span.record_exception(error)
+                span.end()
+            raise
+        if route.cooldown is not None and (retry_after := await self.acquire_cooldown(route, context)):
+            _LOGGER.debug("rejecting interaction %s of command %s, it is on cooldown", interaction.id, route.path)
+            self.scheduler.track(
+                self.loop.create_task(
+                    self._reject_cooldown(route.cooldown, context, retry_after),
+                    name=f"reject interaction (id: {interaction.id})",
                 )
+            )
+            task = None
         else:
-            if (option := event.interaction.options[0]).type is OptionType.SUB_COMMAND_GROUP:
-                options = option.options or []
-                options = options[0].options or []
-                sub_command = command.get_command(option.name, group=options[0].name)
-            elif option.type is OptionType.SUB_COMMAND:
-                options = option.options or []
-                sub_command = command.get_command(option.name)
-            else:
-                raise Exception()
-            task = self._handle_callback(
-                sub_command.callback,
+            task = self.scheduler.submit(
+                route.command.metadata.name,
                 context,
-                command.obj,
-                **{option.name: resolve_argument(event.interaction, option) for option in options},
+                self._handle_callback(route, context, *args, **kwargs),
+                task_name=f"interaction (id: {interaction.id})",
             )
-        self.loop.create_task(task, name=f"interaction (id: {event.interaction.id})")
+        if span is not None:
+            span.set_attribute("command.path", route.path)
+            if task is None:
+                span.set_attribute("interaction.rejected", True)
+                span.end()
+        return task
+
+    async def acquire_cooldown(self, route: Route, context: CommandInteractionContext) -> float:
+        """Take a token of the cooldown of the route, returns seconds until one is available if there is none."""
+        assert route.cooldown is not None
+        key = f"{route.path}:{route.cooldown.get_key(context.interaction)}"
+        try:
+            return await self.cooldown_store.acquire(key, route.cooldown.rate, route.cooldown.per)
+        except Exception as error:
+            # Commands keep working without cooldowns while a shared store is unavailable.
+            _LOGGER.error("failed to acquire cooldown of command %s: %s", route.path, error)
+            return 0.0
 
-    async def sync_commands(self) -> None:
-        _LOGGER.debug("syncing global commands...")
+    async def _reject_cooldown(
+        self, cooldown: Cooldown, context: CommandInteractionContext, retry_after: float
+    ) -> None:
+        try:
+            await context.create_response(
+                context.translate(cooldown.message, retry_after=math.ceil(retry_after)), ephemeral=True
+            )
+        except Exception as error:
+            _LOGGER.error("failed to reject interaction %s: %s", context.interaction.id, error)
+
+    def resolve_route(
+        self, interaction: CommandInteraction | AutocompleteInteraction
+    ) -> tuple[Route, Sequence[CommandInteractionOption]]:
+        route, options = self.router.get_route(interaction)  # type: ignore
+        if route is None:
+            self.get_command(
+                interaction.command_id,
+                command_name=interaction.command_name,
+                command_type=interaction.command_type,
+            )
+            route, options = self.router.get_route(interaction)  # type: ignore
+            if route is None:
+                raise CommandNotFoundException(f"command {interaction.command_name} has no such sub command")
+        return route, options
+
+    async def dispatch_autocomplete(self, event: InteractionCreateEvent) -> None:
+        assert isinstance(event.interaction, AutocompleteInteraction)
+        await self.complete(self.create_autocomplete_context(event.interaction))
+
+    async def respond_autocomplete(self, interaction: AutocompleteInteraction) -> InteractionResponseBuilder:
+        """Answer an autocomplete interaction received over HTTP, returns the response for the HTTP reply."""
+        future: asyncio.Future[InteractionResponseBuilder] = self.loop.create_future()
+        await self.complete(self.create_autocomplete_context(interaction, response_future=future))
+        return future.result()
+
+    async def complete(self, context: AutocompleteInteractionContext) -> None:
+        """Answer the autocomplete interaction of the context with choices for its focused option."""
+        route, options = self.resolve_route(context.interaction)
+        choices: Sequence[Choice] = ()
+        focused = next((option for option in options if option.is_focused), None)  # type: ignore
+        if focused is None or (autocomplete := route.autocomplete.get(focused.name)) is None:
+            _LOGGER.warning("command %s has no autocomplete for the focused option", route.path)
+        else:
+            context.focused = focused.name
+            context.options = {option.name: option.value for option in options}
+            try:
+                choices = await autocomplete.complete(context, str(focused.value))
+            except Exception as error:
+                _LOGGER.error(
+                    "exception occurred in autocomplete of command %s: %s", route.path, error, exc_info=error
+                )
+        await context.respond(choices)
+
+    async def respond(self, interaction: CommandInteraction, *, timeout: float = 2.5) -> InteractionResponseBuilder:
+        """Dispatch an interaction received over HTTP and return its initial response for the HTTP reply.
+
+        The callback keeps running after its first response. If it neither responds nor defers
+        within ``timeout`` seconds, the interaction is deferred and the late response edits it.
+        """
+        future: asyncio.Future[InteractionResponseBuilder] = self.loop.create_future()
+        context = self.open_context(interaction, response_future=future)
+        task = await self.dispatch_context(context)
+        waiters = (future,) if task is None else (future, task)
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if not future.done():
+            await context.defer()
+        return future.result()
+
+    async def sync_commands(self, *, incremental: bool | None = None) -> SyncResult:
+        """Sync commands with Discord and map them by their IDs.
+
+        With ``incremental`` set, remote commands are compared with the built ones by content hash
+        and only the changed ones are created, updated or deleted instead of overwriting all of them.
+        """
+        incremental = self.incremental_sync if incremental is None else incremental
+        _LOGGER.debug("syncing global commands%s...", " incrementally" if incremental else "")
         application = await self.bot.rest.fetch_application()
-        commands = await self.bot.rest.set_application_commands(
-            application, tuple(self.builder.build_commands(self._commands.values()))  # type: ignore
-        )
-        for remote in commands:
+        global_commands = {command.metadata.name: command for command in self.global_commands}
+        result = await self.syncer.sync(application, tuple(global_commands.values()), incremental=incremental)
+        synced: dict[Snowflake, CommandT] = {}
+        for name, remote in result.commands.items():
             try:
-                self.commands[remote.id] = self._commands.pop(remote.name)
+                synced[remote.id] = global_commands[name]
             except KeyError:
                 _LOGGER.error("failed to map command '%s' (ID: %s)", remote.name, remote.id)
-        _LOGGER.info("synced commands")
-        if self._commands:
+        previous = {id_: command for id_, command in self.commands.items() if command.metadata.name in global_commands}
+        if previous and synced != previous:
+            _LOGGER.info("command IDs have drifted, swapping in the synced ones")
+        self.commands = {
+            **{id_: command for id_, command in self.commands.items() if id_ not in previous},
+            **synced,
+        }
+        self.save_snapshot(result)
+        _LOGGER.info("synced commands: %s", result)
+        if len(synced) < len(global_commands):
             _LOGGER.warning("not all commands was synced")
-            self._commands.clear()
         else:
             _LOGGER.debug("all commands was synced")
+        return result
+
+    async def sync_guild_commands(self, *, incremental: bool | None = None) -> Mapping[Snowflake, SyncResult]:
+        """Sync guild commands in every guild they are registered in and map them by their IDs.
+
+        Guilds are synced concurrently, at most ``guild_sync_concurrency`` at once.
+        """
+        if not (guild_commands := self.guild_commands):
+            return {}
+        incremental = self.incremental_sync if incremental is None else incremental
+        _LOGGER.debug("syncing commands in %s guilds...", len(guild_commands))
+        application = await self.bot.rest.fetch_application()
+        results = await self.syncer.sync_guilds(
+            application, guild_commands, incremental=incremental, max_concurrency=self.guild_sync_concurrency
+        )
+        synced: dict[Snowflake, CommandT] = {}
+        for guild, result in results.items():
+            commands = {command.metadata.name: command for command in guild_commands[guild]}
+            for name, remote in result.commands.items():
+                if command := commands.get(name):
+                    synced[remote.id] = command
+                else:
+                    _LOGGER.error("failed to map command '%s' (ID: %s) in guild %s", remote.name, remote.id, guild)
+            _LOGGER.debug("synced commands in guild %s: %s", guild, result)
+        self.commands = {
+            **{id_: command for id_, command in self.commands.items() if not self.get_command_guilds(command)},
+            **synced,
+        }
+        self.save_snapshot(guild_results=results)
+        failed = sum(result.exception is not None for result in results.values())
+        _LOGGER.info("synced commands in %s guilds, %s failed", len(results) - failed, failed)
+        return results
 
     async def _handle_callback(
         self,
-        callback: CommandCallbackT,
+        route: Route,
         context: CommandInteractionContext,
         *args: Any,  # noqa: ANN401
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
+        # Defer on behalf of callbacks which have not responded within the budget,
+        # their create_response then edits the deferred response instead.
+        watchdog = (
+            self.loop.call_later(self.auto_defer, self._auto_defer, context) if self.auto_defer is not None else None
+        )
+        metrics = self.metrics.get(route.path) if self.metrics is not None else None
+        started = 0.0
+        if metrics is not None:
+            metrics.in_flight += 1
+            started = time.monotonic()
+        exception: Exception | None = None
+        timeout = self.get_timeout(route)
+        # Entering a timeout is not free, so callbacks without one are awaited directly.
+        deadline = asyncio.timeout(timeout) if timeout is not None else None
         try:
-            await callback(*args, context, **kwargs)
-        except Exception as error:
-            if self.bot.event_manager.get_listeners(CommandCallbackErrorEvent):
-                _LOGGER.debug("exception occurred in command %s callback: %s", context.interaction.command_name, error)
-                event: CommandCallbackErrorEvent = CommandCallbackErrorEvent(
-                    exception=error, context=context
-                )
-                self.bot.event_manager.dispatch(event)
+            with phase(self.tracer, context.span, "callback"):
+                if deadline is None:
+                    await self._run_callback(route, context, args, kwargs)
+                else:
+                    async with deadline:
+                        await self._run_callback(route, context, args, kwargs)
+        except TimeoutError as error:
+            exception = error
+            if deadline is not None and deadline.expired():
+                await self._handle_timeout(route, context, timeout, error)  # type: ignore
             else:
-                _LOGGER.error(
-                    "exception occurred in command %s callback: %s",
-                    context.interaction.command_name,
-                    error,
-                    exc_info=error,
+                self._report_error(context, error)
+            await self._reply_error(context)
+        except Exception as error:
+            exception = error
+            self._report_error(context, error)
+            await self._reply_error(context)
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if metrics is not None:
+                metrics.in_flight -= 1
+                # The first response is timed from receiving the interaction, so it includes queueing.
+                self.metrics.record(  # type: ignore
+                    metrics,
+                    time.monotonic() - started,
+                    context.responded_at - context.created_at if context.responded_at is not None else None,
+                    exception,
                 )
+            if context.span is not None:
+                if exception is not None:
+                    context.span.record_exception(exception)
+                context.span.end()
+
+    async def _run_callback(
+        self, route: Route, context: CommandInteractionContext, args: Sequence[Any], kwargs: Mapping[str, Any]
+    ) -> None:
+        if route.responses is not None:
+            key = route.responses.get_key(context.interaction, get_route_key(context.interaction)[1])
+            await route.responses.respond(context, key, lambda: route.callback(context, *args, **kwargs))
+        else:
+            await route.callback(context, *args, **kwargs)
+
+    def get_timeout(self, route: Route) -> float | None:
+        """Return seconds the callback of the route may run, the shorter of its own and the global timeout."""
+        timeouts = [timeout for timeout in (route.timeout, self.callback_timeout) if timeout is not None]
+        return min(timeouts) if timeouts else None
+
+    async def _reply_error(self, context: CommandInteractionContext) -> None:
+        # Interactions received over HTTP would otherwise be deferred and keep thinking, gateway bots
+        # answer them in their error listeners.
+        if context.response_future is None or self.error_message is None:
+            return
+        try:
+            if not context.responded:
+                await context.create_response(context.translate(self.error_message), ephemeral=True)
+            elif context.deferred and not context.edited:
+                await context.edit_response(context.translate(self.error_message))
+        except Exception as error:
+            _LOGGER.error("failed to reply to interaction %s: %s", context.interaction.id, error)
+
+    def _report_error(self, context: CommandInteractionContext, error: Exception) -> None:
+        # REST bots have no event manager, their errors are only logged.
+        event_manager = getattr(self.bot, "event_manager", None)
+        if event_manager is not None and event_manager.get_listeners(CommandCallbackErrorEvent):
+            _LOGGER.debug("exception occurred in command %s callback: %s", context.interaction.command_name, error)
+            event: CommandCallbackErrorEvent = CommandCallbackErrorEvent(exception=error, context=context)
+            event_manager.dispatch(event)
+        else:
+            _LOGGER.error(
+                "exception occurred in command %s callback: %s",
+                context.interaction.command_name,
+                error,
+                exc_info=error,
+            )
+
+    async def _handle_timeout(
+        self, route: Route, context: CommandInteractionContext, timeout: float, error: TimeoutError
+    ) -> None:
+        if self.on_timeout is not None:
+            try:
+                async with asyncio.timeout(_TIMEOUT_HOOK_DEADLINE):
+                    await self.on_timeout(context)
+            except Exception as hook_error:
+                _LOGGER.error("timeout hook of command %s failed: %s", route.path, hook_error, exc_info=hook_error)
+        event_manager = getattr(self.bot, "event_manager", None)
+        if event_manager is not None and event_manager.get_listeners(CommandTimeoutEvent):
+            _LOGGER.debug("command %s callback timed out after %ss", route.path, timeout)
+            event_manager.dispatch(CommandTimeoutEvent(exception=error, context=context, timeout=timeout))
+        else:
+            _LOGGER.warning("command %s callback timed out after %ss and was cancelled", route.path, timeout)
+
+    def _auto_defer(self, context: CommandInteractionContext) -> None:
+        if not context.responded:
+            _LOGGER.debug("auto deferring interaction %s", context.interaction.id)
+            self.scheduler.track(self.loop.create_task(self._defer(context), name="auto defer"))
+
+    async def _defer(self, context: CommandInteractionContext) -> None:
+        try:
+            await context.defer()
+        except Exception as error:
+            _LOGGER.error("failed to auto defer interaction %s: %s", context.interaction.id, error)
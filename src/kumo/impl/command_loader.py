@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import time
+from collections.abc import Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from kumo.commands.base import Command, CommandGroup
+from kumo.commands.exceptions import CommandNotFoundException
+from kumo.commands.metadata import ApplicationMetadata
+from kumo.impl.command_manifest import CommandManifest, ModuleManifest, dump_command, load_command
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from types import ModuleType
+
+    from hikari.guilds import PartialGuild
+    from hikari.snowflakes import SnowflakeishSequence
+
+    from kumo.commands.options import Choice
+    from kumo.commands.types import CommandCallbackT, CommandT
+    from kumo.context import AutocompleteInteractionContext
+    from kumo.impl.command_handler import CommandHandler
+
+__all__: Sequence[str] = ("LazyCallback", "LazyAutocomplete", "LazyModule", "CommandLoader")
+
+_LOGGER = getLogger("kumo.commands.loader")
+
+
+def get_module_commands(module: ModuleType) -> dict[str, CommandT]:
+    """Return top-level commands and command groups of the module by their attribute names."""
+    return {
+        attribute: value
+        for attribute, value in vars(module).items()
+        if isinstance(value, Command | CommandGroup) and isinstance(value.metadata, ApplicationMetadata)
+    }
+
+
+class LazyCallback:
+    """Stands in for a callback of a lazy module, imports the module on the first call and runs the real one."""
+
+    __slots__: Sequence[str] = ("module", "attribute", "group", "name")
+
+    def __init__(self, module: LazyModule, attribute: str, group: str | None, name: str | None) -> None:
+        self.module: LazyModule = module
+        self.attribute: str = attribute
+        self.group: str | None = group
+        self.name: str | None = name
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        if self.name is not None:
+            # Sub command callbacks are bound to the placeholder object of their group.
+            args = args[1:]
+        await self.module.load()
+        callback: CommandCallbackT = self.module.loader.handler.router.get_compiled_route(
+            self.module.commands[self.attribute], self.group, self.name
+        ).callback
+        await callback(*args, **kwargs)
+
+
+class LazyAutocomplete:
+    """Stands in for an autocomplete handler of a lazy module, imports the module and runs the real one."""
+
+    __slots__: Sequence[str] = ("module", "attribute", "group", "name", "option")
+
+    def __init__(self, module: LazyModule, attribute: str, group: str | None, name: str | None, option: str) -> None:
+        self.module: LazyModule = module
+        self.attribute: str = attribute
+        self.group: str | None = group
+        self.name: str | None = name
+        self.option: str = option
+
+    async def complete(self, context: AutocompleteInteractionContext, value: str) -> Sequence[Choice]:
+        await self.module.load()
+        route = self.module.loader.handler.router.get_compiled_route(
+            self.module.commands[self.attribute], self.group, self.name
+        )
+        return await route.autocomplete[self.option].complete(context, value)
+
+
+class LazyModule:
+    """Module whose commands were registered from the manifest, it is imported on their first dispatch.
+
+    The import runs in a thread, so a heavy module does not block other interactions meanwhile.
+    Once imported, its commands are initialized and their routes call them directly.
+    """
+
+    __slots__: Sequence[str] = ("_task", "loader", "name", "commands")
+
+    def __init__(self, loader: CommandLoader, name: str) -> None:
+        self._task: asyncio.Task[None] | None = None
+        self.loader: CommandLoader = loader
+        self.name: str = name
+        self.commands: dict[str, CommandT] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._task is not None and self._task.done() and self._task.exception() is None
+
+    async def load(self) -> None:
+        # Interactions arriving while the module is imported wait for the same import.
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._load(), name=f"load module {self.name}")
+        try:
+            await asyncio.shield(self._task)
+        except Exception:
+            # Let the next interaction retry a failed import.
+            if self._task.done():
+                self._task = None
+            raise
+
+    async def _load(self) -> None:
+        started = time.monotonic()
+        module = await asyncio.to_thread(importlib.import_module, self.name)
+        commands = get_module_commands(module)
+        for attribute, placeholder in self.commands.items():
+            if (command := commands.get(attribute)) is None:
+                raise CommandNotFoundException(f"command {attribute} is not found in module {self.name}")
+            command = self.loader.handler.bot.init_command(command)  # type: ignore
+            # The placeholder stays registered, it takes over the object and callbacks of the real command.
+            placeholder.obj = command.obj
+            if isinstance(placeholder, Command):
+                placeholder.callback = command.callback  # type: ignore
+            else:
+                placeholder.commands = command.commands  # type: ignore
+            self.loader.handler.router.refresh_command(placeholder)
+        _LOGGER.info("loaded module %s in %.3fs", self.name, time.monotonic() - started)
+
+
+class CommandLoader:
+    """Registry of command modules, which can defer importing them until their commands are dispatched.
+
+    Metadata of the commands of a lazily loaded module is cached in the manifest file. While the
+    sources of the module's top-level package are unchanged, its commands are registered from the
+    manifest and synced without importing it, the module is imported on the first dispatch of any of
+    them. Otherwise it is imported right away and the manifest is refreshed on start. Changes to code
+    imported from other packages are not detected, call :meth:`invalidate` before loading or delete
+    the manifest file after them. With ``warm_up_delay`` set, modules which were not used yet are
+    imported in the background that many seconds after start.
+    """
+
+    __slots__: Sequence[str] = (
+        "_manifest",
+        "_dirty",
+        "_warm_up_task",
+        "handler",
+        "manifest_path",
+        "warm_up_delay",
+        "modules",
+    )
+
+    def __init__(
+        self,
+        handler: CommandHandler,
+        *,
+        manifest_path: str | PathLike[str] | None = None,
+        warm_up_delay: float | None = None,
+    ) -> None:
+        self._manifest: CommandManifest | None = None
+        self._dirty: bool = False
+        self._warm_up_task: asyncio.Task[None] | None = None
+        self.handler: CommandHandler = handler
+        self.manifest_path: str | PathLike[str] | None = manifest_path
+        self.warm_up_delay: float | None = warm_up_delay
+        self.modules: dict[str, LazyModule] = {}
+
+    @property
+    def manifest(self) -> CommandManifest:
+        if self._manifest is None:
+            manifest = CommandManifest.load(self.manifest_path) if self.manifest_path else None
+            self._manifest = manifest or CommandManifest()
+        return self._manifest
+
+    def load_module(
+        self, name: str, *, lazy: bool = True, guilds: SnowflakeishSequence[PartialGuild] | None = None
+    ) -> Sequence[CommandT]:
+        """Add every top-level command of the module, importing it only if it cannot be loaded lazily."""
+        if lazy and self.manifest_path and (manifest := self.manifest.get_module(name)) is not None:
+            module = LazyModule(self, name)
+            for attribute, data in manifest.commands.items():
+                module.commands[attribute] = load_command(
+                    data,
+                    module,
+                    lambda group, sub_name, attribute=attribute: LazyCallback(module, attribute, group, sub_name),
+                    lambda group, sub_name, option, attribute=attribute: LazyAutocomplete(  # type: ignore
+                        module, attribute, group, sub_name, option
+                    ),
+                )
+            self.modules[name] = module
+            for command in module.commands.values():
+                self.handler.add_command(command, guilds=guilds)
+            _LOGGER.debug("registered %s commands of module %s from the manifest", len(module.commands), name)
+            return tuple(module.commands.values())
+
+        commands = get_module_commands(importlib.import_module(name))
+        if lazy and self.manifest_path:
+            self.record(name, commands)
+        for command in commands.values():
+            self.handler.add_command(self.handler.bot.init_command(command), guilds=guilds)  # type: ignore
+        return tuple(commands.values())
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the manifests of the modules, or of every module, so they are imported and recorded on load."""
+        self.manifest.invalidate(*names)
+        self._dirty = True
+
+    def record(self, name: str, commands: dict[str, CommandT]) -> None:
+        if (fingerprint := self.manifest.get_fingerprint(name)) is None:
+            _LOGGER.warning("module %s has no source file and cannot be loaded lazily", name)
+            return
+        data = {attribute: dump_command(command) for attribute, command in commands.items()}
+        try:
+            json.dumps(data)
+        except (TypeError, ValueError) as error:
+            _LOGGER.warning("commands of module %s cannot be stored in the manifest: %s", name, error)
+            return
+        self.manifest.modules[name] = ModuleManifest(fingerprint=fingerprint, commands=data)
+        self._dirty = True
+
+    def save_manifest(self) -> None:
+        if self._dirty and self.manifest_path:
+            self.manifest.save(self.manifest_path)
+            self._dirty = False
+
+    def start(self) -> None:
+        self.save_manifest()
+        if self.warm_up_delay is not None and self.modules:
+            self._warm_up_task = asyncio.get_running_loop().create_task(
+                self.warm_up(self.warm_up_delay), name="warm up modules"
+            )
+
+    def stop(self) -> None:
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+
+    async def warm_up(self, delay: float = 0.0) -> None:
+        """Import lazy modules which were not used yet, one at a time."""
+        await asyncio.sleep(delay)
+        for module in tuple(self.modules.values()):
+            if module.is_loaded:
+                continue
+            try:
+                await module.load()
+            except Exception as error:
+                _LOGGER.error("failed to warm up module %s: %s", module.name, error)
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+from collections.abc import Callable, Sequence
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import attrs
+from hikari.channels import ChannelType
+from hikari.commands import OptionType
+from hikari.permissions import Permissions
+from hikari.undefined import UNDEFINED
+
+from kumo.commands.base import Command, CommandGroup, SubCommand, SubCommandGroup
+from kumo.commands.caching import CacheScope, ResponseCache
+from kumo.commands.cooldowns import Cooldown, CooldownBucket
+from kumo.commands.metadata import MessageCommandMetadata, SlashCommandMetadata, SubCommandMetadata, UserCommandMetadata
+from kumo.commands.options import Choice, Option
+from kumo.i18n.types import Localized
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from kumo.commands.autocomplete import Autocomplete
+    from kumo.commands.metadata import ApplicationMetadata
+    from kumo.commands.types import CommandCallbackT, CommandT
+
+__all__: Sequence[str] = ("ModuleManifest", "CommandManifest", "dump_command", "load_command", "get_fingerprint")
+
+_LOGGER = getLogger("kumo.commands.manifest")
+
+_VERSION: int = 1
+
+_APPLICATION_METADATA: dict[str, type[ApplicationMetadata]] = {
+    "slash": SlashCommandMetadata,
+    "user": UserCommandMetadata,
+    "message": MessageCommandMetadata,
+}
+
+CallbackFactoryT = Callable[[str | None, str | None], "CommandCallbackT"]
+"""Makes the callback of the sub command group and sub command names, both ``None`` for a command."""
+AutocompleteFactoryT = Callable[[str | None, str | None, str], "Autocomplete"]
+"""Makes the autocomplete handler of an option of the sub command group and sub command names."""
+
+
+def get_fingerprint(module: str, *, cache: dict[str, str] | None = None) -> str | None:
+    """Return a digest of the modification times and sizes of the module's sources without importing it.
+
+    The sources are the module itself and every Python file of its top-level package, so changes to
+    helpers within the package are detected. Changes to code imported from other packages are not.
+    ``cache`` keeps digests of packages by their names, as every module of a package shares one.
+    """
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.has_location:
+        return None
+    package = module.partition(".")[0]
+    if cache is not None and (fingerprint := cache.get(package)) is not None:
+        return fingerprint
+    root = spec if package == module else importlib.util.find_spec(package)
+    paths = [spec.origin]
+    for location in (root.submodule_search_locations or ()) if root is not None else ():
+        for directory, directories, files in os.walk(location):
+            directories[:] = sorted(name for name in directories if not name.startswith((".", "__pycache__")))
+            paths.extend(os.path.join(directory, name) for name in sorted(files) if name.endswith(".py"))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in dict.fromkeys(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if path == spec.origin:
+                return None
+            continue
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    fingerprint = digest.hexdigest()
+    if cache is not None:
+        cache[package] = fingerprint
+    return fingerprint
+
+
+def _dump_localized(value: Localized | str | None) -> dict[str, str] | str | None:
+    if isinstance(value, Localized):
+        return {"key": value.key, "fallback": value.fallback}
+    return value
+
+
+def _load_localized(value: dict[str, str] | str | None) -> Localized | str | None:
+    if isinstance(value, dict):
+        return Localized(value["key"], fallback=value["fallback"])
+    return value
+
+
+def _dump_cooldown(cooldown: Cooldown | None) -> dict[str, Any] | None:
+    if cooldown is None:
+        return None
+    return {
+        "rate": cooldown.rate,
+        "per": cooldown.per,
+        "bucket": cooldown.bucket.name,
+        "message": _dump_localized(cooldown.message),
+    }
+
+
+def _load_cooldown(data: dict[str, Any] | None) -> Cooldown | None:
+    if data is None:
+        return None
+    return Cooldown(
+        rate=data["rate"],
+        per=data["per"],
+        bucket=CooldownBucket[data["bucket"]],
+        message=_load_localized(data["message"]),  # type: ignore
+    )
+
+
+def _dump_cache(cache: ResponseCache | None) -> dict[str, Any] | None:
+    if cache is None:
+        return None
+    return {"ttl": cache.ttl, "max_size": cache.max_size, "scope": cache.scope.value}
+
+
+def _load_cache(data: dict[str, Any] | None) -> ResponseCache | None:
+    if data is None:
+        return None
+    return ResponseCache(ttl=data["ttl"], max_size=data["max_size"], scope=CacheScope(data["scope"]))
+
+
+def _dump_option(option: Option) -> dict[str, Any]:
+    return {
+        "type": int(option.type),
+        "name": option.name,
+        "display_name": _dump_localized(option.display_name),
+        "description": _dump_localized(option.description),
+        "choices": [
+            {"name": choice.name, "value": choice.value, "display_name": _dump_localized(choice.display_name)}
+            for choice in option.choices
+        ]
+        if option.choices is not None
+        else None,
+        "is_required": option.is_required,
+        "min_value": option.min_value,
+        "max_value": option.max_value,
+        "min_length": option.min_length,
+        "max_length": option.max_length,
+        "channel_types": [int(type_) for type_ in option.channel_types] if option.channel_types is not None else None,
+        "default": option.default,
+        "autocomplete": option.autocomplete is not None,
+    }
+
+
+def _load_option(data: dict[str, Any], make_autocomplete: Callable[[str], Autocomplete]) -> Option:
+    return Option(
+        type=OptionType(data["type"]),
+        name=data["name"],
+        display_name=_load_localized(data["display_name"]),  # type: ignore
+        description=_load_localized(data["description"]),
+        choices=[
+            Choice(
+                name=choice["name"],
+                value=choice["value"],
+                display_name=_load_localized(choice["display_name"]),  # type: ignore
+            )
+            for choice in data["choices"]
+        ]
+        if data["choices"] is not None
+        else None,
+        is_required=data["is_required"],
+        min_value=data["min_value"],
+        max_value=data["max_value"],
+        min_length=data["min_length"],
+        max_length=data["max_length"],
+        channel_types=[ChannelType(type_) for type_ in data["channel_types"]]
+        if data["channel_types"] is not None
+        else None,
+        default=data["default"],
+        autocomplete=make_autocomplete(data["name"]) if data["autocomplete"] else None,
+    )
+
+
+def _dump_sub_command(metadata: SubCommandMetadata) -> dict[str, Any]:
+    return {
+        "name": metadata.name,
+        "display_name": _dump_localized(metadata.display_name),
+        "description": _dump_localized(metadata.description),
+        "options": [_dump_option(option) for option in metadata.options] if metadata.options is not None else None,
+        "cooldown": _dump_cooldown(metadata.cooldown),
+        "cache": _dump_cache(metadata.cache),
+        "timeout": metadata.timeout,
+    }
+
+
+def _load_sub_command(data: dict[str, Any], make_autocomplete: Callable[[str], Autocomplete]) -> SubCommandMetadata:
+    return SubCommandMetadata(
+        name=data["name"],
+        display_name=_load_localized(data["display_name"]),  # type: ignore
+        description=_load_localized(data["description"]),
+        options=[_load_option(option, make_autocomplete) for option in data["options"]]
+        if data["options"] is not None
+        else None,
+        cooldown=_load_cooldown(data["cooldown"]),
+        cache=_load_cache(data["cache"]),
+        timeout=data["timeout"],
+    )
+
+
+def _dump_metadata(metadata: ApplicationMetadata) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "name": metadata.name,
+        "display_name": _dump_localized(metadata.display_name),
+        "guilds": [int(guild) for guild in metadata.guilds] if metadata.guilds is not None else None,
+        "cooldown": _dump_cooldown(metadata.cooldown),
+        "cache": _dump_cache(metadata.cache),
+        "timeout": metadata.timeout,
+    }
+    if metadata.default_member_permissions is not UNDEFINED:
+        data["default_member_permissions"] = int(metadata.default_member_permissions)
+    if metadata.is_dm_enabled is not UNDEFINED:
+        data["is_dm_enabled"] = metadata.is_dm_enabled
+    if metadata.is_nsfw is not UNDEFINED:
+        data["is_nsfw"] = metadata.is_nsfw
+    if isinstance(metadata, SlashCommandMetadata):
+        data["description"] = _dump_localized(metadata.description)
+        data["options"] = (
+            [_dump_option(option) for option in metadata.options] if metadata.options is not None else None
+        )
+    return data
+
+
+def _load_metadata(
+    kind: str, data: dict[str, Any], make_autocomplete: Callable[[str], Autocomplete]
+) -> ApplicationMetadata:
+    kwargs: dict[str, Any] = {
+        "name": data["name"],
+        "display_name": _load_localized(data["display_name"]),
+        "guilds": data["guilds"],
+        "cooldown": _load_cooldown(data["cooldown"]),
+        "cache": _load_cache(data["cache"]),
+        "timeout": data["timeout"],
+    }
+    if "default_member_permissions" in data:
+        kwargs["default_member_permissions"] = Permissions(data["default_member_permissions"])
+    if "is_dm_enabled" in data:
+        kwargs["is_dm_enabled"] = data["is_dm_enabled"]
+    if "is_nsfw" in data:
+        kwargs["is_nsfw"] = data["is_nsfw"]
+    if kind == "slash":
+        kwargs["description"] = _load_localized(data["description"])
+        kwargs["options"] = (
+            [_load_option(option, make_autocomplete) for option in data["options"]]
+            if data["options"] is not None
+            else None
+        )
+    return _APPLICATION_METADATA[kind](**kwargs)
+
+
+def dump_command(command: CommandT) -> dict[str, Any]:
+    """Serialize the metadata of a command and its sub commands, without its callbacks."""
+    kind = next(kind for kind, type_ in _APPLICATION_METADATA.items() if type(command.metadata) is type_)
+    data: dict[str, Any] = {"kind": kind, "metadata": _dump_metadata(command.metadata)}  # type: ignore
+    if isinstance(command, CommandGroup):
+        data["commands"] = [
+            {"metadata": _dump_sub_command(item.metadata)}
+            if isinstance(item, SubCommand)
+            else {
+                "metadata": _dump_sub_command(item.metadata),
+                "commands": [_dump_sub_command(sub_command.metadata) for sub_command in item.commands.values()],
+            }
+            for item in command.commands.values()
+        ]
+    return data
+
+
+def load_command(
+    data: dict[str, Any], obj: object, make_callback: CallbackFactoryT, make_autocomplete: AutocompleteFactoryT
+) -> CommandT:
+    """Rebuild a command dumped by ``dump_command`` with the callbacks made by ``make_callback``.
+
+    ``obj`` becomes the object of a command group, its sub command callbacks are bound to it.
+    Options with autocomplete get the handlers made by ``make_autocomplete``.
+    """
+    metadata = _load_metadata(data["kind"], data["metadata"], functools.partial(make_autocomplete, None, None))
+    if "commands" not in data:
+        callback = make_callback(None, None)
+        return Command(callback, metadata, callback=callback)  # type: ignore
+    group = CommandGroup(obj, metadata)  # type: ignore
+    for item in data["commands"]:
+        name = item["metadata"]["name"]
+        if "commands" not in item:
+            sub_metadata = _load_sub_command(item["metadata"], functools.partial(make_autocomplete, None, name))
+            group.add_command(SubCommand(make_callback(None, name), sub_metadata))
+            continue
+        sub_group = SubCommandGroup(
+            _load_sub_command(item["metadata"], functools.partial(make_autocomplete, None, name))
+        )
+        for sub_command in item["commands"]:
+            sub_name = sub_command["name"]
+            sub_command_metadata = _load_sub_command(sub_command, functools.partial(make_autocomplete, name, sub_name))
+            sub_group.add_command(SubCommand(make_callback(name, sub_name), sub_command_metadata, group=sub_group))
+        group.add_command(sub_group)
+    return group
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class ModuleManifest:
+    """Commands of a module by their attribute names, valid while the module source keeps its fingerprint."""
+
+    fingerprint: str = attrs.field(repr=True, eq=True)
+    commands: dict[str, dict[str, Any]] = attrs.field(factory=dict, repr=False, eq=True)
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class CommandManifest:
+    """Persisted metadata of commands in modules, so commands can be synced before their modules are imported."""
+
+    modules: dict[str, ModuleManifest] = attrs.field(factory=dict, repr=False, eq=True)
+    _fingerprints: dict[str, str] = attrs.field(factory=dict, init=False, repr=False, eq=False)
+
+    def get_fingerprint(self, module: str) -> str | None:
+        """Return the fingerprint of the module's sources, computed once per package."""
+        return get_fingerprint(module, cache=self._fingerprints)
+
+    def get_module(self, module: str) -> ModuleManifest | None:
+        """Return the manifest of the module if its package sources did not change since it was made."""
+        if (manifest := self.modules.get(module)) is None:
+            return None
+        if manifest.fingerprint != self.get_fingerprint(module):
+            _LOGGER.debug("manifest of module %s is outdated", module)
+            return None
+        return manifest
+
+    def invalidate(self, *modules: str) -> None:
+        """Drop the manifests of the modules, or of every module if none are given."""
+        for module in modules or tuple(self.modules):
+            self.modules.pop(module, None)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> CommandManifest | None:
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            _LOGGER.warning("failed to read command manifest %s: %s", path, error)
+            return None
+        if not isinstance(data, dict) or data.get("version") != _VERSION:
+            _LOGGER.warning("ignoring command manifest %s with unsupported version", path)
+            return None
+        return cls(
+            modules={
+                name: ModuleManifest(fingerprint=module["fingerprint"], commands=module["commands"])
+                for name, module in data["modules"].items()
+            }
+        )
+
+    def save(self, path: str | PathLike[str]) -> None:
+        path = Path(path)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp.write_text(
+            json.dumps(
+                {
+                    "version": _VERSION,
+                    "modules": {
+                        name: {"fingerprint": module.fingerprint, "commands": module.commands}
+                        for name, module in self.modules.items()
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+        # Replacing is atomic, so concurrent readers never see a partially written file.
+        os.replace(temp, path)
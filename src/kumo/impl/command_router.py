@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from logging import getLogger
+from types import MappingProxyType, MethodType
+from typing import TYPE_CHECKING
+
+from hikari.commands import CommandType, OptionType
+
+from kumo.commands.base import Command, SubCommand
+from kumo.commands.binders import OptionsBinder, bind_message_target, bind_user_target
+
+if TYPE_CHECKING:
+    from hikari.interactions import CommandInteraction, CommandInteractionOption
+    from hikari.snowflakes import Snowflake
+
+    from kumo.commands.autocomplete import Autocomplete
+    from kumo.commands.binders import BinderT
+    from kumo.commands.caching import ResponseCache, ResponseCacheStore
+    from kumo.commands.cooldowns import Cooldown
+    from kumo.commands.options import Option
+    from kumo.commands.types import CommandCallbackT, CommandT
+
+__all__: Sequence[str] = ("Route", "CommandRouter")
+
+_LOGGER = getLogger("kumo.commands.router")
+
+_NO_AUTOCOMPLETE: Mapping[str, Autocomplete] = MappingProxyType({})
+"""Shared by routes without autocomplete handlers, so they allocate no mapping of their own."""
+
+RouteKey = tuple["Snowflake", str | None, str | None]
+"""Command ID, sub command group and sub command names of a route, ``None`` where the command has none."""
+
+
+class Route:
+    """Pre-bound callback of a command, sub command or sub command of a group, with its argument binder."""
+
+    __slots__: Sequence[str] = (
+        "command",
+        "callback",
+        "binder",
+        "path",
+        "autocomplete",
+        "cooldown",
+        "responses",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        command: CommandT,
+        callback: CommandCallbackT,
+        binder: BinderT,
+        path: str,
+        autocomplete: Mapping[str, Autocomplete] | None = None,
+        cooldown: Cooldown | None = None,
+        cache: ResponseCache | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.command: CommandT = command
+        self.callback: CommandCallbackT = callback
+        self.binder: BinderT = binder
+        self.path: str = path
+        """Space separated names of the command, sub command group and sub command."""
+        self.autocomplete: Mapping[str, Autocomplete] = autocomplete or _NO_AUTOCOMPLETE
+        """Autocomplete handlers of the options by their names."""
+        self.cooldown: Cooldown | None = cooldown
+        self.responses: ResponseCacheStore | None = None
+        if cache is not None:
+            from kumo.commands.caching import ResponseCacheStore
+
+            self.responses = ResponseCacheStore.from_cache(cache)
+        """Cached responses, if the callback opted in to caching."""
+        self.timeout: float | None = timeout
+
+
+def get_autocomplete(options: Sequence[Option] | None) -> Mapping[str, Autocomplete]:
+    autocomplete = {option.name: option.autocomplete for option in options or () if option.autocomplete is not None}
+    return autocomplete or _NO_AUTOCOMPLETE
+
+
+def compile_command(command: CommandT) -> dict[tuple[str | None, str | None], Route]:
+    """Compile routes of every callback reachable from the command."""
+    if isinstance(command, Command):
+        match command.metadata.command_type:  # type: ignore
+            case CommandType.USER:
+                binder = bind_user_target
+            case CommandType.MESSAGE:
+                binder = bind_message_target
+            case _:
+                binder = OptionsBinder(command.metadata.options)  # type: ignore
+        autocomplete = get_autocomplete(getattr(command.metadata, "options", None))
+        return {
+            (None, None): Route(
+                command,
+                command.get_callback(),
+                binder,
+                command.metadata.name,
+                autocomplete,
+                command.metadata.cooldown,
+                command.metadata.cache,
+                command.metadata.timeout,
+            )
+        }
+    routes: dict[tuple[str | None, str | None], Route] = {}
+    for name, item in command.commands.items():
+        if isinstance(item, SubCommand):
+            binder = OptionsBinder(item.metadata.options)
+            path = f"{command.metadata.name} {name}"
+            autocomplete = get_autocomplete(item.metadata.options)
+            callback = MethodType(item.callback, command.obj)
+            metadata = item.metadata
+            routes[None, name] = Route(
+                command, callback, binder, path, autocomplete, metadata.cooldown, metadata.cache, metadata.timeout
+            )
+            continue
+        for sub_name, sub_command in item.commands.items():
+            binder = OptionsBinder(sub_command.metadata.options)
+            path = f"{command.metadata.name} {name} {sub_name}"
+            callback = MethodType(sub_command.callback, command.obj)
+            autocomplete = get_autocomplete(sub_command.metadata.options)
+            metadata = sub_command.metadata
+            routes[name, sub_name] = Route(
+                command, callback, binder, path, autocomplete, metadata.cooldown, metadata.cache, metadata.timeout
+            )
+    return routes
+
+
+def get_route_key(interaction: CommandInteraction) -> tuple[RouteKey, Sequence[CommandInteractionOption]]:
+    """Return the route key of the interaction and the options of the invoked callback."""
+    command_id = interaction.command_id
+    options = interaction.options
+    if not options:
+        return (command_id, None, None), ()
+    option = options[0]
+    if option.type is OptionType.SUB_COMMAND_GROUP:
+        sub_option = option.options[0]  # type: ignore
+        return (command_id, option.name, sub_option.name), sub_option.options or ()
+    if option.type is OptionType.SUB_COMMAND:
+        return (command_id, None, option.name), option.options or ()
+    return (command_id, None, None), options
+
+
+class CommandRouter:
+    """Flat routing table of commands, keyed by the command ID, sub command group and sub command names.
+
+    Routes of each command are compiled once when it is added, and the table is rebuilt whenever
+    commands get mapped by new IDs, so routing an interaction costs a single lookup.
+    """
+
+    __slots__: Sequence[str] = ("_compiled", "routes")
+
+    def __init__(self) -> None:
+        self._compiled: dict[CommandT, dict[tuple[str | None, str | None], Route]] = {}
+        self.routes: dict[RouteKey, Route] = {}
+
+    def add_command(self, command: CommandT) -> None:
+        self._compiled[command] = compile_command(command)
+
+    def set_commands(self, commands: Mapping[Snowflake, CommandT]) -> None:
+        self.routes = {
+            (command_id, group, name): route
+            for command_id, command in commands.items()
+            for (group, name), route in self._compiled[command].items()
+        }
+        _LOGGER.debug("compiled %s routes", len(self.routes))
+
+    def add_route(self, command_id: Snowflake, command: CommandT) -> None:
+        for (group, name), route in self._compiled[command].items():
+            self.routes[command_id, group, name] = route
+
+    def refresh_command(self, command: CommandT) -> None:
+        """Recompile callbacks and autocomplete handlers of a command whose object was replaced.
+
+        Its routes are updated in place, so the routing table needs no rebuilding.
+        """
+        routes = self._compiled[command]
+        for key, route in compile_command(command).items():
+            if (current := routes.get(key)) is None:
+                _LOGGER.warning("command %s has no route %s", command.metadata.name, key)
+                continue
+            current.callback = route.callback
+            current.autocomplete = route.autocomplete
+
+    def get_compiled_route(self, command: CommandT, group: str | None, name: str | None) -> Route:
+        return self._compiled[command][group, name]
+
+    def get_route(self, interaction: CommandInteraction) -> tuple[Route | None, Sequence[CommandInteractionOption]]:
+        key, options = get_route_key(interaction)
+        return self.routes.get(key), options
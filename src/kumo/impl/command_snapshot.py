@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Sequence
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+__all__: Sequence[str] = ("CommandSnapshot",)
+
+_LOGGER = getLogger("kumo.commands.snapshot")
+
+_VERSION: int = 1
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class CommandSnapshot:
+    """Persisted name to ID maps of synced commands, bound to the hash of the command tree it was made from."""
+
+    tree_hash: str = attrs.field(repr=True, eq=True)
+    commands: dict[str, int] = attrs.field(factory=dict, repr=False, eq=True)
+    """IDs of global commands by their names."""
+    guilds: dict[int, dict[str, int]] = attrs.field(factory=dict, repr=False, eq=True)
+    """IDs of guild commands by their names, by guild ID."""
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> CommandSnapshot | None:
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            _LOGGER.warning("failed to read command snapshot %s: %s", path, error)
+            return None
+        if not isinstance(data, dict) or data.get("version") != _VERSION:
+            _LOGGER.warning("ignoring command snapshot %s with unsupported version", path)
+            return None
+        return cls(
+            tree_hash=data["tree_hash"],
+            commands={name: int(id_) for name, id_ in data["commands"].items()},
+            guilds={
+                int(guild): {name: int(id_) for name, id_ in commands.items()}
+                for guild, commands in data.get("guilds", {}).items()
+            },
+        )
+
+    def save(self, path: str | PathLike[str]) -> None:
+        path = Path(path)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp.write_text(
+            json.dumps(
+                {"version": _VERSION, "tree_hash": self.tree_hash, "commands": self.commands, "guilds": self.guilds}
+            ),
+            encoding="utf-8",
+        )
+        # Replacing is atomic, so concurrent readers never see a partially written file.
+        os.replace(temp, path)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import attrs
+from hikari.commands import CommandType, SlashCommand
+from hikari.undefined import UNDEFINED
+
+if TYPE_CHECKING:
+    from hikari import api
+    from hikari.applications import Application
+    from hikari.commands import PartialCommand
+    from hikari.snowflakes import Snowflake
+    from hikari.traits import RESTAware
+    from hikari.undefined import UndefinedOr
+
+    from kumo.commands.types import CommandT
+    from kumo.impl.command_builder import CommandBuilder
+
+__all__: Sequence[str] = ("SyncResult", "CommandSyncer", "hash_payload", "hash_tree")
+
+_LOGGER = getLogger("kumo.commands.syncer")
+
+
+def _normalize(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, Mapping):
+        return {
+            str(key): _normalize(item)
+            for key, item in value.items()
+            if item is not None and item is not False and item != {} and item != []
+        }
+    if isinstance(value, list | tuple):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def normalize_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
+    payload = dict(payload)
+    payload.pop("id", None)
+    # Discord treats a missing dm_permission as enabled and 0 permissions as "not set".
+    payload.setdefault("dm_permission", True)
+    if not payload.get("default_member_permissions"):
+        payload.pop("default_member_permissions", None)
+    return _normalize(json.loads(json.dumps(payload)))
+
+
+def hash_payload(payload: Mapping[str, Any]) -> str:
+    """Return a stable content hash of a command payload."""
+    return hashlib.sha256(
+        json.dumps(normalize_payload(payload), sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def hash_tree(payloads: Sequence[Mapping[str, Any]]) -> str:
+    """Return a stable content hash of a whole command tree, independent of the command order."""
+    return hashlib.sha256("".join(sorted(hash_payload(payload) for payload in payloads)).encode()).hexdigest()
+
+
+def serialize_remote(command: PartialCommand) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "type": command.type,
+        "name": command.name,
+        "name_localizations": dict(command.name_localizations),
+        "default_member_permissions": int(command.default_member_permissions),
+        "dm_permission": command.is_dm_enabled,
+        "nsfw": command.is_nsfw,
+    }
+    if isinstance(command, SlashCommand):
+        payload["description"] = command.description
+        payload["description_localizations"] = dict(command.description_localizations)
+        payload["options"] = [
+            command.app.entity_factory.serialize_command_option(option) for option in command.options or ()
+        ]
+    return payload
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class SyncResult:
+    guild_id: Snowflake | None = attrs.field(default=None)
+
+    unchanged: list[str] = attrs.field(factory=list)
+    created: list[str] = attrs.field(factory=list)
+    updated: list[str] = attrs.field(factory=list)
+    deleted: list[str] = attrs.field(factory=list)
+
+    commands: dict[str, PartialCommand] = attrs.field(factory=dict, repr=False)
+    exception: Exception | None = attrs.field(default=None, repr=False)
+    """Error which failed the whole sync."""
+    errors: dict[str, Exception] = attrs.field(factory=dict, repr=False)
+    """Errors of single commands by their names, the other commands are synced."""
+
+    def __str__(self) -> str:
+        if self.exception is not None:
+            return f"failed: {self.exception}"
+        return (
+            f"unchanged={len(self.unchanged)} created={len(self.created)} "
+            f"updated={len(self.updated)} deleted={len(self.deleted)} failed={len(self.errors)}"
+        )
+
+
+class CommandSyncer:
+    __slots__: Sequence[str] = ("bot", "builder")
+
+    def __init__(self, bot: RESTAware, builder: CommandBuilder) -> None:
+        self.bot = bot
+        self.builder = builder
+
+    def hash_commands(self, commands: Sequence[CommandT]) -> str:
+        return hash_tree([builder.build(self.bot.entity_factory) for builder in self.builder.build_commands(commands)])
+
+    async def sync(
+        self,
+        application: Application,
+        commands: Sequence[CommandT],
+        *,
+        guild: UndefinedOr[Snowflake] = UNDEFINED,
+        incremental: bool = False,
+    ) -> SyncResult:
+        builders = list(self.builder.build_commands(commands))
+        if incremental:
+            return await self.sync_incremental(application, builders, guild=guild)
+        return await self.sync_bulk(application, builders, guild=guild)
+
+    async def sync_guilds(
+        self,
+        application: Application,
+        commands: Mapping[Snowflake, Sequence[CommandT]],
+        *,
+        incremental: bool = False,
+        max_concurrency: int = 10,
+    ) -> dict[Snowflake, SyncResult]:
+        """Sync guild commands of many guilds concurrently.
+
+        Every guild route has its own rate limit bucket, so guilds are synced in parallel, but no more
+        than ``max_concurrency`` at once to stay within the global rate limit. Commands are built once
+        and shared between guilds. A failure in one guild is reported in its result and does not stop
+        the others.
+        """
+        built: dict[int, api.CommandBuilder] = {}
+        for guild_commands in commands.values():
+            for command in guild_commands:
+                if id(command) not in built:
+                    built[id(command)] = self.builder.build_command_or_group(command)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def sync_guild(guild: Snowflake, builders: Sequence[api.CommandBuilder]) -> SyncResult:
+            async with semaphore:
+                try:
+                    if incremental:
+                        return await self.sync_incremental(application, builders, guild=guild)
+                    return await self.sync_bulk(application, builders, guild=guild)
+                except Exception as error:
+                    _LOGGER.error("failed to sync commands in guild %s: %s", guild, error)
+                    return SyncResult(guild_id=guild, exception=error)
+
+        results = await asyncio.gather(*(
+            sync_guild(guild, [built[id(command)] for command in guild_commands])
+            for guild, guild_commands in commands.items()
+        ))
+        return {result.guild_id: result for result in results if result.guild_id is not None}
+
+    async def sync_bulk(
+        self,
+        application: Application,
+        builders: Sequence[api.CommandBuilder],
+        *,
+        guild: UndefinedOr[Snowflake] = UNDEFINED,
+    ) -> SyncResult:
+        result = SyncResult(guild_id=guild or None)
+        for remote in await self.bot.rest.set_application_commands(application, builders, guild):
+            result.updated.append(remote.name)
+            result.commands[remote.name] = remote
+        return result
+
+    async def sync_incremental(
+        self,
+        application: Application,
+        builders: Sequence[api.CommandBuilder],
+        *,
+        guild: UndefinedOr[Snowflake] = UNDEFINED,
+    ) -> SyncResult:
+        """Create, update or delete only the commands which differ from the remote ones.
+
+        Requests run concurrently, a failed one is recorded in ``errors`` of the result and does not
+        stop the others.
+        """
+        result = SyncResult(guild_id=guild or None)
+        remotes: dict[tuple[CommandType, str], PartialCommand] = {
+            (remote.type, remote.name): remote
+            for remote in await self.bot.rest.fetch_application_commands(application, guild)
+        }
+
+        async def upsert(builder: api.CommandBuilder, names: list[str]) -> None:
+            try:
+                # Creating a command with the name of an existing one overwrites it and keeps its ID.
+                remote = await builder.create(self.bot.rest, application, guild=guild)
+            except Exception as error:
+                _LOGGER.error("failed to sync command %s: %s", builder.name, error)
+                result.errors[builder.name] = error
+                return
+            names.append(remote.name)
+            result.commands[remote.name] = remote
+
+        async def delete(remote: PartialCommand) -> None:
+            try:
+                await self.bot.rest.delete_application_command(application, remote, guild)
+            except Exception as error:
+                _LOGGER.error("failed to delete command %s: %s", remote.name, error)
+                result.errors[remote.name] = error
+                return
+            result.deleted.append(remote.name)
+
+        async with asyncio.TaskGroup() as group:
+            for builder in builders:
+                remote = remotes.pop((CommandType(builder.type), builder.name), None)
+                if remote is None:
+                    group.create_task(upsert(builder, result.created))
+                elif hash_payload(builder.build(self.bot.entity_factory)) != hash_payload(serialize_remote(remote)):
+                    _LOGGER.debug("command %s has changed", builder.name)
+                    group.create_task(upsert(builder, result.updated))
+                else:
+                    result.unchanged.append(remote.name)
+                    result.commands[remote.name] = remote
+            for remote in remotes.values():
+                group.create_task(delete(remote))
+        return result
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from hikari.interactions import ComponentInteraction, ModalInteraction
+
+from kumo.context import ComponentInteractionContext, ModalInteractionContext
+from kumo.events.components_events import ComponentCallbackErrorEvent
+from kumo.impl.component_router import ComponentRouter
+from kumo.internal.phases import phase
+
+if TYPE_CHECKING:
+    from hikari.api import InteractionResponseBuilder
+    from hikari.events import InteractionCreateEvent
+    from hikari.traits import GatewayBotAware, RESTBotAware
+
+    from kumo.components.base import Component
+    from kumo.impl.command_handler import CommandHandler
+    from kumo.impl.component_router import ComponentRoute
+    from kumo.tracing.abc import ISpan
+
+__all__: Sequence[str] = ()
+
+_LOGGER = getLogger("kumo.components")
+
+ContextT = ComponentInteractionContext | ModalInteractionContext
+
+
+class ComponentHandler:
+    """Dispatches message components and modals to the components whose patterns match their custom IDs.
+
+    Callbacks run in the scheduler of the command handler, with its localization and tracer. Their
+    concurrency limits are named ``component:<pattern>``, apart from the limits of commands.
+    Interactions with unknown custom IDs are left to other listeners.
+    """
+
+    __slots__: Sequence[str] = ("bot", "commands", "components", "modals")
+
+    def __init__(self, bot: GatewayBotAware | RESTBotAware, commands: CommandHandler) -> None:
+        self.bot = bot
+        self.commands: CommandHandler = commands
+        self.components = ComponentRouter()
+        self.modals = ComponentRouter()
+
+    def add_component(self, component: Component) -> None:
+        (self.modals if component.is_modal else self.components).add_component(component)
+
+    def create_context(
+        self,
+        interaction: ComponentInteraction | ModalInteraction,
+        *,
+        response_future: asyncio.Future[InteractionResponseBuilder] | None = None,
+        span: ISpan | None = None,
+    ) -> ContextT:
+        type_ = ModalInteractionContext if isinstance(interaction, ModalInteraction) else ComponentInteractionContext
+        context = type_(
+            bot=self.bot,
+            interaction=interaction,  # type: ignore
+            i18n=self.commands.i18n,
+            translator=self.commands.translator,
+            response_future=response_future,
+        )
+        if span is not None:
+            context.tracer, context.span = self.commands.tracer, span
+        return context
+
+    def open_context(
+        self,
+        interaction: ComponentInteraction | ModalInteraction,
+        *,
+        response_future: asyncio.Future[InteractionResponseBuilder] | None = None,
+    ) -> ContextT:
+        """Create the context of a received interaction, starting its trace if tracing is enabled."""
+        if (tracer := self.commands.tracer) is None:
+            return self.create_context(interaction, response_future=response_future)
+        # This is kept inline, so bots without a tracer do not import the tracing package.
+        from kumo.tracing.spans import start_interaction_span
+
+        span = start_interaction_span(tracer, interaction, {"component.custom_id": interaction.custom_id})
+        with phase(tracer, span, "create_context"):
+            return self.create_context(interaction, response_future=response_future, span=span)
+
+    async def dispatch(self, event: InteractionCreateEvent) -> None:
+        assert isinstance(event.interaction, ComponentInteraction | ModalInteraction)
+        self.dispatch_context(self.open_context(event.interaction))
+
+    def dispatch_context(self, context: ContextT) -> asyncio.Task[None] | None:
+        """Route the interaction of the context and schedule its callback, returns ``None`` if nothing ran."""
+        router = self.modals if isinstance(context, ModalInteractionContext) else self.components
+        span = context.span
+        try:
+            with phase(self.commands.tracer, span, "route"):
+                route, kwargs = router.get_route(context.interaction.custom_id)
+        except BaseException as error:
+            if span is not None:
+                span.record_exception(error)
+                span.end()
+            raise
+        if route is None:
+            _LOGGER.debug("no component matches custom ID %r", context.interaction.custom_id)
+            if span is not None:
+                span.set_attribute("interaction.unhandled", True)
+                span.end()
+            return None
+        task = self.commands.scheduler.submit(
+            route.name,
+            context,
+            self._handle_callback(route, context, **kwargs),
+            task_name=f"interaction (id: {context.interaction.id})",
+        )
+        if span is not None:
+            span.set_attribute("component.pattern", route.component.pattern)
+            if task is None:
+                span.set_attribute("interaction.rejected", True)
+                span.end()
+        return task
+
+    async def respond(
+        self, interaction: ComponentInteraction | ModalInteraction, *, timeout: float = 2.5
+    ) -> InteractionResponseBuilder:
+        """Dispatch an interaction received over HTTP and return its initial response for the HTTP reply.
+
+        Interactions which are not answered within ``timeout`` seconds, or not handled at all, are deferred.
+        """
+        future: asyncio.Future[InteractionResponseBuilder] = self.commands.loop.create_future()
+        context = self.open_context(interaction, response_future=future)
+        if (task := self.dispatch_context(context)) is not None:
+            await asyncio.wait((future, task), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if not future.done():
+            if isinstance(context, ComponentInteractionContext):
+                await context.defer_update()
+            else:
+                await context.defer()
+        return future.result()
+
+    async def _handle_callback(self, route: ComponentRoute, context: ContextT, **kwargs: Any) -> None:  # noqa: ANN401
+        exception: Exception | None = None
+        try:
+            with phase(self.commands.tracer, context.span, "callback"):
+                await route.callback(context, **kwargs)
+        except Exception as error:
+            exception = error
+            # REST bots have no event manager, their errors are only logged.
+            event_manager = getattr(self.bot, "event_manager", None)
+            if event_manager is not None and event_manager.get_listeners(ComponentCallbackErrorEvent):
+                _LOGGER.debug("exception occurred in component %s callback: %s", route.component.pattern, error)
+                event_manager.dispatch(ComponentCallbackErrorEvent(exception=error, context=context))
+            else:
+                _LOGGER.error(
+                    "exception occurred in component %s callback: %s", route.component.pattern, error, exc_info=error
+                )
+        finally:
+            if context.span is not None:
+                if exception is not None:
+                    context.span.record_exception(exception)
+                context.span.end()
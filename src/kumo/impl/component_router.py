@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from kumo.components.base import SEPARATOR, Placeholder
+
+if TYPE_CHECKING:
+    from kumo.components.base import Component
+    from kumo.components.types import ComponentCallbackT
+
+__all__: Sequence[str] = ("ComponentRoute", "ComponentRouter")
+
+_LOGGER = getLogger("kumo.components.router")
+
+
+class ComponentRoute:
+    """Pre-bound callback of a component with the placeholders of its pattern."""
+
+    __slots__: Sequence[str] = ("component", "callback", "placeholders", "name")
+
+    def __init__(self, component: Component, callback: ComponentCallbackT) -> None:
+        self.component: Component = component
+        self.callback: ComponentCallbackT = callback
+        self.placeholders: Sequence[Placeholder] = component.placeholders
+        self.name: str = f"component:{component.pattern}"
+        """Name of the component in the scheduler, so it does not share limits with a command of that name."""
+
+
+class _Node:
+    __slots__: Sequence[str] = ("children", "wildcard", "route")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.wildcard: _Node | None = None
+        self.route: ComponentRoute | None = None
+
+
+class ComponentRouter:
+    """Routes custom IDs to components in time independent of the number of patterns.
+
+    Patterns without placeholders are looked up in a table by the whole custom ID, the others in a
+    trie of segments. Literal segments take precedence over placeholders, and a custom ID whose
+    arguments do not convert to the types of the placeholders does not match.
+    """
+
+    __slots__: Sequence[str] = ("_exact", "_root")
+
+    def __init__(self) -> None:
+        self._exact: dict[str, ComponentRoute] = {}
+        self._root: _Node = _Node()
+
+    def __len__(self) -> int:
+        return len(self._exact) + sum(1 for _ in self._routes(self._root))
+
+    def _routes(self, node: _Node) -> Iterator[ComponentRoute]:
+        if node.route is not None:
+            yield node.route
+        for child in node.children.values():
+            yield from self._routes(child)
+        if node.wildcard is not None:
+            yield from self._routes(node.wildcard)
+
+    def add_component(self, component: Component) -> None:
+        route = ComponentRoute(component, component.get_callback())
+        if not route.placeholders:
+            if (existing := self._exact.get(component.pattern)) is not None:
+                raise ValueError(f"pattern {component.pattern!r} is already handled by {existing.component.obj!r}")
+            self._exact[component.pattern] = route
+            return
+        node = self._root
+        for segment in component.segments:
+            if isinstance(segment, Placeholder):
+                if node.wildcard is None:
+                    node.wildcard = _Node()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _Node())
+        if node.route is not None:
+            raise ValueError(f"pattern {component.pattern!r} overlaps pattern {node.route.component.pattern!r}")
+        node.route = route
+        _LOGGER.debug("add component %s", component.pattern)
+
+    def get_route(self, custom_id: str) -> tuple[ComponentRoute | None, dict[str, Any]]:
+        if (route := self._exact.get(custom_id)) is not None:
+            return route, {}
+        return self._match(self._root, custom_id.split(SEPARATOR), 0, []) or (None, {})
+
+    def _match(
+        self, node: _Node, segments: list[str], index: int, values: list[str]
+    ) -> tuple[ComponentRoute, dict[str, Any]] | None:
+        if index == len(segments):
+            if node.route is None:
+                return None
+            try:
+                return node.route, {
+                    placeholder.name: placeholder.convert(value)
+                    for placeholder, value in zip(node.route.placeholders, values, strict=True)
+                }
+            except ValueError:
+                return None
+        if (child := node.children.get(segments[index])) is not None and (
+            result := self._match(child, segments, index + 1, values)
+        ) is not None:
+            return result
+        if node.wildcard is None:
+            return None
+        values.append(segments[index])
+        try:
+            return self._match(node.wildcard, segments, index + 1, values)
+        finally:
+            values.pop()
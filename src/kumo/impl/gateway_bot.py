@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
-from hikari.events import InteractionCreateEvent
+from hikari.events import InteractionCreateEvent, StartingEvent, StoppingEvent
 from hikari.impl import gateway_bot
+from hikari.intents import Intents
 from hikari.interactions import InteractionType
 from hikari.internal import data_binding
 
@@ -16,11 +18,16 @@ if TYPE_CHECKING:
 
     from hikari.guilds import PartialGuild
     from hikari.impl import CacheSettings, HTTPSettings, ProxySettings
-    from hikari.intents import Intents
-    from hikari.snowflakes import SnowflakeishOr
+    from hikari.snowflakes import SnowflakeishOr, SnowflakeishSequence
 
-    from kumo.commands.types import CommandT
+    from kumo.commands.abc import ICooldownStore
+    from kumo.commands.types import CommandT, TimeoutHookT
+    from kumo.components.base import Component
     from kumo.i18n.abc.ilocalization_provider import ILocalizationProvider
+    from kumo.impl.component_handler import ComponentHandler
+    from kumo.impl.interaction_scheduler import InteractionScheduler
+    from kumo.metrics.registry import MetricsRegistry
+    from kumo.tracing.abc import ITracer
 
 __all__: Sequence[str] = ()
 
@@ -50,7 +57,20 @@ class GatewayBot(gateway_bot.GatewayBot):
         proxy_settings: ProxySettings | None = None,
         rest_url: str | None = None,
         sync_commands_flag: bool = True,
+        incremental_sync: bool = False,
+        command_snapshot: str | PathLike[str] | None = None,
+        command_manifest: str | PathLike[str] | None = None,
+        warm_up_delay: float | None = None,
         default_guild: SnowflakeishOr[PartialGuild] | None = None,
+        guild_sync_concurrency: int = 10,
+        scheduler: InteractionScheduler | None = None,
+        drain_timeout: float | None = 10.0,
+        auto_defer: float | None = None,
+        metrics: MetricsRegistry | None = None,
+        tracer: ITracer | None = None,
+        cooldown_store: ICooldownStore | None = None,
+        callback_timeout: float | None = None,
+        on_timeout: TimeoutHookT | None = None,
     ) -> None:
         super().__init__(
             token,
@@ -71,17 +91,71 @@ class GatewayBot(gateway_bot.GatewayBot):
             proxy_settings=proxy_settings,
             rest_url=rest_url,
         )
-        self.commands: CommandHandler = CommandHandler(self, i18n=i18n)
+        self.commands: CommandHandler = CommandHandler(
+            self,
+            i18n=i18n,
+            incremental_sync=incremental_sync,
+            snapshot_path=command_snapshot,
+            default_guild=default_guild,
+            guild_sync_concurrency=guild_sync_concurrency,
+            scheduler=scheduler,
+            drain_timeout=drain_timeout,
+            auto_defer=auto_defer,
+            metrics=metrics,
+            tracer=tracer,
+            manifest_path=command_manifest,
+            warm_up_delay=warm_up_delay,
+            cooldown_store=cooldown_store,
+            callback_timeout=callback_timeout,
+            on_timeout=on_timeout,
+        )
+        self._components: ComponentHandler | None = None
+        self.sync_commands_flag: bool = sync_commands_flag
+        self.event_manager.subscribe(StartingEvent, self.on_starting)
+        self.event_manager.subscribe(StoppingEvent, self.on_stopping)
         self.event_manager.subscribe(InteractionCreateEvent, self.on_interaction)
 
+    async def on_starting(self, _: StartingEvent) -> None:
+        await self.commands.start(self.sync_commands_flag)
+
+    async def on_stopping(self, _: StoppingEvent) -> None:
+        await self.commands.stop()
+
     async def on_interaction(self, event: InteractionCreateEvent) -> None:
         if event.interaction.type is InteractionType.APPLICATION_COMMAND:
             await self.commands.dispatch(event)
+        elif event.interaction.type is InteractionType.AUTOCOMPLETE:
+            await self.commands.dispatch_autocomplete(event)
+        elif event.interaction.type in (InteractionType.MESSAGE_COMPONENT, InteractionType.MODAL_SUBMIT):
+            await self.components.dispatch(event)
+
+    @property
+    def components(self) -> ComponentHandler:
+        """Handler of message components and modals, made on first use."""
+        if self._components is None:
+            from kumo.impl.component_handler import ComponentHandler
+
+            self._components = ComponentHandler(self, self.commands)
+        return self._components
 
     def init_command(self, command: CommandT) -> CommandT:
         command.obj = command.obj()
         return command
 
-    def add_command(self, command: CommandT) -> None:
+    def add_command(self, command: CommandT, *, guilds: SnowflakeishSequence[PartialGuild] | None = None) -> None:
         command = self.init_command(command)
-        self.commands.add_command(command)
+        self.commands.add_command(command, guilds=guilds)
+
+    def load_module(
+        self, name: str, *, lazy: bool = True, guilds: SnowflakeishSequence[PartialGuild] | None = None
+    ) -> Sequence[CommandT]:
+        """Add every top-level command of the module, deferring its import if the command manifest allows."""
+        return self.commands.loader.load_module(name, lazy=lazy, guilds=guilds)
+
+    def init_component(self, component: Component) -> Component:
+        if inspect.isclass(component.obj):
+            component.obj = component.obj()
+        return component
+
+    def add_component(self, component: Component) -> None:
+        self.components.add_component(self.init_component(component))
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import enum
+from collections import deque
+from collections.abc import Coroutine, Mapping, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import attrs
+
+if TYPE_CHECKING:
+    from asyncio.events import AbstractEventLoop
+
+    from kumo.context import InteractionContext
+
+__all__: Sequence[str] = ("OverflowPolicy", "DrainResult", "InteractionScheduler")
+
+_LOGGER = getLogger("kumo.commands.scheduler")
+
+
+class OverflowPolicy(enum.Enum):
+    """What happens to an interaction that cannot run right away."""
+
+    REJECT = enum.auto()
+    """Reply with the busy message right away, without running the callback."""
+    DEFER = enum.auto()
+    """Defer the response before waiting in the queue, so the callback can respond later."""
+
+
+@attrs.define(kw_only=True, weakref_slot=False, frozen=True)
+class DrainResult:
+    completed: int = attrs.field(default=0)
+    cancelled: int = attrs.field(default=0)
+
+
+class Limiter:
+    """Counting semaphore which can be acquired without waiting."""
+
+    __slots__: Sequence[str] = ("value", "waiters")
+
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+    def try_acquire(self) -> bool:
+        if self.value > 0 and not self.waiters:
+            self.value -= 1
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        if self.try_acquire():
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation, pass it on.
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+    def release(self) -> None:
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.value += 1
+
+
+class InteractionScheduler:
+    """Runs interaction callbacks within global and per-command concurrency limits.
+
+    Interactions that cannot run right away are rejected with an ephemeral ``busy_message`` without
+    running their callbacks, or deferred to wait in a queue of at most ``max_queue`` entries,
+    following the overflow ``policy``. Once the queue is full, new interactions are rejected too.
+
+    Running tasks are kept in ``tasks`` until they finish, so they are not garbage collected
+    and can be drained on shutdown.
+    """
+
+    __slots__: Sequence[str] = (
+        "_global",
+        "_commands",
+        "_loop",
+        "closed",
+        "tasks",
+        "queued",
+        "max_concurrency",
+        "command_concurrency",
+        "command_limits",
+        "max_queue",
+        "policy",
+        "busy_message",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        command_concurrency: int | None = None,
+        command_limits: Mapping[str, int] | None = None,
+        max_queue: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DEFER,
+        busy_message: str = "The bot is busy right now, please try again later.",
+        loop: AbstractEventLoop | None = None,
+    ) -> None:
+        self._global: Limiter | None = Limiter(max_concurrency) if max_concurrency is not None else None
+        self._commands: dict[str, Limiter] = {}
+        self._loop: AbstractEventLoop | None = loop
+
+        self.closed: bool = False
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.queued: int = 0
+        self.max_concurrency: int | None = max_concurrency
+        self.command_concurrency: int | None = command_concurrency
+        self.command_limits: Mapping[str, int] = command_limits or {}
+        self.max_queue: int = max_queue
+        self.policy: OverflowPolicy = policy
+        self.busy_message: str = busy_message
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        if not self._loop:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def get_limiters(self, name: str) -> tuple[Limiter, ...]:
+        limiter = self._commands.get(name)
+        if limiter is None and (limit := self.command_limits.get(name, self.command_concurrency)) is not None:
+            limiter = self._commands[name] = Limiter(limit)
+        # The command limiter goes first, so waiting for it does not hold a global slot.
+        return tuple(item for item in (limiter, self._global) if item is not None)
+
+    def submit(
+        self, name: str, context: InteractionContext[Any], coroutine: Coroutine[Any, Any, None], *, task_name: str
+    ) -> asyncio.Task[None] | None:
+        """Schedule the callback coroutine of the named command, returns ``None`` if it was rejected."""
+        if self.closed:
+            _LOGGER.debug("rejecting interaction %s of command %s, scheduler is closed", context.interaction.id, name)
+            coroutine.close()
+            self.track(self.loop.create_task(self.reject(context), name=f"reject {task_name}"))
+            return None
+        limiters = self.get_limiters(name)
+        acquired: list[Limiter] = []
+        for limiter in limiters:
+            if not limiter.try_acquire():
+                break
+            acquired.append(limiter)
+        else:
+            return self.track(self.loop.create_task(self._run(limiters, coroutine), name=task_name))
+        for limiter in acquired:
+            limiter.release()
+
+        if self.policy is OverflowPolicy.REJECT or self.queued >= self.max_queue:
+            _LOGGER.warning(
+                "rejecting interaction %s of command %s, %s",
+                context.interaction.id,
+                name,
+                "no slot is free" if self.policy is OverflowPolicy.REJECT else "queue is full",
+            )
+            coroutine.close()
+            self.track(self.loop.create_task(self.reject(context), name=f"reject {task_name}"))
+            return None
+        self.queued += 1
+        return self.track(self.loop.create_task(self._run_queued(limiters, context, coroutine), name=task_name))
+
+    def track(self, task: asyncio.Task[None]) -> asyncio.Task[None]:
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def drain(self, timeout: float | None = None) -> DrainResult:
+        """Refuse new interactions and wait for in-flight ones, cancelling those still running after ``timeout``."""
+        self.closed = True
+        if not self.tasks:
+            return DrainResult()
+        _LOGGER.info("waiting for %s in-flight interactions", len(self.tasks))
+        done, pending = await asyncio.wait(tuple(self.tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOGGER.warning("cancelling %s interactions still running after %ss", len(pending), timeout)
+            await asyncio.gather(*pending, return_exceptions=True)
+        return DrainResult(completed=len(done), cancelled=len(pending))
+
+    async def reject(self, context: InteractionContext[Any]) -> None:
+        try:
+            await context.create_response(self.busy_message, ephemeral=True)
+        except Exception as error:
+            _LOGGER.error("failed to reject interaction %s: %s", context.interaction.id, error)
+
+    @staticmethod
+    def _discard(context: InteractionContext[Any], coroutine: Coroutine[Any, Any, None]) -> None:
+        # The callback never started, so it cannot end the trace of its interaction itself.
+        coroutine.close()
+        if context.span is not None:
+            context.span.set_attribute("interaction.cancelled", True)
+            context.span.end()
+
+    async def _run(self, limiters: Sequence[Limiter], coroutine: Coroutine[Any, Any, None]) -> None:
+        try:
+            await coroutine
+        finally:
+            for limiter in limiters:
+                limiter.release()
+
+    async def _run_queued(
+        self, limiters: Sequence[Limiter], context: InteractionContext[Any], coroutine: Coroutine[Any, Any, None]
+    ) -> None:
+        acquired: list[Limiter] = []
+        try:
+            try:
+                await context.defer()
+            except Exception as error:
+                _LOGGER.error("failed to defer queued interaction %s: %s", context.interaction.id, error)
+                self._discard(context, coroutine)
+                return
+            for limiter in limiters:
+                await limiter.acquire()
+                acquired.append(limiter)
+        except BaseException:
+            self._discard(context, coroutine)
+            for limiter in acquired:
+                limiter.release()
+            raise
+        finally:
+            self.queued -= 1
+        await self._run(limiters, coroutine)
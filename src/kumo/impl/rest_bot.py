@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from hikari.impl import rest_bot
+from hikari.interactions import AutocompleteInteraction, CommandInteraction, ComponentInteraction, ModalInteraction
+
+from kumo.impl.command_handler import CommandHandler
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from os import PathLike
+
+    from hikari.api import InteractionResponseBuilder
+    from hikari.applications import TokenType
+    from hikari.guilds import PartialGuild
+    from hikari.impl import HTTPSettings, ProxySettings
+    from hikari.snowflakes import SnowflakeishOr, SnowflakeishSequence
+
+    from kumo.commands.abc import ICooldownStore
+    from kumo.commands.types import CommandT, TimeoutHookT
+    from kumo.components.base import Component
+    from kumo.i18n.abc.ilocalization_provider import ILocalizationProvider
+    from kumo.i18n.types import Localized
+    from kumo.impl.component_handler import ComponentHandler
+    from kumo.impl.interaction_scheduler import InteractionScheduler
+    from kumo.metrics.registry import MetricsRegistry
+    from kumo.tracing.abc import ITracer
+
+__all__: Sequence[str] = ()
+
+
+class RESTBot(rest_bot.RESTBot):
+    """Bot receiving interactions over an HTTP endpoint instead of the gateway.
+
+    The initial response of a callback is sent in the HTTP reply, later ones go through REST.
+    The bot keeps no state between requests, so replicas can run behind a load balancer;
+    set ``sync_commands_flag`` on one of them only.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        token_type: TokenType | str | None = None,
+        public_key: bytes | str | None = None,
+        *,
+        i18n: ILocalizationProvider | None = None,
+        allow_color: bool = True,
+        banner: str | None = "hikari",
+        suppress_optimization_warning: bool = False,
+        executor: Executor | None = None,
+        force_color: bool = False,
+        http_settings: HTTPSettings | None = None,
+        logs: None | str | int | dict[str, Any] | PathLike[str] = "INFO",
+        max_rate_limit: float = 300,
+        max_retries: int = 3,
+        proxy_settings: ProxySettings | None = None,
+        rest_url: str | None = None,
+        sync_commands_flag: bool = True,
+        incremental_sync: bool = False,
+        command_snapshot: str | PathLike[str] | None = None,
+        command_manifest: str | PathLike[str] | None = None,
+        warm_up_delay: float | None = None,
+        default_guild: SnowflakeishOr[PartialGuild] | None = None,
+        guild_sync_concurrency: int = 10,
+        scheduler: InteractionScheduler | None = None,
+        drain_timeout: float | None = 10.0,
+        auto_defer: float | None = None,
+        metrics: MetricsRegistry | None = None,
+        tracer: ITracer | None = None,
+        cooldown_store: ICooldownStore | None = None,
+        callback_timeout: float | None = None,
+        on_timeout: TimeoutHookT | None = None,
+        error_message: Localized | str | None = "Something went wrong, please try again later.",
+        response_timeout: float = 2.5,
+    ) -> None:
+        super().__init__(
+            token,
+            token_type,
+            public_key,
+            allow_color=allow_color,
+            banner=banner,
+            suppress_optimization_warning=suppress_optimization_warning,
+            executor=executor,
+            force_color=force_color,
+            http_settings=http_settings,
+            logs=logs,
+            max_rate_limit=max_rate_limit,
+            max_retries=max_retries,
+            proxy_settings=proxy_settings,
+            rest_url=rest_url,
+        )
+        self.commands: CommandHandler = CommandHandler(
+            self,
+            i18n=i18n,
+            incremental_sync=incremental_sync,
+            snapshot_path=command_snapshot,
+            default_guild=default_guild,
+            guild_sync_concurrency=guild_sync_concurrency,
+            scheduler=scheduler,
+            drain_timeout=drain_timeout,
+            auto_defer=auto_defer,
+            metrics=metrics,
+            tracer=tracer,
+            manifest_path=command_manifest,
+            warm_up_delay=warm_up_delay,
+            cooldown_store=cooldown_store,
+            callback_timeout=callback_timeout,
+            on_timeout=on_timeout,
+            error_message=error_message,
+        )
+        self._components: ComponentHandler | None = None
+        self.sync_commands_flag: bool = sync_commands_flag
+        self.response_timeout: float = response_timeout
+        self.add_startup_callback(self.on_starting)
+        self.add_shutdown_callback(self.on_stopping)
+        self.set_listener(CommandInteraction, self.on_command_interaction)
+        self.set_listener(AutocompleteInteraction, self.on_autocomplete_interaction)  # type: ignore
+        self.set_listener(ComponentInteraction, self.on_component_interaction)  # type: ignore
+        self.set_listener(ModalInteraction, self.on_component_interaction)  # type: ignore
+
+    async def on_starting(self, _: rest_bot.RESTBot) -> None:
+        await self.commands.start(self.sync_commands_flag)
+
+    async def on_stopping(self, _: rest_bot.RESTBot) -> None:
+        await self.commands.stop()
+
+    async def on_command_interaction(self, interaction: CommandInteraction) -> InteractionResponseBuilder:
+        return await self.commands.respond(interaction, timeout=self.response_timeout)
+
+    async def on_autocomplete_interaction(self, interaction: AutocompleteInteraction) -> InteractionResponseBuilder:
+        return await self.commands.respond_autocomplete(interaction)
+
+    async def on_component_interaction(
+        self, interaction: ComponentInteraction | ModalInteraction
+    ) -> InteractionResponseBuilder:
+        return await self.components.respond(interaction, timeout=self.response_timeout)
+
+    @property
+    def components(self) -> ComponentHandler:
+        """Handler of message components and modals, made on first use."""
+        if self._components is None:
+            from kumo.impl.component_handler import ComponentHandler
+
+            self._components = ComponentHandler(self, self.commands)
+        return self._components
+
+    def init_command(self, command: CommandT) -> CommandT:
+        command.obj = command.obj()
+        return command
+
+    def add_command(self, command: CommandT, *, guilds: SnowflakeishSequence[PartialGuild] | None = None) -> None:
+        command = self.init_command(command)
+        self.commands.add_command(command, guilds=guilds)
+
+    def load_module(
+        self, name: str, *, lazy: bool = True, guilds: SnowflakeishSequence[PartialGuild] | None = None
+    ) -> Sequence[CommandT]:
+        """Add every top-level command of the module, deferring its import if the command manifest allows."""
+        return self.commands.loader.load_module(name, lazy=lazy, guilds=guilds)
+
+    def init_component(self, component: Component) -> Component:
+        if inspect.isclass(component.obj):
+            component.obj = component.obj()
+        return component
+
+    def add_component(self, component: Component) -> None:
+        self.components.add_component(self.init_component(component))
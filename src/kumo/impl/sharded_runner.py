@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import Callable, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import attrs
+from hikari.events import StartingEvent, StoppingEvent
+
+if TYPE_CHECKING:
+    from multiprocessing.context import SpawnProcess
+    from multiprocessing.queues import Queue
+    from os import PathLike
+
+    from kumo.impl.gateway_bot import GatewayBot
+
+__all__: Sequence[str] = ("Heartbeat", "WorkerHealth", "ShardedRunner")
+
+_LOGGER = getLogger("kumo.runner")
+
+BotFactoryT = Callable[[], "GatewayBot"]
+
+
+@attrs.define(kw_only=True, weakref_slot=False, frozen=True)
+class Heartbeat:
+    """Status a worker reports to the runner."""
+
+    index: int = attrs.field()
+    pid: int = attrs.field()
+    timestamp: float = attrs.field()
+    latency: float = attrs.field()
+    guilds: int = attrs.field()
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class WorkerHealth:
+    """Health of a worker as seen by the runner."""
+
+    index: int = attrs.field()
+    shard_ids: Sequence[int] = attrs.field()
+    pid: int | None = attrs.field(default=None)
+    alive: bool = attrs.field(default=False)
+    restarts: int = attrs.field(default=0)
+    started_at: float = attrs.field(default=0.0)
+    last_heartbeat: float | None = attrs.field(default=None)
+    latency: float | None = attrs.field(default=None)
+    guilds: int = attrs.field(default=0)
+
+
+def _run_worker(
+    factory: BotFactoryT,
+    index: int,
+    shard_ids: Sequence[int],
+    shard_count: int,
+    snapshot_path: str | PathLike[str],
+    heartbeats: Queue[Heartbeat],
+    heartbeat_interval: float,
+) -> None:
+    bot = factory()
+    # The coordinator has synced the commands already, workers only map them from the snapshot.
+    bot.sync_commands_flag = False
+    bot.commands.snapshot_path = snapshot_path
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def beat() -> None:
+        while True:
+            heartbeats.put_nowait(
+                Heartbeat(
+                    index=index,
+                    pid=os.getpid(),
+                    timestamp=time.time(),
+                    latency=bot.heartbeat_latency,
+                    guilds=len(bot.cache.get_guilds_view()),
+                )
+            )
+            await asyncio.sleep(heartbeat_interval)
+
+    async def on_starting(_: StartingEvent) -> None:
+        task = asyncio.create_task(beat(), name=f"worker {index} heartbeat")
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def on_stopping(_: StoppingEvent) -> None:
+        for task in tasks:
+            task.cancel()
+
+    bot.event_manager.subscribe(StartingEvent, on_starting)
+    bot.event_manager.subscribe(StoppingEvent, on_stopping)
+    bot.run(shard_ids=shard_ids, shard_count=shard_count)
+
+
+class ShardedRunner:
+    """Runs shards of a bot in several worker processes sharing the same commands.
+
+    ``factory`` is a picklable callable, e.g. a module-level function, returning a configured
+    :class:`~kumo.impl.gateway_bot.GatewayBot` with its commands added. It is called once in the
+    runner, which acts as the coordinator: it syncs global and guild commands with Discord a single
+    time and writes their IDs into the snapshot file, then every worker calls it to build its own
+    bot and maps commands from that snapshot instead of syncing them again.
+
+    Workers report heartbeats, those which crash or stop reporting for ``heartbeat_timeout``
+    seconds are restarted with an exponential backoff.
+    """
+
+    __slots__: Sequence[str] = (
+        "_context",
+        "_processes",
+        "_heartbeats",
+        "_stopping",
+        "factory",
+        "workers",
+        "shard_count",
+        "snapshot_path",
+        "sync_commands",
+        "heartbeat_interval",
+        "heartbeat_timeout",
+        "report_interval",
+        "max_backoff",
+        "health",
+    )
+
+    def __init__(
+        self,
+        factory: BotFactoryT,
+        *,
+        workers: int | None = None,
+        shard_count: int | None = None,
+        snapshot_path: str | PathLike[str] = "commands.snapshot.json",
+        sync_commands: bool = True,
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 60.0,
+        report_interval: float = 60.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, SpawnProcess] = {}
+        self._heartbeats: Queue[Heartbeat] = self._context.Queue()
+        self._stopping: asyncio.Event | None = None
+
+        self.factory: BotFactoryT = factory
+        self.workers: int = workers or os.cpu_count() or 1
+        self.shard_count: int | None = shard_count
+        self.snapshot_path: str | PathLike[str] = snapshot_path
+        self.sync_commands: bool = sync_commands
+        self.heartbeat_interval: float = heartbeat_interval
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self.report_interval: float = report_interval
+        self.max_backoff: float = max_backoff
+        self.health: dict[int, WorkerHealth] = {}
+
+    @staticmethod
+    def split_shards(shard_count: int, workers: int) -> list[Sequence[int]]:
+        """Split shards into contiguous ranges, one per worker, never leaving a worker without shards."""
+        workers = min(workers, shard_count)
+        size, remainder = divmod(shard_count, workers)
+        ranges: list[Sequence[int]] = []
+        start = 0
+        for index in range(workers):
+            end = start + size + (index < remainder)
+            ranges.append(range(start, end))
+            start = end
+        return ranges
+
+    async def coordinate(self) -> int:
+        """Sync commands once and return the shard count to run."""
+        bot = self.factory()
+        bot.commands.snapshot_path = self.snapshot_path
+        bot.rest.start()
+        try:
+            shard_count = self.shard_count or (await bot.rest.fetch_gateway_bot_info()).shard_count
+            if self.sync_commands:
+                await bot.commands.sync_commands()
+                await bot.commands.sync_guild_commands()
+        finally:
+            await bot.rest.close()
+        return shard_count
+
+    def spawn(self, index: int) -> None:
+        health = self.health[index]
+        process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self.factory,
+                index,
+                health.shard_ids,
+                self.shard_count,
+                self.snapshot_path,
+                self._heartbeats,
+                self.heartbeat_interval,
+            ),
+            name=f"kumo-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        health.pid = process.pid
+        health.alive = True
+        health.started_at = time.monotonic()
+        health.last_heartbeat = health.latency = None
+        health.guilds = 0
+        _LOGGER.info("started worker %s (pid: %s) with shards %s", index, process.pid, list(health.shard_ids))
+
+    async def start(self) -> None:
+        self.shard_count = await self.coordinate()
+        for index, shard_ids in enumerate(self.split_shards(self.shard_count, self.workers)):
+            self.health[index] = WorkerHealth(index=index, shard_ids=shard_ids)
+            self.spawn(index)
+
+    async def run_async(self) -> None:
+        self._stopping = asyncio.Event()
+        await self.start()
+        restarts: dict[int, asyncio.Task[None]] = {}
+        last_report = time.monotonic()
+        try:
+            while not self._stopping.is_set():
+                self.collect_heartbeats()
+                for index in self.health:
+                    if index not in restarts and self.check_worker(index):
+                        restarts[index] = asyncio.create_task(self.restart(index), name=f"restart worker {index}")
+                for index in [index for index, task in restarts.items() if task.done()]:
+                    del restarts[index]
+                if time.monotonic() - last_report >= self.report_interval:
+                    self.report()
+                    last_report = time.monotonic()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), timeout=1.0)
+        finally:
+            for task in restarts.values():
+                task.cancel()
+            await self.close()
+
+    def run(self) -> None:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.run_async())
+
+    def stop(self) -> None:
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def collect_heartbeats(self) -> None:
+        while True:
+            try:
+                heartbeat = self._heartbeats.get_nowait()
+            except queue.Empty:
+                return
+            health = self.health.get(heartbeat.index)
+            if health is None or health.pid != heartbeat.pid:
+                continue
+            health.last_heartbeat = time.monotonic()
+            health.latency = heartbeat.latency
+            health.guilds = heartbeat.guilds
+
+    def check_worker(self, index: int) -> bool:
+        """Update the health of the worker and return whether it has to be restarted."""
+        health, process = self.health[index], self._processes[index]
+        if not process.is_alive():
+            if health.alive:
+                health.alive = False
+                _LOGGER.error("worker %s (pid: %s) exited with code %s", index, process.pid, process.exitcode)
+            return process.exitcode != 0
+        last_seen = health.last_heartbeat or health.started_at
+        if time.monotonic() - last_seen > self.heartbeat_timeout:
+            _LOGGER.error("worker %s (pid: %s) stopped reporting, killing it", index, process.pid)
+            process.kill()
+            process.join()
+            health.alive = False
+            return True
+        return False
+
+    async def restart(self, index: int) -> None:
+        health = self.health[index]
+        delay = min(2.0**health.restarts, self.max_backoff)
+        _LOGGER.warning("restarting worker %s in %.0fs", index, delay)
+        await asyncio.sleep(delay)
+        health.restarts += 1
+        self.spawn(index)
+
+    def report(self) -> None:
+        for health in self.health.values():
+            _LOGGER.info(
+                "worker %s: pid=%s alive=%s restarts=%s guilds=%s latency=%s",
+                health.index,
+                health.pid,
+                health.alive,
+                health.restarts,
+                health.guilds,
+                f"{health.latency * 1000:.0f}ms" if health.latency is not None else "n/a",
+            )
+
+    async def close(self, timeout: float = 30.0) -> None:
+        """Ask workers to shut down gracefully, killing those still running after ``timeout``."""
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for index, process in self._processes.items():
+            await asyncio.to_thread(process.join, max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                _LOGGER.warning("worker %s did not stop in time, killing it", index)
+                process.kill()
+                process.join()
+            self.health[index].alive = False
+
+    def get_health(self) -> Sequence[WorkerHealth]:
+        return tuple(self.health.values())
@@ -3,7 +3,10 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Final
 
-__all__: Sequence[str] = ("DEFAULT_DESCRIPTION", "GROUP_DESCRIPTION")
+__all__: Sequence[str] = ("DEFAULT_DESCRIPTION", "GROUP_DESCRIPTION", "MAX_MESSAGE_EMBEDS", "MAX_MESSAGE_EMBEDS_LENGTH")
 
 DEFAULT_DESCRIPTION: Final[str] = "No description"
 GROUP_DESCRIPTION: Final[str] = "-"
+MAX_MESSAGE_EMBEDS: Final[int] = 10
+MAX_MESSAGE_EMBEDS_LENGTH: Final[int] = 6000
+"""Discord limits the total length of the text of the embeds of a message."""
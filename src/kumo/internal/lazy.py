@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+__all__: Sequence[str] = ("lazy_exports",)
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make module ``__getattr__`` and ``__dir__`` resolving names of ``exports`` from their modules on access.
+
+    ``exports`` maps exported names to the modules defining them, a module is imported on the
+    first access of any of its names, and resolved names are stored in the package afterwards.
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = namespace[name] = getattr(importlib.import_module(module), name)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from kumo.tracing.abc import ISpan, ITracer
+
+__all__: Sequence[str] = ("Phase", "phase")
+
+
+class _NoopPhase:
+    __slots__: Sequence[str] = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+_NOOP_PHASE = _NoopPhase()
+
+
+class Phase:
+    """Child span of a single phase of the interaction pipeline, records the exception it exits with."""
+
+    __slots__: Sequence[str] = ("tracer", "parent", "name", "span")
+
+    def __init__(self, tracer: ITracer, parent: ISpan, name: str) -> None:
+        self.tracer: ITracer = tracer
+        self.parent: ISpan = parent
+        self.name: str = name
+        self.span: ISpan | None = None
+
+    def __enter__(self) -> ISpan:
+        self.span = self.tracer.start_span(self.name, parent=self.parent)
+        return self.span
+
+    def __exit__(
+        self, _: type[BaseException] | None, exception: BaseException | None, __: TracebackType | None
+    ) -> None:
+        assert self.span is not None
+        if exception is not None:
+            self.span.record_exception(exception)
+        self.span.end()
+
+
+def phase(tracer: ITracer | None, parent: ISpan | None, name: str) -> Phase | _NoopPhase:
+    """Open a child span of ``parent``, or do nothing if tracing is disabled.
+
+    It lives outside of the tracing package, so bots without a tracer do not import that package.
+    """
+    if tracer is None or parent is None:
+        return _NOOP_PHASE
+    return Phase(tracer, parent, name)
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+__all__: Sequence[str] = ()
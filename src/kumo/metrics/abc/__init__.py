@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from kumo.metrics.abc.imetrics_sink import IMetricsSink
+
+__all__: Sequence[str] = ("IMetricsSink",)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+__all__: Sequence[str] = ("IMetricsSink",)
+
+
+class IMetricsSink(Protocol):
+    __slots__: Sequence[str] = ()
+
+    def record(
+        self, path: str, duration: float, first_response: float | None, exception: BaseException | None
+    ) -> None: ...
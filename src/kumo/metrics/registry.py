@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kumo.metrics.abc import IMetricsSink
+
+__all__: Sequence[str] = ("DEFAULT_BUCKETS", "Histogram", "CommandMetrics", "MetricsRegistry")
+
+_LOGGER = getLogger("kumo.metrics")
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds of histogram buckets in seconds, the last bucket (``+Inf``) is implicit."""
+
+
+class Histogram:
+    """Histogram with fixed buckets, the counters are allocated once on creation."""
+
+    __slots__: Sequence[str] = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        """Yield Prometheus ``le`` labels with cumulative counts."""
+        total = 0
+        for bound, count in zip((*map(repr, self.buckets), "+Inf"), self.counts, strict=True):
+            total += count
+            yield bound, total
+
+
+class CommandMetrics:
+    """Metrics of a single command path."""
+
+    __slots__: Sequence[str] = ("path", "duration", "first_response", "in_flight", "calls", "errors")
+
+    def __init__(self, path: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.path: str = path
+        self.duration: Histogram = Histogram(buckets)
+        self.first_response: Histogram = Histogram(buckets)
+        self.in_flight: int = 0
+        self.calls: int = 0
+        self.errors: dict[str, int] = {}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Per-command metrics of callback duration, time to the first response, in-flight calls and errors.
+
+    Metrics are keyed by the command path, e.g. ``"settings language set"``. Histograms of a path
+    are allocated when it is first seen, so recording a call only bumps existing counters. Every
+    call is also passed to the ``sinks``, for forwarding metrics to other systems.
+    """
+
+    __slots__: Sequence[str] = ("_commands", "buckets", "sinks")
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS, sinks: Sequence[IMetricsSink] = ()) -> None:
+        self._commands: dict[str, CommandMetrics] = {}
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.sinks: list[IMetricsSink] = list(sinks)
+
+    @property
+    def commands(self) -> Sequence[CommandMetrics]:
+        return tuple(self._commands.values())
+
+    def add_sink(self, sink: IMetricsSink) -> None:
+        self.sinks.append(sink)
+
+    def get(self, path: str) -> CommandMetrics:
+        if (metrics := self._commands.get(path)) is None:
+            metrics = self._commands[path] = CommandMetrics(path, self.buckets)
+        return metrics
+
+    def record(
+        self,
+        metrics: CommandMetrics,
+        duration: float,
+        first_response: float | None,
+        exception: BaseException | None = None,
+    ) -> None:
+        metrics.calls += 1
+        metrics.duration.observe(duration)
+        if first_response is not None:
+            metrics.first_response.observe(first_response)
+        if exception is not None:
+            name = type(exception).__name__
+            metrics.errors[name] = metrics.errors.get(name, 0) + 1
+        for sink in self.sinks:
+            try:
+                sink.record(metrics.path, duration, first_response, exception)
+            except Exception as error:
+                _LOGGER.error("metrics sink %r failed: %s", sink, error)
+
+    def render_prometheus(self, prefix: str = "kumo_command") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name, description, attribute in (
+            ("duration_seconds", "Duration of command callbacks.", "duration"),
+            ("first_response_seconds", "Time from receiving an interaction to its first response.", "first_response"),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for metrics in self._commands.values():
+                label = f'command="{_escape(metrics.path)}"'
+                histogram: Histogram = getattr(metrics, attribute)
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{prefix}_{name}_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f"{prefix}_{name}_sum{{{label}}} {histogram.sum!r}")
+                lines.append(f"{prefix}_{name}_count{{{label}}} {histogram.count}")
+
+        lines.append(f"# HELP {prefix}_in_flight Command callbacks currently running.")
+        lines.append(f"# TYPE {prefix}_in_flight gauge")
+        lines.extend(
+            f'{prefix}_in_flight{{command="{_escape(metrics.path)}"}} {metrics.in_flight}'
+            for metrics in self._commands.values()
+        )
+        lines.append(f"# HELP {prefix}_calls_total Completed command callbacks.")
+        lines.append(f"# TYPE {prefix}_calls_total counter")
+        lines.extend(
+            f'{prefix}_calls_total{{command="{_escape(metrics.path)}"}} {metrics.calls}'
+            for metrics in self._commands.values()
+        )
+        lines.append(f"# HELP {prefix}_errors_total Command callbacks which raised, by exception type.")
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        lines.extend(
+            f'{prefix}_errors_total{{command="{_escape(metrics.path)}",exception="{_escape(exception)}"}} {count}'
+            for metrics in self._commands.values()
+            for exception, count in metrics.errors.items()
+        )
+        return "\n".join(lines) + "\n"
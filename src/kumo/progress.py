@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from hikari.undefined import UNDEFINED
+
+from kumo.internal.consts import MAX_MESSAGE_EMBEDS, MAX_MESSAGE_EMBEDS_LENGTH
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from hikari.api import ComponentBuilder
+    from hikari.embeds import Embed
+    from hikari.files import Resourceish
+    from hikari.undefined import UndefinedOr
+
+    from kumo.context import InteractionContext
+
+__all__: Sequence[str] = ("ProgressEditor", "batch_embeds")
+
+_LOGGER = getLogger("kumo.progress")
+
+
+def batch_embeds(embeds: Sequence[Embed]) -> list[list[Embed]]:
+    """Split embeds in order into as few messages as Discord allows, by their count and total length."""
+    batches: list[list[Embed]] = []
+    batch: list[Embed] = []
+    length = 0
+    for embed in embeds:
+        embed_length = embed.total_length()
+        if batch and (len(batch) == MAX_MESSAGE_EMBEDS or length + embed_length > MAX_MESSAGE_EMBEDS_LENGTH):
+            batches.append(batch)
+            batch, length = [], 0
+        batch.append(embed)
+        length += embed_length
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class ProgressEditor:
+    """Streams progress into the response of an interaction, editing it at most once per ``interval`` seconds.
+
+    Only the latest pending state is kept, states superseded before they were sent are dropped.
+    The state given to :meth:`finish`, or the last pending one, is always delivered, right after
+    the edit in flight without waiting for the interval. Used as an async context manager,
+    the editor finishes on exit.
+    """
+
+    __slots__: Sequence[str] = ("_pending", "_task", "_wake", "_sent_at", "_finished", "context", "interval", "dropped")
+
+    def __init__(self, context: InteractionContext[Any], *, interval: float = 1.0) -> None:
+        self._pending: dict[str, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event = asyncio.Event()
+        self._sent_at: float = float("-inf")
+        self._finished: bool = False
+        self.context: InteractionContext[Any] = context
+        self.interval: float = interval
+        self.dropped: int = 0
+        """Number of states superseded before they were sent."""
+
+    async def __aenter__(self) -> ProgressEditor:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        await self.finish()
+
+    def update(
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+    ) -> None:
+        """Replace the pending state, it is sent once the interval since the previous edit passes."""
+        if self._finished:
+            raise RuntimeError("progress editor is already finished")
+        if self._pending is not None:
+            self.dropped += 1
+        self._pending = {
+            "content": content,
+            "attachment": attachment,
+            "attachments": attachments,
+            "component": component,
+            "components": components,
+            "embed": embed,
+            "embeds": embeds,
+        }
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._flush(), name="flush progress")
+
+    async def finish(
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+    ) -> None:
+        """Deliver the final state, or the last pending one if none is given, and wait until it is sent.
+
+        Raises the error of the final edit, errors of intermediate edits are only logged.
+        """
+        if self._finished:
+            return
+        final = (content, attachment, attachments, component, components, embed, embeds)
+        if any(value is not UNDEFINED for value in final):
+            self.update(
+                content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+            )
+        self._finished = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+
+    async def _flush(self) -> None:
+        while self._pending is not None:
+            if not self._finished and (delay := self._sent_at + self.interval - time.monotonic()) > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            state, self._pending = self._pending, None
+            try:
+                if self.context.responded:
+                    await self.context.edit_response(**state)
+                else:
+                    await self.context.create_response(**state)
+            except Exception as error:
+                if self._finished and self._pending is None:
+                    raise
+                _LOGGER.error("failed to edit progress of interaction %s: %s", self.context.interaction.id, error)
+            self._sent_at = time.monotonic()
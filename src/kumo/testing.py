@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import itertools
+import json
+import time
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from hikari.commands import CommandType
+from hikari.components import ComponentType
+from hikari.interactions import InteractionType
+from hikari.locales import Locale
+
+if TYPE_CHECKING:
+    from hikari.api import InteractionServer, Response
+
+__all__: Sequence[str] = ("InteractionTestClient", "build_command_payload", "build_component_payload")
+
+_IDS = itertools.count(1 << 40)
+
+
+def build_command_payload(
+    name: str,
+    *,
+    application_id: int = 1,
+    command_id: int | None = None,
+    command_type: CommandType = CommandType.SLASH,
+    options: Sequence[Mapping[str, Any]] | None = None,
+    resolved: Mapping[str, Any] | None = None,
+    target_id: int | None = None,
+    guild_id: int | None = None,
+    user_id: int = 1,
+    locale: Locale | str = Locale.EN_US,
+    interaction_type: InteractionType = InteractionType.APPLICATION_COMMAND,
+) -> dict[str, Any]:
+    """Build the payload of a command interaction, options and resolved data are given in the Discord format.
+
+    Autocomplete interactions are built with ``interaction_type``, their focused option is marked ``"focused"``.
+    """
+    data: dict[str, Any] = {"id": str(command_id or next(_IDS)), "name": name, "type": int(command_type)}
+    if options:
+        data["options"] = list(options)
+    if resolved:
+        data["resolved"] = dict(resolved)
+    if target_id is not None:
+        data["target_id"] = str(target_id)
+    return _build_payload(
+        interaction_type,
+        data,
+        application_id=application_id,
+        channel_id=str(next(_IDS)),
+        guild_id=guild_id,
+        user_id=user_id,
+        locale=locale,
+    )
+
+
+def build_component_payload(
+    custom_id: str,
+    *,
+    application_id: int = 1,
+    component_type: ComponentType = ComponentType.BUTTON,
+    values: Sequence[str] | None = None,
+    modal_values: Mapping[str, str] | None = None,
+    guild_id: int | None = None,
+    user_id: int = 1,
+    locale: Locale | str = Locale.EN_US,
+) -> dict[str, Any]:
+    """Build the payload of a message component interaction, or of a modal submit with ``modal_values``.
+
+    ``modal_values`` maps custom IDs of text inputs to their submitted values.
+    """
+    channel_id = str(next(_IDS))
+    if modal_values is not None:
+        interaction_type = InteractionType.MODAL_SUBMIT
+        data: dict[str, Any] = {
+            "custom_id": custom_id,
+            "components": [
+                {
+                    "type": int(ComponentType.ACTION_ROW),
+                    "components": [{"type": int(ComponentType.TEXT_INPUT), "custom_id": input_id, "value": value}],
+                }
+                for input_id, value in modal_values.items()
+            ],
+        }
+    else:
+        interaction_type = InteractionType.MESSAGE_COMPONENT
+        data = {"custom_id": custom_id, "component_type": int(component_type)}
+        if values is not None:
+            data["values"] = list(values)
+    return _build_payload(
+        interaction_type,
+        data,
+        application_id=application_id,
+        channel_id=channel_id,
+        guild_id=guild_id,
+        user_id=user_id,
+        locale=locale,
+        with_message=modal_values is None,
+    )
+
+
+def _build_payload(
+    interaction_type: InteractionType,
+    data: dict[str, Any],
+    *,
+    application_id: int,
+    channel_id: str,
+    guild_id: int | None,
+    user_id: int,
+    locale: Locale | str,
+    with_message: bool = False,
+) -> dict[str, Any]:
+    user = {"id": str(user_id), "username": "user", "discriminator": "0", "avatar": None}
+    payload: dict[str, Any] = {
+        "id": str(next(_IDS)),
+        "application_id": str(application_id),
+        "type": int(interaction_type),
+        "token": f"token-{next(_IDS)}",
+        "version": 1,
+        "channel_id": channel_id,
+        "locale": str(locale),
+        "app_permissions": "0",
+        "data": data,
+    }
+    if guild_id is not None:
+        payload["guild_id"] = str(guild_id)
+        payload["guild_locale"] = str(locale)
+        payload["member"] = {
+            "user": user,
+            "roles": [],
+            "joined_at": "2024-01-01T00:00:00+00:00",
+            "deaf": False,
+            "mute": False,
+            "permissions": "0",
+        }
+    else:
+        payload["user"] = user
+    if with_message:
+        payload["message"] = {
+            "id": str(next(_IDS)),
+            "channel_id": channel_id,
+            "author": {"id": str(application_id), "username": "bot", "discriminator": "0", "avatar": None},
+            "content": "",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "flags": 0,
+        }
+    return payload
+
+
+class InteractionTestClient:
+    """Sends interactions to an interaction server signed with a local key, the way Discord does.
+
+    Pass :attr:`public_key` to the bot instead of the key of the application, then deliver
+    payloads in-process with :meth:`send`, or over HTTP to a running server with :meth:`post`.
+    Requires ``pynacl``, which comes with ``hikari[server]``.
+    """
+
+    __slots__: Sequence[str] = ("_signing_key", "application_id")
+
+    def __init__(self, *, seed: bytes | None = None, application_id: int = 1) -> None:
+        # This is kept inline as pynacl is an optional dependency.
+        from nacl.signing import SigningKey
+
+        self._signing_key = SigningKey(seed) if seed is not None else SigningKey.generate()
+        self.application_id: int = application_id
+
+    @property
+    def public_key(self) -> bytes:
+        return bytes(self._signing_key.verify_key)
+
+    def sign(self, body: bytes, timestamp: str | None = None) -> Mapping[str, str]:
+        """Return signature headers of the body."""
+        timestamp = timestamp or str(int(time.time()))
+        signature = self._signing_key.sign(timestamp.encode() + body).signature
+        return {"X-Signature-Ed25519": signature.hex(), "X-Signature-Timestamp": timestamp}
+
+    def build_command_payload(self, name: str, **kwargs: Any) -> dict[str, Any]:
+        """Build the payload of a command interaction of this application, see :func:`build_command_payload`."""
+        return build_command_payload(name, application_id=self.application_id, **kwargs)
+
+    def build_component_payload(self, custom_id: str, **kwargs: Any) -> dict[str, Any]:
+        """Build the payload of a component interaction of this application, see :func:`build_component_payload`."""
+        return build_component_payload(custom_id, application_id=self.application_id, **kwargs)
+
+    async def send(self, server: InteractionServer, payload: Mapping[str, Any]) -> Response:
+        """Deliver a signed payload to the server in-process and return its response."""
+        body = json.dumps(payload).encode()
+        headers = self.sign(body)
+        return await server.on_interaction(
+            body, bytes.fromhex(headers["X-Signature-Ed25519"]), headers["X-Signature-Timestamp"].encode()
+        )
+
+    async def post(self, url: str, payload: Mapping[str, Any]) -> tuple[int, Any]:
+        """Deliver a signed payload to a running server over HTTP, returns the status and the decoded body."""
+        import aiohttp
+
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json", **self.sign(body)}
+        async with aiohttp.ClientSession() as session, session.post(url, data=body, headers=headers) as response:
+            if response.content_type == "application/json":
+                return response.status, await response.json()
+            return response.status, await response.read()
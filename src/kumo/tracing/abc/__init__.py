@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from kumo.tracing.abc.itracer import ISpan, ITracer
+
+__all__: Sequence[str] = ("ISpan", "ITracer")
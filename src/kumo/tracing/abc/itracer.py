@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Protocol
+
+__all__: Sequence[str] = ("ISpan", "ITracer")
+
+AttributeT = str | int | float | bool
+
+
+class ISpan(Protocol):
+    __slots__: Sequence[str] = ()
+
+    def set_attribute(self, key: str, value: AttributeT) -> None: ...
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+    def end(self, end_time: int | None = None) -> None: ...
+
+
+class ITracer(Protocol):
+    __slots__: Sequence[str] = ()
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: ISpan | None = None,
+        start_time: int | None = None,
+        attributes: Mapping[str, AttributeT] | None = None,
+    ) -> ISpan:
+        """Start a span, times are in nanoseconds since the epoch."""
+        ...
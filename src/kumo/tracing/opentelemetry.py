@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
+    from kumo.tracing.abc import ISpan
+    from kumo.tracing.abc.itracer import AttributeT
+
+__all__: Sequence[str] = ("OpenTelemetryTracer",)
+
+
+class OpenTelemetryTracer:
+    """Tracer adapter emitting interaction spans through OpenTelemetry.
+
+    Uses the ``kumo`` tracer of the global tracer provider unless another ``tracer`` is given.
+    Requires ``opentelemetry-api``, spans are exported by whatever the application configured.
+    """
+
+    __slots__: Sequence[str] = ("_trace", "tracer")
+
+    def __init__(self, tracer: Tracer | None = None) -> None:
+        # This is kept inline as opentelemetry is an optional dependency.
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer: Tracer = tracer or trace.get_tracer("kumo")
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: ISpan | None = None,
+        start_time: int | None = None,
+        attributes: Mapping[str, AttributeT] | None = None,
+    ) -> ISpan:
+        context = self._trace.set_span_in_context(parent) if parent is not None else None  # type: ignore
+        return self.tracer.start_span(name, context=context, start_time=start_time, attributes=attributes)
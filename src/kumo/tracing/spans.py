@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+from kumo.internal.phases import Phase, phase
+
+if TYPE_CHECKING:
+    from hikari.interactions import CommandInteraction, ComponentInteraction, ModalInteraction
+
+    from kumo.tracing.abc import ISpan, ITracer
+    from kumo.tracing.abc.itracer import AttributeT
+
+__all__: Sequence[str] = ("Phase", "phase", "start_interaction_span")
+
+
+def start_interaction_span(
+    tracer: ITracer,
+    interaction: CommandInteraction | ComponentInteraction | ModalInteraction,
+    attributes: Mapping[str, AttributeT],
+) -> ISpan:
+    """Start the span of a received interaction, with a child span of its delivery from Discord."""
+    now = time.time_ns()
+    # The interaction ID holds its creation time, with a millisecond precision and the clock skew of Discord.
+    created = min(int(interaction.created_at.timestamp() * 1e9), now)
+    span = tracer.start_span(
+        "interaction",
+        start_time=created,
+        attributes={"interaction.id": str(interaction.id), "interaction.locale": str(interaction.locale), **attributes},
+    )
+    tracer.start_span("delivery", parent=span, start_time=created).end(now)
+    return span
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.impl.rest import RESTClientImpl
+from hikari.impl.special_endpoints import ContextMenuCommandBuilder, SlashCommandBuilder
+from hikari.snowflakes import Snowflake
+from hikari.undefined import UNDEFINED
+
+from kumo.impl.rest_bot import RESTBot
+from kumo.testing import InteractionTestClient
+
+if TYPE_CHECKING:
+    from hikari.api import CommandBuilder
+    from hikari.commands import PartialCommand
+    from hikari.undefined import UndefinedOr
+
+SendT = Callable[[Mapping[str, Any]], Awaitable[dict[str, Any]]]
+RESTCallsT = list[tuple[str, dict[str, Any]]]
+
+_RECORDED_REST_METHODS: tuple[str, ...] = (
+    "create_interaction_response",
+    "edit_interaction_response",
+    "delete_interaction_response",
+    "execute_webhook",
+)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run coroutine tests in a fresh event loop, so no async plugin is needed."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**arguments))
+    return True
+
+
+@pytest.fixture
+def client() -> InteractionTestClient:
+    return InteractionTestClient(seed=b"kumo" * 8)
+
+
+@pytest.fixture
+def bot(client: InteractionTestClient) -> RESTBot:
+    return RESTBot("token", "Bot", client.public_key, banner=None, logs=None, suppress_optimization_warning=True)
+
+
+@pytest.fixture
+def send(client: InteractionTestClient, bot: RESTBot) -> SendT:
+    """Deliver a payload to the bot and return the decoded body of its HTTP reply."""
+
+    async def send(payload: Mapping[str, Any]) -> dict[str, Any]:
+        response = await client.send(bot.interaction_server, payload)
+        assert response.status_code == 200, response.payload
+        assert response.payload is not None
+        return json.loads(response.payload)
+
+    return send
+
+
+@pytest.fixture
+def rest_calls(monkeypatch: pytest.MonkeyPatch) -> RESTCallsT:
+    """Record interaction REST calls by method name instead of sending them."""
+    calls: RESTCallsT = []
+
+    def record(name: str) -> Callable[..., Awaitable[None]]:
+        async def method(self: RESTClientImpl, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            calls.append((name, kwargs))
+
+        return method
+
+    for name in _RECORDED_REST_METHODS:
+        monkeypatch.setattr(RESTClientImpl, name, record(name))
+    return calls
+
+
+class CommandsAPI:
+    """Application commands of a fake Discord API, by guild and name, ``None`` is the guild of global commands.
+
+    Creating a command with the name of an existing one overwrites it and keeps its ID, like Discord does.
+    """
+
+    def __init__(self) -> None:
+        self.commands: dict[Snowflake | None, dict[str, PartialCommand]] = {}
+        self.calls: list[tuple[str, Snowflake | None]] = []
+        self.failing: set[str] = set()
+        """Names of commands whose creation fails."""
+        self._ids = itertools.count(1000)
+
+    def upsert(
+        self, rest: RESTClientImpl, builder: CommandBuilder, guild: UndefinedOr[Snowflake] = UNDEFINED
+    ) -> PartialCommand:
+        if builder.name in self.failing:
+            raise RuntimeError(f"failed to create {builder.name}")
+        commands = self.commands.setdefault(guild or None, {})
+        payload = builder.build(rest.entity_factory)
+        command_id = commands[builder.name].id if builder.name in commands else next(self._ids)
+        command = commands[builder.name] = rest.entity_factory.deserialize_command(
+            {"default_member_permissions": None, **payload, "id": command_id, "application_id": 1, "version": 1},
+            guild_id=guild or None,
+        )
+        return command
+
+
+@pytest.fixture
+def commands_api(monkeypatch: pytest.MonkeyPatch) -> CommandsAPI:
+    """Serve application command REST calls from a :class:`CommandsAPI`."""
+    api = CommandsAPI()
+
+    async def fetch_application(self: RESTClientImpl) -> SimpleNamespace:
+        return SimpleNamespace(id=Snowflake(1))
+
+    async def fetch_application_commands(
+        self: RESTClientImpl, application: object, guild: UndefinedOr[Snowflake] = UNDEFINED
+    ) -> list[PartialCommand]:
+        api.calls.append(("fetch", guild or None))
+        return list(api.commands.get(guild or None, {}).values())
+
+    async def set_application_commands(
+        self: RESTClientImpl,
+        application: object,
+        commands: list[CommandBuilder],
+        guild: UndefinedOr[Snowflake] = UNDEFINED,
+    ) -> list[PartialCommand]:
+        api.calls.append(("set", guild or None))
+        names = {builder.name for builder in commands}
+        previous = api.commands.get(guild or None, {})
+        api.commands[guild or None] = {name: command for name, command in previous.items() if name in names}
+        return [api.upsert(self, builder, guild) for builder in commands]
+
+    async def delete_application_command(
+        self: RESTClientImpl, application: object, command: PartialCommand, guild: UndefinedOr[Snowflake] = UNDEFINED
+    ) -> None:
+        api.calls.append(("delete", guild or None))
+        del api.commands[guild or None][command.name]
+
+    async def create(
+        builder: CommandBuilder, rest: RESTClientImpl, application: object, *, guild: UndefinedOr[Snowflake] = UNDEFINED
+    ) -> PartialCommand:
+        api.calls.append(("create", guild or None))
+        return api.upsert(rest, builder, guild)
+
+    endpoints = (fetch_application, fetch_application_commands, set_application_commands, delete_application_command)
+    for endpoint in endpoints:
+        monkeypatch.setattr(RESTClientImpl, endpoint.__name__, endpoint)
+    monkeypatch.setattr(SlashCommandBuilder, "create", create)
+    monkeypatch.setattr(ContextMenuCommandBuilder, "create", create)
+    return api
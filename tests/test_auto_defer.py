@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.commands import OptionType
+from hikari.interactions import CommandInteraction, ResponseType
+
+import kumo
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+
+@pytest.fixture
+def bot(bot: RESTBot) -> RESTBot:
+    """Bot deferring callbacks which have not responded within 10ms, with a command sleeping for ``delay``."""
+
+    @kumo.slash_command("work", options=[kumo.Option(type=OptionType.FLOAT, name="delay", description="delay")])
+    class Work:
+        async def callback(self, context: CommandInteractionContext, delay: float) -> None:
+            await asyncio.sleep(delay)
+            await context.create_response("done")
+
+    bot.add_command(Work)
+    bot.commands.auto_defer = 0.01
+    return bot
+
+
+def build_work_payload(client: InteractionTestClient, delay: float) -> dict[str, Any]:
+    return client.build_command_payload("work", options=[{"name": "delay", "type": 10, "value": delay}])
+
+
+async def test_slow_callback_is_deferred_before_response_timeout(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    body = await send(build_work_payload(client, 0.1))
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", "done")]
+
+
+async def test_fast_callback_is_not_deferred(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    body = await send(build_work_payload(client, 0.0))
+    await asyncio.sleep(0.05)
+
+    assert body["type"] == ResponseType.MESSAGE_CREATE
+    assert body["data"]["content"] == "done"
+    assert rest_calls == []
+
+
+@pytest.mark.parametrize(
+    ("delay", "response_type", "edits"),
+    [(0.1, ResponseType.DEFERRED_MESSAGE_CREATE, 1), (0.0, ResponseType.MESSAGE_CREATE, 0)],
+)
+async def test_watchdog_defers_over_rest_without_http_reply(
+    bot: RESTBot,
+    client: InteractionTestClient,
+    rest_calls: RESTCallsT,
+    delay: float,
+    response_type: ResponseType,
+    edits: int,
+) -> None:
+    interaction = bot.entity_factory.deserialize_interaction(build_work_payload(client, delay))
+    assert isinstance(interaction, CommandInteraction)
+
+    task = await bot.commands.dispatch_context(bot.commands.create_context(interaction))
+    assert task is not None
+    await task
+    await asyncio.sleep(0.05)
+
+    (name, kwargs), *rest = rest_calls
+    assert (name, kwargs["response_type"]) == ("create_interaction_response", response_type)
+    assert [name for name, _ in rest] == ["edit_interaction_response"] * edits
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.commands import OptionType
+from hikari.interactions import InteractionType, ResponseType
+
+import kumo
+from kumo.commands.autocomplete import MAX_CHOICES, AutocompleteCache, match_prefix
+from kumo.commands.options import Choice
+
+if TYPE_CHECKING:
+    from conftest import SendT
+
+    from kumo.context import AutocompleteInteractionContext, CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+CompleteT = Callable[..., Awaitable[list[str]]]
+
+CITIES: tuple[str, ...] = ("Berlin", "Bern", "Bergen", "Bordeaux", "Boston", "Paris")
+
+
+class Cities:
+    """Autocomplete callback over a list of cities, recording the values it was called with."""
+
+    def __init__(self, cities: tuple[str, ...] = CITIES, *, delay: float = 0.0) -> None:
+        self.cities: tuple[str, ...] = cities
+        self.delay: float = delay
+        self.calls: list[str] = []
+
+    async def __call__(self, context: AutocompleteInteractionContext, value: str) -> list[str]:
+        self.calls.append(value)
+        await asyncio.sleep(self.delay)
+        return [city for city in self.cities if city.casefold().startswith(value.casefold())]
+
+
+@pytest.fixture
+def cities() -> Cities:
+    return Cities()
+
+
+@pytest.fixture
+def complete(client: InteractionTestClient, send: SendT) -> CompleteT:
+    """Send an autocomplete interaction typing ``value`` and return the names of the choices."""
+
+    async def complete(value: str, *, guild_id: int = 1) -> list[str]:
+        body = await send(
+            client.build_command_payload(
+                "weather",
+                guild_id=guild_id,
+                interaction_type=InteractionType.AUTOCOMPLETE,
+                options=[{"name": "city", "type": 3, "value": value, "focused": True}],
+            )
+        )
+        assert body["type"] == ResponseType.AUTOCOMPLETE
+        return [choice["name"] for choice in body["data"]["choices"]]
+
+    return complete
+
+
+def add_weather(bot: RESTBot, callback: Cities, **kwargs: Any) -> None:  # noqa: ANN401
+    cities = kumo.autocomplete(**kwargs)(callback)
+
+    @kumo.slash_command(
+        "weather", options=[kumo.Option(type=OptionType.STRING, name="city", description="city", autocomplete=cities)]
+    )
+    class Weather:
+        async def callback(self, context: CommandInteractionContext, city: str) -> None: ...
+
+    bot.add_command(Weather)
+
+
+async def test_choices_are_sent_in_http_reply(bot: RESTBot, cities: Cities, complete: CompleteT) -> None:
+    add_weather(bot, cities)
+
+    assert await complete("Ber") == ["Berlin", "Bern", "Bergen"]
+    assert await complete("Ber") == ["Berlin", "Bern", "Bergen"]
+    assert cities.calls == ["Ber"]
+
+
+async def test_complete_prefix_result_is_filtered_for_longer_values(
+    bot: RESTBot, cities: Cities, complete: CompleteT
+) -> None:
+    add_weather(bot, cities, match=match_prefix)
+
+    assert await complete("B") == ["Berlin", "Bern", "Bergen", "Bordeaux", "Boston"]
+    assert await complete("Bo") == ["Bordeaux", "Boston"]
+    assert await complete("Ber") == ["Berlin", "Bern", "Bergen"]
+    assert cities.calls == ["B"]
+
+
+async def test_truncated_prefix_result_is_not_reused(bot: RESTBot, complete: CompleteT) -> None:
+    cities = Cities(tuple(f"B{index:02}" for index in range(MAX_CHOICES * 2)))
+    add_weather(bot, cities, match=match_prefix)
+
+    assert len(await complete("B")) == MAX_CHOICES
+    assert await complete("B4") == [f"B{index}" for index in range(40, 50)]
+    assert cities.calls == ["B", "B4"]
+
+
+async def test_results_are_scoped_by_key(bot: RESTBot, cities: Cities, complete: CompleteT) -> None:
+    add_weather(bot, cities, key=lambda context: context.interaction.guild_id)
+
+    await complete("Ber", guild_id=1)
+    await complete("Ber", guild_id=2)
+    await complete("Ber", guild_id=1)
+
+    assert cities.calls == ["Ber", "Ber"]
+
+
+async def test_best_cached_answer_is_sent_past_the_deadline(bot: RESTBot, complete: CompleteT) -> None:
+    # Fillers truncate the result of "B", so "Bo" has to call the callback.
+    cities = Cities((*CITIES, *(f"Bx{index:02}" for index in range(MAX_CHOICES))))
+    add_weather(bot, cities, match=match_prefix, deadline=0.01)
+    await complete("B")
+    cities.delay = 0.05
+
+    assert await complete("Bo") == ["Bordeaux", "Boston"]
+    await asyncio.sleep(0.1)
+    assert await complete("Bo") == ["Bordeaux", "Boston"]
+    assert cities.calls == ["B", "Bo"]
+
+
+def test_cache_evicts_least_recently_used_entries() -> None:
+    cache = AutocompleteCache(max_size=2)
+    choices = (Choice(name="a", value="a"),)
+    cache.set((None, "a"), choices, complete=True)
+    cache.set((None, "b"), choices, complete=True)
+
+    assert cache.get((None, "a")) is not None
+    cache.set((None, "c"), choices, complete=True)
+
+    assert cache.get((None, "b")) is None
+    assert cache.get((None, "a")) is not None
+    assert len(cache) == 2
+
+
+def test_cache_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("kumo.commands.autocomplete.time.monotonic", lambda: now)
+    cache = AutocompleteCache(ttl=10.0)
+    cache.set((None, "a"), (), complete=True)
+
+    now = 109.0
+    assert cache.get((None, "a")) is not None
+    now = 110.0
+    assert cache.get((None, "a")) is None
+    assert cache.get_prefix(None, "ab") is None
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.commands import OptionType
+from hikari.messages import MessageFlag
+
+import kumo
+from kumo.commands.caching import ResponseCacheStore
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+LookUpT = Callable[..., Awaitable[str]]
+
+
+class Definitions:
+    """Callback of the ``define`` command, counting its calls and waiting for ``release`` before responding."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release: asyncio.Event = asyncio.Event()
+        self.release.set()
+        self.fail: bool = False
+        self.defer: bool = False
+
+    async def __call__(self, context: CommandInteractionContext, word: str) -> None:
+        self.calls.append(word)
+        if self.defer:
+            await context.defer(ephemeral=True)
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("dictionary is unavailable")
+        if self.defer:
+            await context.edit_response(f"{word}: {len(self.calls)}")
+        else:
+            await context.create_response(f"{word}: {len(self.calls)}")
+
+
+@pytest.fixture
+def definitions() -> Definitions:
+    return Definitions()
+
+
+@pytest.fixture
+def look_up(client: InteractionTestClient, send: SendT) -> LookUpT:
+    """Invoke the ``define`` command and return the content of its response."""
+
+    async def look_up(word: str = "kumo", **kwargs: Any) -> str:  # noqa: ANN401
+        body = await send(
+            client.build_command_payload("define", options=[{"name": "word", "type": 3, "value": word}], **kwargs)
+        )
+        return body["data"].get("content", "")
+
+    return look_up
+
+
+def add_define(bot: RESTBot, definitions: Definitions, **kwargs: Any) -> None:  # noqa: ANN401
+    @kumo.slash_command(
+        "define",
+        options=[kumo.Option(type=OptionType.STRING, name="word", description="word")],
+        cache=kumo.ResponseCache(**kwargs),
+    )
+    class Define:
+        async def callback(self, context: CommandInteractionContext, word: str) -> None:
+            await definitions(context, word)
+
+    bot.add_command(Define)
+
+
+async def test_cached_response_is_replayed(bot: RESTBot, definitions: Definitions, look_up: LookUpT) -> None:
+    add_define(bot, definitions)
+
+    assert await look_up() == "kumo: 1"
+    assert await look_up() == "kumo: 1"
+    assert await look_up("cloud") == "cloud: 2"
+    assert definitions.calls == ["kumo", "cloud"]
+
+
+async def test_concurrent_interactions_share_one_call(
+    bot: RESTBot, definitions: Definitions, look_up: LookUpT
+) -> None:
+    add_define(bot, definitions)
+    definitions.release.clear()
+
+    asyncio.get_running_loop().call_later(0.01, definitions.release.set)
+
+    assert await asyncio.gather(look_up(), look_up(), look_up()) == ["kumo: 1"] * 3
+    assert definitions.calls == ["kumo"]
+
+
+async def test_edited_response_of_deferred_call_is_cached(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, definitions: Definitions, rest_calls: RESTCallsT
+) -> None:
+    add_define(bot, definitions)
+    definitions.defer = True
+    definitions.release.clear()
+    payload = client.build_command_payload("define", options=[{"name": "word", "type": 3, "value": "kumo"}])
+
+    asyncio.get_running_loop().call_later(0.01, definitions.release.set)
+    first, second = await asyncio.gather(send(payload), send(payload))
+    third = await send(payload)
+
+    assert first["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", "kumo: 1")]
+    for body in (second, third):
+        assert body["data"]["content"] == "kumo: 1"
+        assert body["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert definitions.calls == ["kumo"]
+
+
+async def test_failed_call_is_not_cached(
+    bot: RESTBot, definitions: Definitions, look_up: LookUpT, rest_calls: RESTCallsT
+) -> None:
+    add_define(bot, definitions)
+    definitions.fail = True
+    await look_up()
+
+    definitions.fail = False
+
+    assert await look_up() == "kumo: 2"
+
+
+@pytest.mark.parametrize(("scope", "calls"), [(kumo.CacheScope.NONE, 1), (kumo.CacheScope.GUILD, 2)])
+async def test_scope_separates_responses(
+    bot: RESTBot, definitions: Definitions, look_up: LookUpT, scope: kumo.CacheScope, calls: int
+) -> None:
+    add_define(bot, definitions, scope=scope)
+
+    await look_up(guild_id=1)
+    await look_up(guild_id=2)
+    await look_up(guild_id=1)
+
+    assert len(definitions.calls) == calls
+
+
+async def test_responses_expire(
+    bot: RESTBot, definitions: Definitions, look_up: LookUpT, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = 100.0
+    monkeypatch.setattr("kumo.commands.caching.time.monotonic", lambda: now)
+    add_define(bot, definitions, ttl=10.0)
+    await look_up()
+
+    now = 109.0
+    assert await look_up() == "kumo: 1"
+    now = 110.0
+    assert await look_up() == "kumo: 2"
+
+
+def test_least_recently_used_response_is_evicted() -> None:
+    store = ResponseCacheStore(max_size=2)
+    store.set("a", {"content": "a"})
+    store.set("b", {"content": "b"})
+    assert store.get("a") is not None
+
+    store.set("c", {"content": "c"})
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert len(store) == 2
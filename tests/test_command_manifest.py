@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kumo.impl.command_manifest import CommandManifest, ModuleManifest, get_fingerprint
+from kumo.impl.rest_bot import RESTBot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Package with a command module and helpers, fingerprinting imports its parent packages."""
+    package = tmp_path / "fingerprinted"
+    (package / "helpers").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "commands.py").write_text(
+        "import kumo\n"
+        "from fingerprinted.helpers.render import render\n"
+        "@kumo.slash_command('render')\n"
+        "class Render:\n"
+        "    async def callback(self, context): ...\n"
+    )
+    (package / "helpers" / "__init__.py").write_text("")
+    (package / "helpers" / "render.py").write_text("def render(): ...\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in tuple(sys.modules):
+        if name.partition(".")[0] == "fingerprinted":
+            del sys.modules[name]
+
+
+def test_fingerprint_changes_with_helpers_of_the_package(package: Path) -> None:
+    fingerprint = get_fingerprint("fingerprinted.commands")
+
+    (package / "helpers" / "render.py").write_text("def render(): return 1\n")
+
+    assert fingerprint is not None
+    assert get_fingerprint("fingerprinted.commands") != fingerprint
+
+
+def test_fingerprint_ignores_bytecode_caches(package: Path) -> None:
+    fingerprint = get_fingerprint("fingerprinted.commands")
+
+    (package / "__pycache__").mkdir()
+    (package / "__pycache__" / "commands.cpython-312.pyc").write_bytes(b"\0")
+
+    assert get_fingerprint("fingerprinted.commands") == fingerprint
+
+
+def test_manifest_of_changed_package_is_outdated(package: Path) -> None:
+    fingerprint = get_fingerprint("fingerprinted.commands")
+    assert fingerprint is not None
+    manifest = CommandManifest(modules={"fingerprinted.commands": ModuleManifest(fingerprint=fingerprint)})
+    assert manifest.get_module("fingerprinted.commands") is not None
+
+    (package / "helpers" / "render.py").write_text("def render(): return 2\n")
+
+    assert CommandManifest(modules=manifest.modules).get_module("fingerprinted.commands") is None
+
+
+def test_invalidate_drops_module_manifests() -> None:
+    manifest = CommandManifest(
+        modules={name: ModuleManifest(fingerprint="0") for name in ("bot.images", "bot.stats", "bot.admin")}
+    )
+
+    manifest.invalidate("bot.images")
+    assert set(manifest.modules) == {"bot.stats", "bot.admin"}
+    manifest.invalidate()
+    assert manifest.modules == {}
+
+
+def test_loader_imports_module_when_its_helpers_changed(package: Path, tmp_path: Path) -> None:
+    def load() -> RESTBot:
+        # Every load stands for a fresh process, so the module is imported again.
+        sys.modules.pop("fingerprinted.commands", None)
+        bot = RESTBot(
+            "token",
+            "Bot",
+            b"\0" * 32,
+            banner=None,
+            logs=None,
+            suppress_optimization_warning=True,
+            command_manifest=tmp_path / "manifest.json",
+        )
+        bot.load_module("fingerprinted.commands")
+        bot.commands.loader.save_manifest()
+        return bot
+
+    load()
+    assert "fingerprinted.commands" in load().commands.loader.modules
+
+    (package / "helpers" / "render.py").write_text("def render(): return 3\n")
+
+    assert "fingerprinted.commands" not in load().commands.loader.modules
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+from hikari.commands import OptionType
+from hikari.impl.rest import RESTClientImpl
+
+import kumo
+from kumo.impl.command_snapshot import CommandSnapshot
+from kumo.impl.command_syncer import hash_payload, normalize_payload, serialize_remote
+from kumo.impl.rest_bot import RESTBot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from conftest import CommandsAPI
+
+    from kumo.commands.types import CommandT
+    from kumo.context import CommandInteractionContext
+
+
+def make_bot(snapshot: Path) -> RESTBot:
+    """A fresh process of the bot, with a ``ping`` command."""
+
+    @kumo.slash_command("ping")
+    class Ping:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    bot = RESTBot("token", "Bot", banner=None, logs=None, suppress_optimization_warning=True, command_snapshot=snapshot)
+    bot.add_command(Ping)
+    return bot
+
+
+@pytest.fixture
+def snapshot(tmp_path: Path) -> Path:
+    return tmp_path / "commands.json"
+
+
+async def test_start_without_snapshot_syncs_and_saves_one(commands_api: CommandsAPI, snapshot: Path) -> None:
+    bot = make_bot(snapshot)
+
+    await bot.commands.start()
+
+    command_id = commands_api.commands[None]["ping"].id
+    assert commands_api.calls == [("set", None)]
+    assert bot.commands.get_command(command_id).metadata.name == "ping"
+    saved = CommandSnapshot.load(snapshot)
+    assert saved is not None
+    assert saved.commands == {"ping": command_id}
+
+
+async def test_start_from_snapshot_serves_right_away_and_verifies_in_background(
+    commands_api: CommandsAPI, snapshot: Path
+) -> None:
+    await make_bot(snapshot).commands.start()
+    commands_api.calls.clear()
+    bot = make_bot(snapshot)
+
+    await bot.commands.start()
+
+    assert commands_api.calls == []
+    assert bot.commands.get_command(commands_api.commands[None]["ping"].id).metadata.name == "ping"
+    assert bot.commands._sync_task is not None
+    await bot.commands._sync_task
+    assert commands_api.calls == [("fetch", None)]
+
+
+async def test_outdated_snapshot_is_synced_before_serving(commands_api: CommandsAPI, snapshot: Path) -> None:
+    CommandSnapshot(tree_hash="outdated", commands={"ping": 1}).save(snapshot)
+    bot = make_bot(snapshot)
+
+    await bot.commands.start()
+
+    assert commands_api.calls == [("set", None)]
+    assert bot.commands._sync_task is None
+
+
+async def test_failed_verification_is_logged(
+    commands_api: CommandsAPI, snapshot: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    await make_bot(snapshot).commands.start()
+    bot = make_bot(snapshot)
+
+    async def fail(*args: object) -> None:
+        raise RuntimeError("Discord is down")
+
+    monkeypatch.setattr(RESTClientImpl, "fetch_application_commands", fail)
+    await bot.commands.start()
+    assert bot.commands._sync_task is not None
+    await asyncio.wait((bot.commands._sync_task,))
+
+    assert [record.getMessage() for record in caplog.records if record.levelno == logging.ERROR] == [
+        "failed to verify commands of the snapshot: Discord is down"
+    ]
+
+
+async def test_stop_cancels_verification(commands_api: CommandsAPI, snapshot: Path) -> None:
+    await make_bot(snapshot).commands.start()
+    bot = make_bot(snapshot)
+    await bot.commands.start()
+    task = bot.commands._sync_task
+
+    await bot.commands.stop()
+
+    assert task is not None
+    assert task.cancelled()
+
+
+def make_tree(description: str = "Roll a die") -> list[CommandT]:
+    @kumo.slash_command(
+        "roll",
+        description=description,
+        options=[
+            kumo.Option(type=OptionType.INTEGER, name="sides", description="sides", min_value=2, max_value=100),
+            kumo.Option(
+                type=OptionType.STRING,
+                name="color",
+                description="color",
+                choices=[kumo.Choice(name="red", value="red"), kumo.Choice(name="blue", value="blue")],
+                is_required=False,
+            ),
+        ],
+    )
+    class Roll:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    @kumo.user_command("Inspect")
+    class Inspect:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    @kumo.command_group("config")
+    class Config:
+        @kumo.sub_command("show", options=[kumo.Option(type=OptionType.BOOLEAN, name="all", description="all")])
+        async def show(self, context: CommandInteractionContext) -> None: ...
+
+    return [Roll, Inspect, Config]
+
+
+def test_payload_of_remote_command_matches_its_built_payload(bot: RESTBot) -> None:
+    for builder in bot.commands.syncer.builder.build_commands(make_tree()):
+        payload = builder.build(bot.entity_factory)
+        remote = bot.entity_factory.deserialize_command(
+            {"default_member_permissions": None, **payload, "id": 1, "application_id": 1, "version": 1},
+            guild_id=None,
+        )
+
+        assert normalize_payload(serialize_remote(remote)) == normalize_payload(payload)
+        assert hash_payload(serialize_remote(remote)) == hash_payload(payload)
+
+
+def test_payload_hash_ignores_defaults_and_ids(bot: RESTBot) -> None:
+    builder = next(iter(bot.commands.syncer.builder.build_commands(make_tree())))
+    payload = dict(builder.build(bot.entity_factory))
+
+    assert hash_payload({**payload, "id": 1, "nsfw": False, "dm_permission": True}) == hash_payload(payload)
+    assert hash_payload({**payload, "description": "Roll two dice"}) != hash_payload(payload)
+
+
+async def test_incremental_sync_only_sends_changed_commands(bot: RESTBot, commands_api: CommandsAPI) -> None:
+    roll, inspect, config = make_tree()
+    for command in (roll, inspect):
+        bot.add_command(command)
+    await bot.commands.sync_commands()
+    ids = {name: command.id for name, command in commands_api.commands[None].items()}
+    commands_api.calls.clear()
+
+    bot = RESTBot("token", "Bot", banner=None, logs=None, suppress_optimization_warning=True)
+    for command in (make_tree("Roll some dice")[0], config):
+        bot.add_command(command)
+    result = await bot.commands.sync_commands(incremental=True)
+
+    assert (result.unchanged, result.created, result.updated, result.deleted) == ([], ["config"], ["roll"], ["Inspect"])
+    assert sorted(commands_api.calls) == [("create", None), ("create", None), ("delete", None), ("fetch", None)]
+    assert commands_api.commands[None]["roll"].id == ids["roll"]
+    commands_api.calls.clear()
+
+    result = await bot.commands.sync_commands(incremental=True)
+
+    assert sorted(result.unchanged) == ["config", "roll"]
+    assert commands_api.calls == [("fetch", None)]
+
+
+async def test_failed_command_is_reported_and_others_are_synced(bot: RESTBot, commands_api: CommandsAPI) -> None:
+    for command in make_tree():
+        bot.add_command(command)
+    commands_api.failing.add("config")
+
+    result = await bot.commands.sync_commands(incremental=True)
+
+    assert sorted(result.created) == ["Inspect", "roll"]
+    assert list(result.errors) == ["config"]
+    assert str(result) == "unchanged=0 created=2 updated=0 deleted=0 failed=1"
+    assert bot.commands.get_command(commands_api.commands[None]["roll"].id).metadata.name == "roll"
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+import pytest
+from hikari.interactions import ResponseType
+
+import kumo
+from kumo.impl.interaction_scheduler import InteractionScheduler
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext, ComponentInteractionContext, ModalInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+ClickT = Callable[[str], Awaitable[str | None]]
+
+
+def add_reply(bot: RESTBot, pattern: str, reply: str) -> None:
+    """Add a component which updates the message with ``reply`` followed by the values of its placeholders."""
+
+    @kumo.component(pattern)
+    class Reply:
+        async def callback(self, context: ComponentInteractionContext, **kwargs: object) -> None:
+            await context.update_message(" ".join((reply, *(f"{name}={value!r}" for name, value in kwargs.items()))))
+
+    bot.add_component(Reply)
+
+
+@pytest.fixture
+def click(client: InteractionTestClient, send: SendT) -> ClickT:
+    """Click a button with the custom ID and return the content of the updated message."""
+
+    async def click(custom_id: str) -> str | None:
+        body = await send(client.build_component_payload(custom_id))
+        if body["type"] == ResponseType.DEFERRED_MESSAGE_UPDATE:
+            return None
+        assert body["type"] == ResponseType.MESSAGE_UPDATE
+        return body["data"]["content"]
+
+    return click
+
+
+async def test_exact_pattern_takes_precedence_over_placeholders(bot: RESTBot, click: ClickT) -> None:
+    add_reply(bot, "page:{name}", "named")
+    add_reply(bot, "page:first", "first")
+
+    assert await click("page:first") == "first"
+    assert await click("page:last") == "named name='last'"
+
+
+async def test_literal_segment_takes_precedence_over_placeholder(bot: RESTBot, click: ClickT) -> None:
+    add_reply(bot, "ticket:{id:int}:{action}", "action")
+    add_reply(bot, "ticket:{id:int}:close", "close")
+
+    assert await click("ticket:7:close") == "close id=7"
+    assert await click("ticket:7:open") == "action id=7 action='open'"
+
+
+async def test_placeholder_matches_when_literal_branch_does_not(bot: RESTBot, click: ClickT) -> None:
+    add_reply(bot, "vote:{poll}:yes", "vote")
+    add_reply(bot, "vote:results:show", "results")
+
+    assert await click("vote:results:show") == "results"
+    assert await click("vote:results:yes") == "vote poll='results'"
+
+
+async def test_unconvertible_argument_does_not_match(
+    bot: RESTBot, click: ClickT, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    add_reply(bot, "item:{id:int}", "item")
+
+    assert await click("item:3") == "item id=3"
+    assert await click("item:three") is None
+    body = await send(client.build_component_payload("item:three", modal_values={}))
+    assert body["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+
+
+async def test_modals_are_routed_apart_from_components(
+    bot: RESTBot, click: ClickT, client: InteractionTestClient, send: SendT
+) -> None:
+    @kumo.modal("report:{user_id:int}")
+    class Report:
+        async def callback(self, context: ModalInteractionContext, user_id: int) -> None:
+            await context.create_response(f"{user_id} {context.values['reason']}", ephemeral=True)
+
+    bot.add_component(Report)
+    add_reply(bot, "report:{user_id:int}", "button")
+
+    body = await send(client.build_component_payload("report:5", modal_values={"reason": "spam"}))
+    assert body["data"]["content"] == "5 spam"
+    assert await click("report:5") == "button user_id=5"
+
+
+def test_overlapping_patterns_are_rejected(bot: RESTBot) -> None:
+    add_reply(bot, "page:first", "first")
+    add_reply(bot, "page:{index:int}", "index")
+
+    with pytest.raises(ValueError, match="already handled"):
+        add_reply(bot, "page:first", "again")
+    with pytest.raises(ValueError, match="overlaps"):
+        add_reply(bot, "page:{name}", "name")
+
+
+async def test_component_does_not_share_limit_of_command_with_its_name(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    release = asyncio.Event()
+
+    @kumo.slash_command("ping")
+    class Ping:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.defer()
+            await release.wait()
+
+    @kumo.component("ping")
+    class PingButton:
+        async def callback(self, context: ComponentInteractionContext) -> None:
+            await context.update_message("pong")
+
+    bot.add_command(Ping)
+    bot.add_component(PingButton)
+    bot.commands.scheduler = InteractionScheduler(command_limits={"ping": 1})
+
+    await send(client.build_command_payload("ping"))
+    body = await send(client.build_component_payload("ping"))
+    release.set()
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.MESSAGE_UPDATE
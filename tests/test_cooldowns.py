@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.interactions import ResponseType
+from hikari.messages import MessageFlag
+
+import kumo
+from kumo.commands.cooldowns import MemoryCooldownStore
+from kumo.impl.rest_bot import RESTBot
+
+if TYPE_CHECKING:
+    from conftest import SendT
+
+    from kumo.commands.abc import ICooldownStore
+    from kumo.context import CommandInteractionContext
+    from kumo.testing import InteractionTestClient
+
+InvokeT = Callable[..., Awaitable[str]]
+
+
+class FailingCooldownStore:
+    """Store whose backend is unavailable."""
+
+    async def acquire(self, key: str, rate: int, per: float) -> float:
+        raise ConnectionError("store is unavailable")
+
+
+@pytest.fixture
+def store() -> ICooldownStore:
+    return MemoryCooldownStore()
+
+
+@pytest.fixture
+def bot(client: InteractionTestClient, store: ICooldownStore) -> RESTBot:
+    return RESTBot(
+        "token",
+        "Bot",
+        client.public_key,
+        banner=None,
+        logs=None,
+        suppress_optimization_warning=True,
+        cooldown_store=store,
+    )
+
+
+@pytest.fixture
+def invoke(client: InteractionTestClient, send: SendT) -> InvokeT:
+    """Invoke the ``roll`` command and return the content of its response, cooldown rejections are ephemeral."""
+
+    async def invoke(**kwargs: Any) -> str:  # noqa: ANN401
+        body = await send(client.build_command_payload("roll", **kwargs))
+        assert body["type"] == ResponseType.MESSAGE_CREATE
+        content = body["data"]["content"]
+        assert (body["data"].get("flags") == MessageFlag.EPHEMERAL) is content.startswith("This command")
+        return content
+
+    return invoke
+
+
+def add_roll(bot: RESTBot, cooldown: kumo.Cooldown) -> list[int]:
+    """Add the ``roll`` command with the cooldown, returns the users it ran for."""
+    calls: list[int] = []
+
+    @kumo.slash_command("roll", cooldown=cooldown)
+    class Roll:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            calls.append(context.interaction.user.id)
+            await context.create_response("4")
+
+    bot.add_command(Roll)
+    return calls
+
+
+async def test_command_on_cooldown_is_rejected_without_running(bot: RESTBot, invoke: InvokeT) -> None:
+    calls = add_roll(bot, kumo.Cooldown(rate=2, per=60))
+
+    assert await invoke() == "4"
+    assert await invoke() == "4"
+    assert await invoke() == "This command is on cooldown, try again in 30 seconds."
+    assert calls == [1, 1]
+
+
+async def test_rejection_uses_the_message_of_the_cooldown(bot: RESTBot, invoke: InvokeT) -> None:
+    add_roll(bot, kumo.Cooldown(rate=1, per=5.5, message="This command rests for {retry_after}s."))
+
+    await invoke()
+
+    assert await invoke() == "This command rests for 6s."
+
+
+@pytest.mark.parametrize(
+    ("bucket", "shared", "separate"),
+    [
+        (kumo.CooldownBucket.USER, {"user_id": 1, "guild_id": 2}, {"user_id": 2, "guild_id": 1}),
+        (kumo.CooldownBucket.MEMBER, {"user_id": 1, "guild_id": 1}, {"user_id": 1, "guild_id": 2}),
+        (kumo.CooldownBucket.GUILD, {"user_id": 2, "guild_id": 1}, {"user_id": 1, "guild_id": None}),
+        (kumo.CooldownBucket.GLOBAL, {"user_id": 2, "guild_id": None}, None),
+    ],
+)
+async def test_buckets_share_cooldowns(
+    bot: RESTBot,
+    invoke: InvokeT,
+    bucket: kumo.CooldownBucket,
+    shared: dict[str, Any],
+    separate: dict[str, Any] | None,
+) -> None:
+    add_roll(bot, kumo.Cooldown(rate=1, per=60, bucket=bucket))
+
+    assert await invoke(user_id=1, guild_id=1) == "4"
+    assert await invoke(**shared) != "4"
+    if separate is not None:
+        assert await invoke(**separate) == "4"
+
+
+async def test_commands_do_not_share_cooldowns(bot: RESTBot, client: InteractionTestClient, send: SendT) -> None:
+    cooldown = kumo.Cooldown(rate=1, per=60)
+    add_roll(bot, cooldown)
+
+    @kumo.slash_command("flip", cooldown=cooldown)
+    class Flip:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.create_response("heads")
+
+    bot.add_command(Flip)
+
+    await send(client.build_command_payload("roll"))
+    body = await send(client.build_command_payload("flip"))
+
+    assert body["data"]["content"] == "heads"
+
+
+@pytest.mark.parametrize("store", [FailingCooldownStore()])
+async def test_commands_run_while_store_fails(bot: RESTBot, invoke: InvokeT) -> None:
+    calls = add_roll(bot, kumo.Cooldown(rate=1, per=60))
+
+    assert await invoke() == "4"
+    assert await invoke() == "4"
+    assert calls == [1, 1]
+
+
+def test_burst_of_rate_is_allowed_then_retry_after_is_returned() -> None:
+    store = MemoryCooldownStore()
+
+    assert [store.acquire_now("key", 3, 30.0, 0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert store.acquire_now("key", 3, 30.0, 0.0) == 10.0
+    assert store.acquire_now("key", 3, 30.0, 4.0) == 6.0
+
+
+def test_token_is_refilled_every_per_divided_by_rate() -> None:
+    store = MemoryCooldownStore()
+    for _ in range(2):
+        store.acquire_now("key", 2, 10.0, 0.0)
+
+    assert store.acquire_now("key", 2, 10.0, 4.5) == pytest.approx(0.5)
+    assert store.acquire_now("key", 2, 10.0, 5.0) == 0.0
+    assert store.acquire_now("key", 2, 10.0, 5.0) == 5.0
+    assert store.acquire_now("key", 2, 10.0, 20.0) == 0.0
+    assert store.acquire_now("key", 2, 10.0, 20.0) == 0.0
+    assert store.acquire_now("key", 2, 10.0, 20.0) == 5.0
+
+
+def test_refilled_buckets_are_evicted() -> None:
+    store = MemoryCooldownStore()
+    store.acquire_now("a", 1, 10.0, 0.0)
+    store.acquire_now("b", 1, 10.0, 5.0)
+
+    store.acquire_now("c", 1, 10.0, 12.0)
+
+    assert len(store) == 2
+    assert store.acquire_now("a", 1, 10.0, 12.0) == 0.0
+    assert store.acquire_now("b", 1, 10.0, 12.0) == 3.0
+
+
+def test_least_recently_used_bucket_is_evicted_beyond_max_size() -> None:
+    store = MemoryCooldownStore(max_size=2)
+    for key in ("a", "b", "c"):
+        store.acquire_now(key, 1, 10.0, 0.0)
+
+    assert len(store) == 2
+    assert store.acquire_now("a", 1, 10.0, 0.0) == 0.0
+    assert store.acquire_now("c", 1, 10.0, 0.0) == 10.0
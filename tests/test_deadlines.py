@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from hikari.interactions import ResponseType
+from hikari.messages import MessageFlag
+
+import kumo
+from kumo.impl.command_router import compile_command
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+ERROR_MESSAGE: str = "Something went wrong, please try again later."
+
+
+@pytest.fixture
+def timeouts(monkeypatch: pytest.MonkeyPatch) -> list[float | None]:
+    """Record the delays of every ``asyncio.timeout`` entered."""
+    delays: list[float | None] = []
+    timeout = asyncio.timeout
+
+    def record(delay: float | None) -> asyncio.Timeout:
+        delays.append(delay)
+        return timeout(delay)
+
+    monkeypatch.setattr(asyncio, "timeout", record)
+    return delays
+
+
+def add_command(
+    bot: RESTBot, callback: Callable[[CommandInteractionContext], Awaitable[object]], *, timeout: float | None = None
+) -> None:
+    @kumo.slash_command("work", timeout=timeout)
+    class Work:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await callback(context)
+
+    bot.add_command(Work)
+
+
+@pytest.mark.parametrize(
+    ("route_timeout", "callback_timeout", "expected"),
+    [(5.0, None, 5.0), (None, 5.0, 5.0), (3.0, 5.0, 3.0), (5.0, 3.0, 3.0), (None, None, None)],
+)
+def test_shorter_timeout_applies(
+    bot: RESTBot, route_timeout: float | None, callback_timeout: float | None, expected: float | None
+) -> None:
+    @kumo.slash_command("work", timeout=route_timeout)
+    class Work:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    bot.commands.callback_timeout = callback_timeout
+
+    assert bot.commands.get_timeout(compile_command(Work)[None, None]) == expected
+
+
+async def test_callback_without_timeout_runs_without_deadline(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, timeouts: list[float | None]
+) -> None:
+    async def callback(context: CommandInteractionContext) -> None:
+        await context.create_response("done")
+
+    add_command(bot, callback)
+
+    body = await send(client.build_command_payload("work"))
+    bot.commands.callback_timeout = 60.0
+    await send(client.build_command_payload("work"))
+
+    assert body["data"]["content"] == "done"
+    assert timeouts == [60.0]
+
+
+async def test_hung_callback_is_cancelled_and_timeout_hook_replies(
+    bot: RESTBot, client: InteractionTestClient, send: SendT
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def callback(context: CommandInteractionContext) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def on_timeout(context: CommandInteractionContext) -> None:
+        await context.create_response("Timed out.", ephemeral=True)
+
+    add_command(bot, callback, timeout=0.01)
+    bot.commands.on_timeout = on_timeout
+
+    body = await send(client.build_command_payload("work"))
+
+    assert cancelled.is_set()
+    assert body["data"]["content"] == "Timed out."
+
+
+async def test_failed_callback_gets_error_reply(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    async def callback(context: CommandInteractionContext) -> None:
+        raise RuntimeError("boom")
+
+    add_command(bot, callback)
+
+    body = await send(client.build_command_payload("work"))
+
+    assert body["type"] == ResponseType.MESSAGE_CREATE
+    assert body["data"]["content"] == ERROR_MESSAGE
+    assert body["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert rest_calls == []
+
+
+async def test_timed_out_callback_without_hook_gets_error_reply(
+    bot: RESTBot, client: InteractionTestClient, send: SendT
+) -> None:
+    add_command(bot, lambda context: asyncio.Event().wait(), timeout=0.01)
+
+    body = await send(client.build_command_payload("work"))
+
+    assert body["data"]["content"] == ERROR_MESSAGE
+
+
+async def test_deferred_response_of_failed_callback_is_edited(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    async def callback(context: CommandInteractionContext) -> None:
+        await context.defer()
+        raise RuntimeError("boom")
+
+    add_command(bot, callback)
+
+    body = await send(client.build_command_payload("work"))
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", ERROR_MESSAGE)]
+
+
+async def test_answered_interaction_gets_no_error_reply(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    async def callback(context: CommandInteractionContext) -> None:
+        await context.defer()
+        await context.edit_response("partial")
+        raise RuntimeError("boom")
+
+    add_command(bot, callback)
+
+    await send(client.build_command_payload("work"))
+    await bot.commands.scheduler.drain()
+
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", "partial")]
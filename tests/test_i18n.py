@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+import pytest
+
+import kumo
+from kumo.i18n.catalog import CatalogLocalizationProvider, compile_catalog
+from kumo.i18n.templates import Translator, parse_template
+from kumo.i18n.types import Localized
+from kumo.impl.rest_bot import RESTBot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hikari.locales import Locale
+
+    from kumo.context import CommandInteractionContext
+    from kumo.testing import InteractionTestClient
+
+GREETING: Localized = Localized("greeting", fallback="Hello {name}")
+
+
+class Provider:
+    """Localization provider with German greetings, recording every localized key."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    def localize(self, value: Localized) -> tuple[Mapping[Locale | str, str], str]:
+        self.keys.append(value.key)
+        return {"de": "Hallo {name}"}, value.fallback
+
+
+@pytest.fixture
+def provider() -> Provider:
+    return Provider()
+
+
+def add_echo(bot: RESTBot, text: str) -> None:
+    @kumo.slash_command("echo")
+    class Echo:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.create_response(f"{context.translate(text)} / {context.translate(GREETING, name='kumo')}")
+
+    bot.add_command(Echo)
+
+
+def test_localized_keys_are_translated_once_per_locale_chain(provider: Provider) -> None:
+    translator = Translator(provider)  # type: ignore[arg-type]
+
+    assert translator.translate(GREETING, ("de-AT", "de"), {"name": "kumo"}) == "Hallo kumo"
+    assert translator.translate(GREETING, ("de-AT", "de"), {"name": "kumo"}) == "Hallo kumo"
+    assert translator.translate(GREETING, ("fr",), {"name": "kumo"}) == "Hello kumo"
+    assert provider.keys == ["greeting", "greeting"]
+
+
+def test_plain_strings_are_not_translation_keys(provider: Provider) -> None:
+    translator = Translator(provider)  # type: ignore[arg-type]
+
+    assert translator.translate("{oops", ("de",), {}) == "{oops"
+    assert translator.translate("Wait {retry_after}s", ("de",), {"retry_after": 3}) == "Wait 3s"
+    assert provider.keys == []
+    assert not translator._templates
+
+
+def test_parsed_templates_are_shared() -> None:
+    translator = Translator(Provider())  # type: ignore[arg-type]
+
+    assert translator.get_template(GREETING, ("fr",)) is parse_template("Hello {name}")
+
+
+@pytest.mark.parametrize("i18n", [False, True])
+async def test_context_translates_with_and_without_translator(
+    client: InteractionTestClient, provider: Provider, i18n: bool
+) -> None:
+    bot = RESTBot(
+        "token",
+        "Bot",
+        client.public_key,
+        banner=None,
+        logs=None,
+        suppress_optimization_warning=True,
+        i18n=provider if i18n else None,  # type: ignore[arg-type]
+    )
+    add_echo(bot, "{user input}")
+
+    response = await client.send(bot.interaction_server, client.build_command_payload("echo", locale="de"))
+
+    assert response.payload is not None
+    greeting = "Hallo kumo" if i18n else "Hello kumo"
+    assert json.loads(response.payload)["data"]["content"] == f"{{user input}} / {greeting}"
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    """Compiled catalog of English and German sources, with a key missing in German."""
+    source = tmp_path / "locales"
+    source.mkdir()
+    english = {"greeting": "Hello {name}", "roll": {"result": "You rolled {value}"}}
+    (source / "en-US.json").write_text(json.dumps(english))
+    (source / "de.toml").write_text('greeting = "Hallo {name}"\n')
+    compile_catalog(source, tmp_path / "catalog.bin")
+    return tmp_path / "catalog.bin"
+
+
+def test_compiled_catalog_looks_translations_up(catalog: Path) -> None:
+    provider = CatalogLocalizationProvider(catalog, default_locale="en-US")
+
+    assert provider.locales == ("de", "en-US")
+    assert provider.get("greeting") == {"de": "Hallo {name}", "en-US": "Hello {name}"}
+    assert provider.get("roll.result") == {"en-US": "You rolled {value}"}
+    assert provider.get("missing") == {}
+    assert provider.localize(Localized("roll.result", fallback="")) == (
+        {"en-US": "You rolled {value}"},
+        "You rolled {value}",
+    )
+    assert provider.localize(Localized("missing", fallback="Missing")) == ({}, "Missing")
+
+
+def test_reloaded_catalog_bumps_revision(catalog: Path) -> None:
+    provider = CatalogLocalizationProvider(catalog)
+    source = catalog.parent / "locales"
+    (source / "de.toml").write_text('greeting = "Servus {name}"\n')
+    compile_catalog(source, catalog)
+
+    provider.reload()
+
+    assert provider.revision == 2
+    assert provider.get("greeting")["de"] == "Servus {name}"
+
+
+@pytest.mark.parametrize(
+    ("size", "error"),
+    [
+        (0, "is not a compiled catalog"),
+        (6, "is not a compiled catalog"),
+        (30, "is a truncated or corrupted catalog"),
+    ],
+)
+def test_broken_catalog_is_refused(catalog: Path, size: int, error: str) -> None:
+    catalog.write_bytes(catalog.read_bytes()[:size])
+
+    with pytest.raises(ValueError, match=error):
+        CatalogLocalizationProvider(catalog)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from hikari.embeds import Embed
+from hikari.interactions import ResponseType
+
+import kumo
+from kumo.impl.interaction_scheduler import DrainResult
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.progress import ProgressEditor
+    from kumo.testing import InteractionTestClient
+
+EMBEDS: tuple[Embed, ...] = tuple(Embed(title=f"page {index}") for index in range(25))
+
+
+def add_report(bot: RESTBot, *, defer: bool = False, edit: bool = False) -> None:
+    @kumo.slash_command("report")
+    class Report:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            if defer:
+                await context.defer()
+            if edit:
+                await context.edit_response("loading")
+            await context.send_embeds(EMBEDS)
+
+    bot.add_command(Report)
+
+
+def add_progress(bot: RESTBot, run: Callable[[ProgressEditor], Awaitable[None]], *, interval: float) -> None:
+    @kumo.slash_command("progress")
+    class Progress:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.defer()
+            await run(context.progress(interval=interval))
+
+    bot.add_command(Progress)
+
+
+def get_edits(rest_calls: RESTCallsT) -> list[str]:
+    assert all(name == "edit_interaction_response" for name, _ in rest_calls)
+    return [kwargs["content"] for _, kwargs in rest_calls]
+
+
+def get_first_titles(rest_calls: RESTCallsT) -> list[tuple[str, str | None]]:
+    """Name of every REST call with the title of its first embed, if it sent embeds."""
+    return [(name, kwargs["embeds"][0].title if kwargs.get("embeds") else None) for name, kwargs in rest_calls]
+
+
+async def test_first_embeds_are_sent_in_http_reply(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    add_report(bot)
+
+    body = await send(client.build_command_payload("report"))
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.MESSAGE_CREATE
+    assert [embed["title"] for embed in body["data"]["embeds"]] == [f"page {index}" for index in range(10)]
+    assert [(name, len(kwargs["embeds"])) for name, kwargs in rest_calls] == [
+        ("execute_webhook", 10),
+        ("execute_webhook", 5),
+    ]
+
+
+@pytest.mark.parametrize("edit", [False, True])
+async def test_deferred_response_is_edited_into_first_embeds_once(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT, edit: bool
+) -> None:
+    add_report(bot, defer=True, edit=edit)
+
+    body = await send(client.build_command_payload("report"))
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    expected = [("edit_interaction_response", "page 0"), ("execute_webhook", "page 10"), ("execute_webhook", "page 20")]
+    if edit:
+        expected = [("edit_interaction_response", None), ("execute_webhook", "page 0"), *expected[1:]]
+    assert get_first_titles(rest_calls) == expected
+
+
+async def test_updates_within_interval_are_coalesced(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    dropped: list[int] = []
+
+    async def run(editor: ProgressEditor) -> None:
+        editor.update("1")
+        await asyncio.sleep(0)
+        for step in "234":
+            editor.update(step)
+        await asyncio.sleep(0.01)
+        await editor.finish()
+        dropped.append(editor.dropped)
+
+    add_progress(bot, run, interval=60.0)
+
+    await send(client.build_command_payload("progress"))
+    await bot.commands.scheduler.drain()
+
+    assert get_edits(rest_calls) == ["1", "4"]
+    assert dropped == [2]
+
+
+async def test_edits_are_rate_limited(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    counts: list[int] = []
+
+    async def run(editor: ProgressEditor) -> None:
+        editor.update("1")
+        await asyncio.sleep(0)
+        editor.update("2")
+        await asyncio.sleep(0.02)
+        counts.append(len(rest_calls))
+        await asyncio.sleep(0.4)
+        counts.append(len(rest_calls))
+        await editor.finish()
+
+    add_progress(bot, run, interval=0.2)
+
+    await send(client.build_command_payload("progress"))
+    await bot.commands.scheduler.drain()
+
+    assert counts == [1, 2]
+    assert get_edits(rest_calls) == ["1", "2"]
+
+
+@pytest.mark.parametrize("final", [None, "done"])
+async def test_finish_delivers_final_state_right_away(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT, final: str | None
+) -> None:
+    async def run(editor: ProgressEditor) -> None:
+        async with editor:
+            editor.update("1")
+            await asyncio.sleep(0)
+            editor.update("2")
+            if final is not None:
+                await editor.finish(final)
+
+    add_progress(bot, run, interval=60.0)
+
+    await send(client.build_command_payload("progress"))
+
+    assert await bot.commands.scheduler.drain(timeout=5.0) == DrainResult(completed=1)
+    assert get_edits(rest_calls) == ["1", final or "2"]
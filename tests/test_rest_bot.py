@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+from hikari.commands import CommandType, OptionType
+from hikari.interactions import ResponseType
+from hikari.messages import MessageFlag
+
+import kumo
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+    from hikari.users import User
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+
+async def test_initial_response_is_sent_in_http_reply(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    @kumo.slash_command("echo", options=[kumo.Option(type=OptionType.STRING, name="text", description="text")])
+    class Echo:
+        async def callback(self, context: CommandInteractionContext, text: str) -> None:
+            await context.create_response(text, ephemeral=True)
+
+    bot.add_command(Echo)
+
+    body = await send(client.build_command_payload("echo", options=[{"name": "text", "type": 3, "value": "hello"}]))
+
+    assert body["type"] == ResponseType.MESSAGE_CREATE
+    assert body["data"]["content"] == "hello"
+    assert body["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert rest_calls == []
+
+
+async def test_request_with_invalid_signature_is_rejected(bot: RESTBot, client: InteractionTestClient) -> None:
+    body = json.dumps(client.build_command_payload("echo")).encode()
+    headers = client.sign(body)
+
+    response = await bot.interaction_server.on_interaction(
+        body + b" ", bytes.fromhex(headers["X-Signature-Ed25519"]), headers["X-Signature-Timestamp"].encode()
+    )
+
+    assert response.status_code == 400
+
+
+async def test_slow_callback_is_deferred_and_edited_later(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    @kumo.slash_command("slow")
+    class Slow:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await asyncio.sleep(0.05)
+            await context.create_response("done")
+
+    bot.add_command(Slow)
+    bot.response_timeout = 0.01
+
+    body = await send(client.build_command_payload("slow"))
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", "done")]
+
+
+async def test_http_reply_does_not_wait_for_callback_to_finish(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    release = asyncio.Event()
+
+    @kumo.slash_command("chatty")
+    class Chatty:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.create_response("first")
+            await release.wait()
+            await context.edit_response("second")
+
+    bot.add_command(Chatty)
+
+    body = await send(client.build_command_payload("chatty"))
+    assert rest_calls == []
+    release.set()
+    await bot.commands.scheduler.drain()
+
+    assert body["type"] == ResponseType.MESSAGE_CREATE
+    assert body["data"]["content"] == "first"
+    assert [(name, kwargs["content"]) for name, kwargs in rest_calls] == [("edit_interaction_response", "second")]
+
+
+async def test_user_command_gets_resolved_target(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, rest_calls: RESTCallsT
+) -> None:
+    @kumo.user_command("whois")
+    class WhoIs:
+        async def callback(self, context: CommandInteractionContext, user: User) -> None:
+            await context.create_response(f"user {user.id}")
+
+    bot.add_command(WhoIs)
+    target = {"id": "42", "username": "target", "discriminator": "0", "avatar": None}
+
+    body = await send(
+        client.build_command_payload(
+            "whois", command_type=CommandType.USER, target_id=42, resolved={"users": {"42": target}}
+        )
+    )
+
+    assert body["data"]["content"] == "user 42"
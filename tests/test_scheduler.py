@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from hikari.interactions import ResponseType
+from hikari.messages import MessageFlag
+
+import kumo
+from kumo.impl.interaction_scheduler import DrainResult, InteractionScheduler, OverflowPolicy
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext
+    from kumo.impl.rest_bot import RESTBot
+    from kumo.testing import InteractionTestClient
+
+BUSY_MESSAGE: str = "The bot is busy right now, please try again later."
+
+
+class Jobs:
+    """Callback of the ``job`` command, each call waits for ``release`` and then responds with its number."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def __call__(self, context: CommandInteractionContext) -> None:
+        self.started.append(number := len(self.started) + 1)
+        await context.defer()
+        await self.release.wait()
+        await context.create_response(f"job {number}")
+
+
+@pytest.fixture
+def jobs(bot: RESTBot) -> Jobs:
+    jobs = Jobs()
+
+    @kumo.slash_command("job")
+    class Job:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await jobs(context)
+
+    bot.add_command(Job)
+    return jobs
+
+
+async def test_reject_policy_replies_busy_when_no_slot_is_free(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, jobs: Jobs, rest_calls: RESTCallsT
+) -> None:
+    bot.commands.scheduler = InteractionScheduler(max_concurrency=1, policy=OverflowPolicy.REJECT)
+
+    first = await send(client.build_command_payload("job"))
+    second = await send(client.build_command_payload("job"))
+    jobs.release.set()
+    await bot.commands.scheduler.drain()
+
+    assert first["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    assert second["type"] == ResponseType.MESSAGE_CREATE
+    assert second["data"]["content"] == BUSY_MESSAGE
+    assert second["data"]["flags"] == MessageFlag.EPHEMERAL
+    assert jobs.started == [1]
+
+
+async def test_defer_policy_queues_deferred_interactions(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, jobs: Jobs, rest_calls: RESTCallsT
+) -> None:
+    bot.commands.scheduler = InteractionScheduler(max_concurrency=1, policy=OverflowPolicy.DEFER)
+
+    await send(client.build_command_payload("job"))
+    second = await send(client.build_command_payload("job"))
+    assert bot.commands.scheduler.queued == 1
+    assert jobs.started == [1]
+    jobs.release.set()
+    await bot.commands.scheduler.drain()
+
+    assert second["type"] == ResponseType.DEFERRED_MESSAGE_CREATE
+    assert jobs.started == [1, 2]
+    assert [kwargs["content"] for _, kwargs in rest_calls] == ["job 1", "job 2"]
+
+
+async def test_interactions_beyond_full_queue_are_rejected(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, jobs: Jobs, rest_calls: RESTCallsT
+) -> None:
+    bot.commands.scheduler = InteractionScheduler(max_concurrency=1, max_queue=1)
+
+    await send(client.build_command_payload("job"))
+    await send(client.build_command_payload("job"))
+    third = await send(client.build_command_payload("job"))
+    jobs.release.set()
+    await bot.commands.scheduler.drain()
+
+    assert third["data"]["content"] == BUSY_MESSAGE
+    assert jobs.started == [1, 2]
+
+
+async def test_drain_waits_for_running_interactions_and_refuses_new_ones(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, jobs: Jobs, rest_calls: RESTCallsT
+) -> None:
+    await send(client.build_command_payload("job"))
+    asyncio.get_running_loop().call_later(0.01, jobs.release.set)
+
+    assert await bot.commands.scheduler.drain() == DrainResult(completed=1)
+    body = await send(client.build_command_payload("job"))
+    assert body["data"]["content"] == BUSY_MESSAGE
+    assert jobs.started == [1]
+
+
+async def test_drain_cancels_interactions_running_after_timeout(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, jobs: Jobs, rest_calls: RESTCallsT
+) -> None:
+    bot.commands.scheduler = InteractionScheduler(max_concurrency=1)
+    await send(client.build_command_payload("job"))
+    await send(client.build_command_payload("job"))
+
+    assert await bot.commands.scheduler.drain(timeout=0.01) == DrainResult(cancelled=2)
+    assert bot.commands.scheduler.queued == 0
+    assert not bot.commands.scheduler.tasks
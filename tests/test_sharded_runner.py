@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hikari.snowflakes import Snowflake
+
+import kumo
+from kumo.impl.gateway_bot import GatewayBot
+from kumo.impl.sharded_runner import ShardedRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from conftest import CommandsAPI
+
+    from kumo.context import CommandInteractionContext
+
+GUILD: Snowflake = Snowflake(42)
+
+
+class Process:
+    """Stand-in of a worker process, it runs nothing and only exits when told to."""
+
+    pids = itertools.count(100)
+
+    def __init__(self, *, target: Callable[..., None], args: tuple[Any, ...], name: str) -> None:
+        self.args: tuple[Any, ...] = args
+        self.pid: int | None = None
+        self.exitcode: int | None = None
+        self.stuck: bool = False
+        self.killed: bool = False
+
+    def start(self) -> None:
+        self.pid = next(self.pids)
+
+    def is_alive(self) -> bool:
+        return self.pid is not None and self.exitcode is None
+
+    def terminate(self) -> None:
+        if not self.stuck:
+            self.exitcode = -15
+
+    def kill(self) -> None:
+        self.killed = True
+        self.exitcode = -9
+
+    def join(self, timeout: float | None = None) -> None: ...
+
+
+def make_bot() -> GatewayBot:
+    @kumo.slash_command("ping")
+    class Ping:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    @kumo.slash_command("ban", guilds=[GUILD])
+    class Ban:
+        async def callback(self, context: CommandInteractionContext) -> None: ...
+
+    bot = GatewayBot("token", banner=None, logs=None, suppress_optimization_warning=True)
+    bot.add_command(Ping)
+    bot.add_command(Ban)
+    return bot
+
+
+@pytest.fixture
+def factory_calls() -> list[GatewayBot]:
+    return []
+
+
+@pytest.fixture
+def runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, factory_calls: list[GatewayBot]) -> ShardedRunner:
+    def factory() -> GatewayBot:
+        factory_calls.append(bot := make_bot())
+        return bot
+
+    runner = ShardedRunner(factory, workers=2, shard_count=5, snapshot_path=tmp_path / "commands.json", max_backoff=5.0)
+    monkeypatch.setattr(runner, "_context", SimpleNamespace(Process=Process))
+    return runner
+
+
+async def test_commands_are_synced_once_then_workers_map_them_from_snapshot(
+    runner: ShardedRunner, commands_api: CommandsAPI, factory_calls: list[GatewayBot]
+) -> None:
+    await runner.start()
+
+    assert len(factory_calls) == 1
+    assert sorted(commands_api.calls, key=str) == [("set", GUILD), ("set", None)]
+    assert [list(health.shard_ids) for health in runner.get_health()] == [[0, 1, 2], [3, 4]]
+    assert all(process.args[4] == runner.snapshot_path for process in runner._processes.values())
+
+    # A worker builds its own bot and maps global and guild commands without any request.
+    commands_api.calls.clear()
+    worker = make_bot()
+    worker.commands.snapshot_path = runner.snapshot_path
+    await worker.commands.start(sync_commands=False)
+
+    assert commands_api.calls == []
+    for guild, name in ((None, "ping"), (GUILD, "ban")):
+        assert worker.commands.commands[commands_api.commands[guild][name].id].metadata.name == name
+
+
+async def test_crashed_worker_is_restarted_with_backoff(
+    runner: ShardedRunner, commands_api: CommandsAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+        await real_sleep(0)
+
+    await runner.start()
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    for _ in range(5):
+        crashed = runner._processes[0]
+        crashed.exitcode = 1
+        assert runner.check_worker(0)
+        assert not runner.health[0].alive
+        await runner.restart(0)
+        assert runner._processes[0] is not crashed
+        assert runner.health[0].alive
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert runner.health[0].restarts == 5
+    assert runner.health[0].pid == runner._processes[0].pid
+
+
+async def test_cleanly_exited_worker_is_not_restarted(runner: ShardedRunner, commands_api: CommandsAPI) -> None:
+    await runner.start()
+
+    runner._processes[1].exitcode = 0
+
+    assert not runner.check_worker(1)
+    assert not runner.health[1].alive
+
+
+async def test_close_terminates_workers_and_kills_stuck_ones(runner: ShardedRunner, commands_api: CommandsAPI) -> None:
+    await runner.start()
+    stuck = runner._processes[1]
+    stuck.stuck = True
+
+    await runner.close(timeout=0.0)
+
+    assert runner._processes[0].exitcode == -15
+    assert stuck.killed
+    assert not runner._processes[0].killed
+    assert not any(health.alive for health in runner.get_health())
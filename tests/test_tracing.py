@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+import kumo
+from kumo.impl.interaction_scheduler import InteractionScheduler
+from kumo.impl.rest_bot import RESTBot
+from kumo.tracing.opentelemetry import OpenTelemetryTracer
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+if TYPE_CHECKING:
+    from conftest import RESTCallsT, SendT
+
+    from kumo.context import CommandInteractionContext, ComponentInteractionContext
+    from kumo.testing import InteractionTestClient
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def bot(client: InteractionTestClient, exporter: InMemorySpanExporter) -> RESTBot:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return RESTBot(
+        "token",
+        "Bot",
+        client.public_key,
+        banner=None,
+        logs=None,
+        suppress_optimization_warning=True,
+        tracer=OpenTelemetryTracer(provider.get_tracer("test")),
+    )
+
+
+def get_spans(exporter: InMemorySpanExporter) -> dict[str, ReadableSpan]:
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+async def test_command_phases_are_children_of_interaction_span(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, exporter: InMemorySpanExporter
+) -> None:
+    @kumo.slash_command("ping")
+    class Ping:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await context.create_response("pong")
+
+    bot.add_command(Ping)
+
+    payload = client.build_command_payload("ping")
+    await send(payload)
+    await bot.commands.scheduler.drain()
+
+    spans = get_spans(exporter)
+    root = spans.pop("interaction")
+    assert set(spans) == {"delivery", "create_context", "route", "bind", "callback", "create_response"}
+    assert all(span.parent is not None and span.parent.span_id == root.context.span_id for span in spans.values())
+    assert root.attributes is not None
+    assert root.attributes["interaction.id"] == payload["id"]
+    assert root.attributes["command.path"] == "ping"
+
+
+async def test_callback_exception_is_recorded(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, exporter: InMemorySpanExporter, rest_calls: RESTCallsT
+) -> None:
+    @kumo.slash_command("fail")
+    class Fail:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            raise RuntimeError("boom")
+
+    bot.add_command(Fail)
+
+    await send(client.build_command_payload("fail"))
+    await bot.commands.scheduler.drain()
+
+    spans = get_spans(exporter)
+    for name in ("callback", "interaction"):
+        assert [event.name for event in spans[name].events] == ["exception"]
+
+
+async def test_component_phases_are_traced(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, exporter: InMemorySpanExporter
+) -> None:
+    @kumo.component("page:{index:int}")
+    class Page:
+        async def callback(self, context: ComponentInteractionContext, index: int) -> None:
+            await context.update_message(f"page {index}")
+
+    bot.add_component(Page)
+
+    await send(client.build_component_payload("page:2"))
+    await bot.commands.scheduler.drain()
+
+    spans = get_spans(exporter)
+    root = spans.pop("interaction")
+    assert set(spans) == {"delivery", "create_context", "route", "callback", "update_message"}
+    assert root.attributes is not None
+    assert root.attributes["component.custom_id"] == "page:2"
+    assert root.attributes["component.pattern"] == "page:{index:int}"
+
+
+async def test_unhandled_component_ends_its_trace(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, exporter: InMemorySpanExporter, rest_calls: RESTCallsT
+) -> None:
+    await send(client.build_component_payload("unknown"))
+
+    root = get_spans(exporter)["interaction"]
+    assert root.attributes is not None
+    assert root.attributes["interaction.unhandled"] is True
+
+
+async def test_queued_interaction_cancelled_by_drain_ends_its_trace(
+    bot: RESTBot, client: InteractionTestClient, send: SendT, exporter: InMemorySpanExporter, rest_calls: RESTCallsT
+) -> None:
+    @kumo.slash_command("hang")
+    class Hang:
+        async def callback(self, context: CommandInteractionContext) -> None:
+            await asyncio.Event().wait()
+
+    bot.add_command(Hang)
+    bot.commands.scheduler = InteractionScheduler(max_concurrency=1)
+    await send(client.build_command_payload("hang"))
+    await send(client.build_command_payload("hang"))
+
+    await bot.commands.scheduler.drain(timeout=0.01)
+
+    roots = [span for span in exporter.get_finished_spans() if span.name == "interaction"]
+    assert len(roots) == 2
+    assert sorted(bool((span.attributes or {}).get("interaction.cancelled")) for span in roots) == [False, True]
+